@@ -0,0 +1,7 @@
+"""Entry point that prefers a running `feishu-cli serve` daemon."""
+
+import sys
+
+from feishu_cli.daemon import forward_or_run
+
+sys.exit(forward_or_run(sys.argv[1:]))
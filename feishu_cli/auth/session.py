@@ -6,8 +6,9 @@ from dataclasses import asdict, dataclass
 import json
 import os
 from pathlib import Path
+import threading
 import time
-from typing import Optional
+from typing import Optional, Tuple
 
 import lark_oapi as lark
 from lark_oapi.api.authen.v1 import (
@@ -19,10 +20,17 @@ from lark_oapi.api.authen.v1 import (
 )
 from lark_oapi.core.model import RequestOption
 
+from feishu_cli.utils.files import atomic_write_text, file_lock
+
 
 ACCESS_TOKEN_REFRESH_BUFFER_SECONDS = 120
 REFRESH_TOKEN_REFRESH_BUFFER_SECONDS = 60
 
+# (path, file signature, session) of the last session read in this process.
+_SessionMemo = Tuple[Path, Tuple[int, int, int], Optional["UserTokenSession"]]
+_session_memo: Optional[_SessionMemo] = None
+_session_memo_lock = threading.Lock()
+
 
 @dataclass
 class UserTokenSession:
@@ -50,15 +58,8 @@ def get_token_file_path() -> Path:
 def save_user_token_session(session: UserTokenSession) -> Path:
     """Persist user token session to local file with restrictive permissions."""
     path = get_token_file_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(asdict(session), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    try:
-        os.chmod(path, 0o600)
-    except OSError:
-        pass
+    atomic_write_text(path, json.dumps(asdict(session), ensure_ascii=False, indent=2))
+    _remember_session(path, session)
     return path
 
 
@@ -88,6 +89,7 @@ def load_user_token_session() -> Optional[UserTokenSession]:
 def clear_user_token_session() -> None:
     """Delete local user token session file."""
     path = get_token_file_path()
+    _forget_session()
     if path.exists():
         try:
             path.unlink()
@@ -107,19 +109,78 @@ def resolve_user_request_option(client: lark.Client) -> Optional[RequestOption]:
     if env_token:
         return RequestOption.builder().user_access_token(env_token).build()
 
-    session = load_user_token_session()
+    session = _load_user_token_session_memoized()
     if session is None:
         return None
 
     if _is_token_expiring(session.expires_at, ACCESS_TOKEN_REFRESH_BUFFER_SECONDS):
+        session = _refresh_user_token_session_once(client)
+        if session is None:
+            return None
+
+    return RequestOption.builder().user_access_token(session.access_token).build()
+
+
+def _refresh_user_token_session_once(client: lark.Client) -> Optional[UserTokenSession]:
+    """Refresh the persisted session under a file lock (single flight).
+
+    Concurrent processes queue on the lock; whoever gets it after a refresh
+    re-reads the file and reuses the new token instead of refreshing again,
+    so rotating refresh tokens are never spent twice.
+    """
+    path = get_token_file_path()
+    with file_lock(path):
+        session = load_user_token_session()
+        if session is None:
+            _forget_session()
+            return None
+        if not _is_token_expiring(session.expires_at, ACCESS_TOKEN_REFRESH_BUFFER_SECONDS):
+            _remember_session(path, session)
+            return session
         refreshed = refresh_user_token_session(client, session)
         if refreshed is None:
             clear_user_token_session()
             return None
-        session = refreshed
-        save_user_token_session(session)
+        save_user_token_session(refreshed)
+        return refreshed
 
-    return RequestOption.builder().user_access_token(session.access_token).build()
+
+def _load_user_token_session_memoized() -> Optional[UserTokenSession]:
+    """Load the session, re-parsing the file only when it changed on disk."""
+    path = get_token_file_path()
+    signature = _file_signature(path)
+    memo = _session_memo
+    if memo is not None and signature is not None and memo[0] == path and memo[1] == signature:
+        return memo[2]
+    session = load_user_token_session()
+    if signature is not None:
+        with _session_memo_lock:
+            _set_session_memo((path, signature, session))
+    return session
+
+
+def _remember_session(path: Path, session: Optional[UserTokenSession]) -> None:
+    signature = _file_signature(path)
+    with _session_memo_lock:
+        _set_session_memo((path, signature, session) if signature is not None else None)
+
+
+def _forget_session() -> None:
+    with _session_memo_lock:
+        _set_session_memo(None)
+
+
+def _set_session_memo(memo: Optional[_SessionMemo]) -> None:
+    global _session_memo
+    _session_memo = memo
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
 
 
 def exchange_oidc_code_for_session(client: lark.Client, code: str) -> Optional[UserTokenSession]:
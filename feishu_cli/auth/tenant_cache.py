@@ -0,0 +1,81 @@
+"""On-disk tenant/app access token cache shared across CLI processes."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from lark_oapi.core.cache import ICache
+
+from feishu_cli.utils.files import atomic_write_text, file_lock
+
+
+def _default_tenant_token_file() -> Path:
+    return Path.home() / ".config" / "feishu-cli" / "tenant_token.json"
+
+
+def get_tenant_token_file_path() -> Path:
+    """Return the configured tenant token cache path."""
+    raw = os.environ.get("FEISHU_TENANT_TOKEN_FILE")
+    return Path(raw).expanduser() if raw else _default_tenant_token_file()
+
+
+class FileTokenCache(ICache):
+    """SDK token cache persisted to a locked JSON file.
+
+    lark_oapi's TokenManager stores tokens under keys such as
+    `self_tenant_token:<app_id>` with an absolute expiry that already
+    includes its refresh margin, so entries here are honoured until then.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path or get_tenant_token_file_path()
+        self._memory: Dict[str, Tuple[str, int]] = {}
+        self._memory_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._memory_lock:
+            cached = self._memory.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        with file_lock(self._path, shared=True):
+            entry = self._read_entries().get(key)
+        if not isinstance(entry, dict):
+            return None
+        value = entry.get("value")
+        expire = entry.get("expire")
+        if not isinstance(value, str) or not isinstance(expire, (int, float)) or expire <= now:
+            return None
+        with self._memory_lock:
+            self._memory[key] = (value, int(expire))
+        return value
+
+    def set(self, key: str, value: str, expire: int) -> None:
+        with self._memory_lock:
+            self._memory[key] = (value, int(expire))
+        now = time.time()
+        with file_lock(self._path):
+            entries = {
+                k: v
+                for k, v in self._read_entries().items()
+                if isinstance(v, dict) and isinstance(v.get("expire"), (int, float)) and v["expire"] > now
+            }
+            entries[key] = {"value": value, "expire": int(expire)}
+            atomic_write_text(self._path, json.dumps(entries, ensure_ascii=False, indent=2))
+
+    def _read_entries(self) -> dict:
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return raw if isinstance(raw, dict) else {}
@@ -0,0 +1,284 @@
+"""Streaming bulk writes for bitable records (`record import` and friends).
+
+Input rows are read lazily from JSONL or CSV, grouped into batch API calls
+of at most the API's maximum size and sent concurrently (each call still
+goes through `call_api`, so the per-family rate limiter and retry policy
+apply). Results are streamed as one item per input row, tagged with its
+line number, so a 50k-row load never holds more than a few batches.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import csv
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sys
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+import typer
+
+from feishu_cli.retry import is_retryable_exception
+from feishu_cli.runtime import capture_request_option
+from feishu_cli.utils.output import ItemStreamWriter
+
+
+BATCH_CREATE_LIMIT = 1000
+BATCH_UPDATE_LIMIT = 1000
+BATCH_DELETE_LIMIT = 500
+INPUT_FORMATS = ("jsonl", "csv")
+DEFAULT_BULK_CONCURRENCY = 4
+
+FILE_OPTION = typer.Option(None, "--file", help="JSONL or CSV input file (default: stdin)")
+FORMAT_OPTION = typer.Option(
+    None, "--format", help="Input format: jsonl or csv (default: from the file extension, else jsonl)"
+)
+CONCURRENCY_OPTION = typer.Option(
+    DEFAULT_BULK_CONCURRENCY, "--concurrency", min=1, max=32, help="Batch requests sent concurrently"
+)
+REJECT_FILE_OPTION = typer.Option(
+    None, "--reject-file", help="Write rows rejected before sending to this JSONL file (implies --validate)"
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class Row:
+    """One input row; `error` is set when it cannot be sent.
+
+    `line` is None for rows that do not come from the input (e.g. deletes
+    planned by `record sync`).
+    """
+
+    line: Optional[int]
+    value: Any = None
+    error: Optional[str] = None
+
+
+def resolve_input_format(path: Optional[Path], input_format: Optional[str]) -> str:
+    """Return the input format, inferring it from the file extension when unset."""
+    if input_format is None:
+        suffix = path.suffix.lower() if path is not None else ""
+        return "csv" if suffix == ".csv" else "jsonl"
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"--format must be one of: {', '.join(INPUT_FORMATS)}")
+    return input_format
+
+
+@contextmanager
+def open_input(path: Optional[Path]) -> Iterator[TextIO]:
+    """Open `path` for streaming reads, or use stdin when it is None."""
+    if path is None:
+        yield sys.stdin
+        return
+    with path.open(encoding="utf-8", newline="") as handle:
+        yield handle
+
+
+def read_rows(source: Iterable[str], input_format: str) -> Iterator[Row]:
+    """Yield rows from JSONL (one JSON value per line) or CSV (header = field names).
+
+    CSV cells are passed through as strings and empty cells are omitted;
+    use JSONL when fields need numbers, lists or objects.
+    """
+    if input_format == "csv":
+        reader = csv.DictReader(source)
+        for record in reader:
+            line = reader.line_num
+            if None in record:
+                yield Row(line, error="row has more cells than the header")
+                continue
+            yield Row(line, {key: value for key, value in record.items() if key and value not in (None, "")})
+        return
+    for index, text in enumerate(source, start=1):
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            yield Row(index, json.loads(text))
+        except json.JSONDecodeError as exc:
+            yield Row(index, error=f"Invalid JSON: {exc}")
+
+
+class RejectFile:
+    """Collect rows rejected before sending as JSONL: `{"line", "error", "row"}`.
+
+    `row` holds the input as read, so `jq -c .row` yields a file that can be
+    fixed and fed back to the same command. A None path only passes rows through.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.count = 0
+        self._handle: Optional[TextIO] = None
+
+    def __enter__(self) -> "RejectFile":
+        if self.path is not None:
+            self._handle = self.path.open("w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def write(self, row: Row) -> None:
+        self.count += 1
+        if self._handle is not None:
+            item = {"line": row.line, "error": row.error, "row": row.value}
+            self._handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    def filter(self, rows: Iterable[Row]) -> Iterator[Row]:
+        """Pass rows through, recording the ones carrying an `error`."""
+        for row in rows:
+            if row.error is not None:
+                self.write(row)
+            yield row
+
+    def summary(self) -> Dict[str, Any]:
+        if self.path is None:
+            return {}
+        return {"rejected": self.count, "reject_file": str(self.path)}
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group `items` into lists of at most `size`."""
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_in_order(
+    tasks: Iterable[T],
+    worker: Callable[[T], R],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> Iterator[Tuple[T, R]]:
+    """Run `worker` over `tasks` on a thread pool, yielding results in input order.
+
+    At most `2 * concurrency` tasks are pulled from `tasks` ahead of the
+    consumer, so lazily produced input stays bounded in memory.
+    """
+    scope = capture_request_option()
+
+    def _run(task: T) -> R:
+        with scope():
+            return worker(task)
+
+    pending: Deque[Tuple[T, Future]] = deque()
+    window = max(1, concurrency) * 2
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for task in tasks:
+            while len(pending) >= window or (pending and pending[0][1].done()):
+                head, future = pending.popleft()
+                yield head, future.result()
+            pending.append((task, executor.submit(_run, task)))
+        while pending:
+            head, future = pending.popleft()
+            yield head, future.result()
+
+
+class BulkResults:
+    """Stream per-row results as `{"data": {"results": [...], ...}}` and tally them."""
+
+    def __init__(self) -> None:
+        self.writer = ItemStreamWriter("results")
+        self.op: Optional[str] = None
+        self.succeeded = 0
+        self.failed = 0
+        self.batches = 0
+        self._first_error: Optional[Tuple[int, str]] = None
+
+    def ok(self, row: Row, **fields: Any) -> None:
+        self.succeeded += 1
+        self.writer.write_item(self._item(row, {"success": True, **fields}))
+
+    def fail(self, row: Row, code: int, msg: str, log_id: str = "") -> None:
+        self.failed += 1
+        if self._first_error is None:
+            self._first_error = (code, msg)
+        item: Dict[str, Any] = {"success": False, "code": code, "msg": msg}
+        if log_id:
+            item["log_id"] = log_id
+        self.writer.write_item(self._item(row, item))
+
+    def _item(self, row: Row, result: Dict[str, Any]) -> Dict[str, Any]:
+        item: Dict[str, Any] = {}
+        if self.op is not None:
+            item["op"] = self.op
+        if row.line is not None:
+            item["line"] = row.line
+        item.update(result)
+        return item
+
+    def fail_batch(self, rows: List[Row], response: Any) -> None:
+        for row in rows:
+            self.fail(row, response.code, response.msg, response.get_log_id())
+
+    def finish(self, **extra: Any) -> None:
+        """Write the trailer and exit: 0 when every row succeeded, else 1."""
+        self.writer.flush()
+        trailer: Dict[str, Any] = {
+            "rows": self.succeeded + self.failed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+        trailer.update(extra)
+        if self._first_error is None:
+            self.writer.finish(trailer)
+            raise typer.Exit(code=0)
+        code, msg = self._first_error
+        self.writer.finish_error(trailer, code=code, msg=f"{self.failed} row(s) failed; first error: {msg}")
+        raise typer.Exit(code=1)
+
+
+def run_batches(
+    rows: Iterable[Row],
+    batch_size: int,
+    send: Callable[[List[Row]], Any],
+    on_success: Callable[[List[Row], Any, BulkResults], None],
+    results: BulkResults,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> None:
+    """Send valid rows in batches of `batch_size`, recording one result per row.
+
+    Rows carrying an `error` are reported as failed (code 2) without being
+    sent. A failed batch call fails every row in it; `on_success` maps a
+    successful response back onto its rows.
+    """
+
+    def valid_rows() -> Iterator[Row]:
+        for row in rows:
+            if row.error is not None:
+                results.fail(row, 2, row.error)
+                continue
+            yield row
+
+    def send_batch(chunk: List[Row]) -> Any:
+        try:
+            return send(chunk)
+        except Exception as exc:
+            if not is_retryable_exception(exc):
+                raise
+            return exc
+
+    for chunk, response in run_in_order(chunked(valid_rows(), batch_size), send_batch, concurrency):
+        results.batches += 1
+        if isinstance(response, Exception):
+            for row in chunk:
+                results.fail(row, 1, f"{type(response).__name__}: {response}")
+        elif response.success():
+            on_success(chunk, response, results)
+        else:
+            results.fail_batch(chunk, response)
+        results.writer.flush()
@@ -1,16 +1,49 @@
 """Feishu API client initialization."""
 
+import threading
+from typing import Dict
+
 import lark_oapi as lark
-from feishu_cli.config import load_config
+from feishu_cli.auth.tenant_cache import FileTokenCache
+from feishu_cli.config import FeishuConfig, load_config
+from feishu_cli.ratelimit import configure_rate_limiter
+from feishu_cli.retry import configure_retry_policy
+from feishu_cli.transport import install_transport
+
+
+_CLIENTS: Dict[FeishuConfig, lark.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
 
 
 def create_client() -> lark.Client:
-    """Create and return a configured Feishu API client."""
+    """Create and return a configured Feishu API client.
+
+    Clients are memoized per configuration, so long-lived processes such as
+    `serve` reuse one warm client across commands.
+    """
     config = load_config()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(config)
+        if client is None:
+            client = _build_client(config)
+            _CLIENTS[config] = client
+    return client
+
+
+def _build_client(config: FeishuConfig) -> lark.Client:
+    install_transport(
+        pool_size=config.http_pool_size,
+        connect_timeout=config.http_connect_timeout,
+        read_timeout=config.http_timeout,
+    )
+    configure_rate_limiter(config.rate_limits)
+    configure_retry_policy(config.retry_max_attempts, config.retry_base_delay)
     return (
         lark.Client.builder()
         .app_id(config.app_id)
         .app_secret(config.app_secret)
         .enable_set_token(True)
+        .cache(FileTokenCache())
+        .timeout(config.http_timeout)
         .build()
     )
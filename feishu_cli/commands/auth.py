@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from http.server import BaseHTTPRequestHandler, HTTPServer
-import json
 from pathlib import Path
 import secrets
 import threading
@@ -26,7 +25,7 @@ from feishu_cli.auth.session import (
 )
 from feishu_cli.client import create_client
 from feishu_cli.config import load_config
-from feishu_cli.utils.output import format_error, format_response
+from feishu_cli.utils.output import format_error, format_response, format_success
 
 
 DEFAULT_REDIRECT_URI = "http://127.0.0.1:3080/callback"
@@ -317,13 +316,7 @@ def _first(data: dict[str, list[str]], key: str) -> Optional[str]:
 
 
 def _echo_success(data: dict) -> None:
-    typer.echo(
-        json.dumps(
-            {"success": True, "data": data},
-            ensure_ascii=False,
-            indent=2,
-        )
-    )
+    typer.echo(format_success(data))
 
 
 def _exit_with_error(message: str, code: int) -> None:
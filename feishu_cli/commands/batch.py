@@ -0,0 +1,175 @@
+"""Batch command that runs many CLI invocations in one process."""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import io
+import json
+from pathlib import Path
+import sys
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+import typer
+
+from feishu_cli.auth.session import resolve_user_request_option
+from feishu_cli.client import create_client
+from feishu_cli.config import ConfigError
+from feishu_cli.dispatch import run_command
+from feishu_cli.runtime import pinned_request_option
+from feishu_cli.utils.output import format_error
+
+
+class BatchLineError(ValueError):
+    """Raised when a batch line cannot be turned into argv."""
+
+
+def batch(
+    file: Optional[Path] = typer.Option(
+        None, "--file", help="JSONL file with one command per line (default: stdin)"
+    ),
+    parallel: int = typer.Option(1, min=1, help="Number of commands to run concurrently"),
+    fail_fast: bool = typer.Option(
+        False, "--fail-fast", help="Stop scheduling new commands after the first failure"
+    ),
+) -> None:
+    """Run commands from a JSONL stream and emit one result line per command.
+
+    Each line is either an argv array, e.g. ["docx", "get", "--token", "X"],
+    or an object {"domain": ..., "command": ..., "options": {...}}.
+    """
+    try:
+        client = create_client()
+    except ConfigError as exc:
+        typer.echo(format_error(code=2, msg=str(exc)))
+        raise typer.Exit(code=2)
+
+    if file is not None and not file.exists():
+        typer.echo(format_error(code=2, msg=f"Batch file not found: {file}"))
+        raise typer.Exit(code=2)
+
+    option = resolve_user_request_option(client)
+    source = file.open(encoding="utf-8") if file is not None else sys.stdin
+    try:
+        failed = _run_lines(_iter_lines(source), option, parallel, fail_fast)
+    finally:
+        if file is not None:
+            source.close()
+    raise typer.Exit(code=1 if failed else 0)
+
+
+def parse_batch_line(line: str) -> List[str]:
+    """Convert one JSONL batch line into CLI argv."""
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise BatchLineError(f"Invalid JSON: {exc}") from exc
+
+    if isinstance(entry, list):
+        if not entry:
+            raise BatchLineError("Empty argv array.")
+        return [_scalar_arg(item) for item in entry]
+    if not isinstance(entry, dict):
+        raise BatchLineError("Each line must be an argv array or a command object.")
+
+    domain = entry.get("domain")
+    command = entry.get("command")
+    if not domain or not command:
+        raise BatchLineError("Command object requires 'domain' and 'command'.")
+    argv = [str(domain)]
+    argv.extend(command.split() if isinstance(command, str) else [str(c) for c in command])
+
+    options = entry.get("options") or {}
+    if not isinstance(options, dict):
+        raise BatchLineError("'options' must be an object.")
+    for key, value in options.items():
+        name = str(key).replace("_", "-")
+        flag = "--" + name
+        if value is None:
+            continue
+        if value is True:
+            argv.append(flag)
+        elif value is False:
+            # Spell out the negative form so `--x/--no-x` flags never fall back
+            # to a true default; flags without one fail loudly instead.
+            argv.append("--no-" + name)
+        elif isinstance(value, list) and all(not isinstance(v, (dict, list)) for v in value):
+            for item in value:
+                argv.extend([flag, _scalar_arg(item)])
+        else:
+            argv.extend([flag, _scalar_arg(value)])
+    return argv
+
+
+def _scalar_arg(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _iter_lines(source: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    for index, line in enumerate(source):
+        text = line.strip()
+        if text:
+            yield index, text
+
+
+def _run_lines(
+    lines: Iterator[Tuple[int, str]],
+    option: Any,
+    parallel: int,
+    fail_fast: bool,
+) -> bool:
+    """Execute lines with bounded concurrency, emitting results in input order."""
+    failed = False
+    pending: Deque[Tuple[int, List[str], Future]] = deque()
+
+    def _emit_head() -> None:
+        nonlocal failed
+        index, argv, future = pending.popleft()
+        code, output = future.result()
+        failed = failed or code != 0
+        _echo_result(index, argv, code, output)
+
+    # Fail-fast must see each result before scheduling past it.
+    window = parallel if fail_fast else parallel * 2
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        for index, text in lines:
+            while pending and (pending[0][2].done() or len(pending) >= window):
+                _emit_head()
+            if failed and fail_fast:
+                break
+            try:
+                argv = parse_batch_line(text)
+            except BatchLineError as exc:
+                while pending:
+                    _emit_head()
+                failed = True
+                _echo_result(index, None, 2, json.loads(format_error(code=2, msg=str(exc))))
+                continue
+            pending.append((index, argv, executor.submit(_run_one, argv, option)))
+        while pending:
+            _emit_head()
+    return failed
+
+
+def _run_one(argv: List[str], option: Any) -> Tuple[int, Any]:
+    out = io.StringIO()
+    err = io.StringIO()
+    with pinned_request_option(option):
+        code = run_command(argv, stdin=io.StringIO(""), stdout=out, stderr=err)
+    text = out.getvalue().strip()
+    try:
+        output: Any = json.loads(text) if text else None
+    except json.JSONDecodeError:
+        output = text
+    if output is None and err.getvalue().strip():
+        output = err.getvalue().strip()
+    return code, output
+
+
+def _echo_result(index: int, argv: Optional[List[str]], code: int, output: Any) -> None:
+    typer.echo(
+        json.dumps(
+            {"line": index + 1, "argv": argv, "exit_code": code, "output": output},
+            ensure_ascii=False,
+        )
+    )
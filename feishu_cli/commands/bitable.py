@@ -1,11 +1,22 @@
 """Bitable (multidimensional table) commands for Feishu CLI."""
 
+from datetime import datetime, timezone
+from functools import partial
 import json
 from pathlib import Path
-from typing import Optional
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import uuid
 
 import typer
 from lark_oapi.api.bitable.v1 import (
+    BatchCreateAppTableRecordRequest,
+    BatchCreateAppTableRecordRequestBody,
+    BatchDeleteAppTableRecordRequest,
+    BatchDeleteAppTableRecordRequestBody,
+    BatchUpdateAppTableRecordRequest,
+    BatchUpdateAppTableRecordRequestBody,
     CopyAppRequest,
     CopyAppRequestBody,
     CreateAppRequest,
@@ -18,6 +29,7 @@ from lark_oapi.api.bitable.v1 import (
     DeleteAppTableRecordRequest,
     DeleteAppTableRequest,
     DeleteAppTableViewRequest,
+    FilterInfo,
     GetAppRequest,
     GetAppTableRecordRequest,
     GetAppTableViewRequest,
@@ -27,6 +39,9 @@ from lark_oapi.api.bitable.v1 import (
     ListAppTableViewRequest,
     PatchAppTableRequest,
     PatchAppTableRequestBody,
+    SearchAppTableRecordRequest,
+    SearchAppTableRecordRequestBody,
+    Sort,
     UpdateAppRequest,
     UpdateAppRequestBody,
     UpdateAppTableFieldRequest,
@@ -39,9 +54,54 @@ from lark_oapi.api.bitable.v1 import (
     ReqTable,
 )
 
+from feishu_cli.bulk import (
+    BATCH_CREATE_LIMIT,
+    BATCH_DELETE_LIMIT,
+    BATCH_UPDATE_LIMIT,
+    CONCURRENCY_OPTION,
+    FILE_OPTION,
+    FORMAT_OPTION,
+    REJECT_FILE_OPTION,
+    BulkResults,
+    RejectFile,
+    Row,
+    open_input,
+    read_rows,
+    resolve_input_format,
+    run_batches,
+    run_in_order,
+)
+from feishu_cli.changes import (
+    MODIFIED_TIME_FIELD_TYPE,
+    ChangeState,
+    ChangeWalk,
+    ChangeStateError,
+    deleted_ids,
+    modified_since_filter,
+    next_watermark,
+    parse_watermark,
+)
 from feishu_cli.client import create_client
-from feishu_cli.runtime import call_api
-from feishu_cli.utils.output import format_error, format_response
+from feishu_cli.mirror import Mirror, run_query
+from feishu_cli.pagination import (
+    ALL_PAGES_OPTION,
+    CHECKPOINT_OPTION,
+    LIMIT_OPTION,
+    MAX_PAGES_OPTION,
+    PREFETCH_OPTION,
+    PageError,
+    PageOptions,
+    iter_pages,
+    run_list_command,
+    stream_merged_pages,
+)
+from feishu_cli.projection import SELECT_OPTION, Projection, parse_select
+from feishu_cli.runtime import call_api, call_api_many
+from feishu_cli.schema import VALIDATE_OPTION, FieldSchema, SchemaCache
+from feishu_cli.sharding import SHARDABLE_FIELD_TYPES, field_ref, plan_shard_filters, sortable_value
+from feishu_cli.sync import index_records, key_text, plan_sync
+from feishu_cli.utils.files import atomic_write_text
+from feishu_cli.utils.output import ItemStreamWriter, format_error, format_response, format_success
 
 bitable_app = typer.Typer(
     name="bitable", help="Bitable (multidimensional table) operations.", no_args_is_help=True
@@ -50,11 +110,13 @@ table_app = typer.Typer(name="table", help="Table operations.", no_args_is_help=
 record_app = typer.Typer(name="record", help="Record operations.", no_args_is_help=True)
 field_app = typer.Typer(name="field", help="Field operations.", no_args_is_help=True)
 view_app = typer.Typer(name="view", help="View operations.", no_args_is_help=True)
+mirror_app = typer.Typer(name="mirror", help="Local SQLite mirror of a table.", no_args_is_help=True)
 
 bitable_app.add_typer(table_app, name="table")
 bitable_app.add_typer(record_app, name="record")
 bitable_app.add_typer(field_app, name="field")
 bitable_app.add_typer(view_app, name="view")
+bitable_app.add_typer(mirror_app, name="mirror")
 
 
 def _parse_json(data: str) -> dict:
@@ -147,6 +209,124 @@ def app_copy(
     raise typer.Exit(code=0 if response.success() else 1)
 
 
+@bitable_app.command("export")
+def app_export(
+    app_token: str = typer.Option(..., help="App token"),
+    out: Path = typer.Option(..., "--out", help="Directory for <table_id>.jsonl files and manifest.json"),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, max=32, help="Tables exported concurrently"),
+    page_size: int = typer.Option(500, min=1, max=500, help="Record page size per request"),
+) -> None:
+    """Export every table of an app: records as JSONL per table, schemas and views in a manifest."""
+    client = create_client()
+    started = time.monotonic()
+    exported_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    def build_request(token: Optional[str]) -> ListAppTableRequest:
+        builder = ListAppTableRequest.builder().app_token(app_token).page_size(100)
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    try:
+        tables = _list_items(client, client.bitable.v1.app_table.list, build_request)
+    except PageError as exc:
+        typer.echo(format_response(exc.response))
+        raise typer.Exit(code=1)
+    try:
+        out.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        _json_param_error(f"Cannot create output directory {out}: {exc}")
+    export = partial(_export_table, client, app_token, out, page_size)
+    entries = [entry for _table, entry in run_in_order(tables, export, concurrency)]
+    failed = sum(1 for entry in entries if "error" in entry)
+    records = sum(entry["records"] for entry in entries)
+    seconds = round(time.monotonic() - started, 3)
+    manifest = {
+        "app_token": app_token,
+        "exported_at": exported_at,
+        "seconds": seconds,
+        "records": records,
+        "tables": entries,
+    }
+    manifest_path = out / "manifest.json"
+    atomic_write_text(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2), mode=0o644)
+    summary = {
+        "out": str(out),
+        "manifest": str(manifest_path),
+        "tables": len(entries),
+        "failed": failed,
+        "records": records,
+        "seconds": seconds,
+    }
+    typer.echo(format_success(summary))
+    raise typer.Exit(code=1 if failed else 0)
+
+
+def _export_table(client: Any, app_token: str, out: Path, page_size: int, table: Dict[str, Any]) -> Dict[str, Any]:
+    """Write one table's records to `<table_id>.jsonl`; return its manifest entry.
+
+    Records stream through a `.part` file that is renamed only once the
+    table is complete, so a failed table never leaves a truncated export.
+    """
+    started = time.monotonic()
+    table_id = table.get("table_id") or ""
+    target = out / f"{table_id}.jsonl"
+    part = target.with_name(target.name + ".part")
+    entry: Dict[str, Any] = {"table_id": table_id, "name": table.get("name"), "file": target.name}
+
+    def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+        builder = ListAppTableRecordRequest.builder().app_token(app_token).table_id(table_id).page_size(page_size)
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    records = pages = 0
+    try:
+        fields = _list_items(
+            client, client.bitable.v1.app_table_field.list, partial(_field_list_request, app_token, table_id)
+        )
+        views = _list_items(
+            client, client.bitable.v1.app_table_view.list, partial(_view_list_request, app_token, table_id)
+        )
+        with part.open("w", encoding="utf-8") as handle:
+            for page in iter_pages(client, client.bitable.v1.app_table_record.list, build_request):
+                pages += 1
+                for item in page.jsonable_items():
+                    handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    records += 1
+        part.replace(target)
+        entry.update(fields=fields, views=views)
+    except PageError as exc:
+        entry["error"] = {"code": exc.response.code, "msg": exc.response.msg, "log_id": exc.response.get_log_id()}
+    except Exception as exc:
+        # Anything else (e.g. a connection error that outlived its retries)
+        # fails only this table; the manifest still gets written.
+        entry["error"] = {"code": 1, "msg": f"{type(exc).__name__}: {exc}"}
+    if "error" in entry:
+        try:
+            part.unlink()
+        except FileNotFoundError:
+            pass
+        records = 0
+    entry.update(records=records, pages=pages, seconds=round(time.monotonic() - started, 3))
+    return entry
+
+
+def _list_items(client: Any, api_method: Any, build_request: Any) -> List[Dict[str, Any]]:
+    """Collect every item of a paged listing as JSON; raises PageError."""
+    items: List[Dict[str, Any]] = []
+    for page in iter_pages(client, api_method, build_request):
+        items.extend(page.jsonable_items())
+    return items
+
+
+def _view_list_request(app_token: str, table_id: str, token: Optional[str]) -> ListAppTableViewRequest:
+    builder = ListAppTableViewRequest.builder().app_token(app_token).table_id(table_id).page_size(50)
+    if token:
+        builder = builder.page_token(token)
+    return builder.build()
+
+
 # ── Table commands ──────────────────────────────────────────────────────────
 
 
@@ -155,15 +335,23 @@ def table_list(
     app_token: str = typer.Option(..., help="App token"),
     page_size: int = typer.Option(20, help="Page size"),
     page_token: str = typer.Option("", help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
 ) -> None:
     """List tables in a bitable app."""
     client = create_client()
-    builder = ListAppTableRequest.builder().app_token(app_token).page_size(page_size)
-    if page_token:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.bitable.v1.app_table.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListAppTableRequest:
+        builder = ListAppTableRequest.builder().app_token(app_token).page_size(page_size)
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint)
+    run_list_command(client, client.bitable.v1.app_table.list, build_request, options)
 
 
 @table_app.command("create")
@@ -224,20 +412,274 @@ def record_list(
     table_id: str = typer.Option(..., help="Table ID"),
     page_size: int = typer.Option(20, help="Page size"),
     page_token: str = typer.Option("", help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
+    select: Optional[str] = SELECT_OPTION,
 ) -> None:
     """List records in a table."""
+    projection = parse_select(select)
+    field_names = _selected_field_names(projection)
     client = create_client()
-    builder = (
-        ListAppTableRecordRequest.builder()
-        .app_token(app_token)
-        .table_id(table_id)
-        .page_size(page_size)
-    )
-    if page_token:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.bitable.v1.app_table_record.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+        builder = (
+            ListAppTableRecordRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .page_size(page_size)
+        )
+        if field_names:
+            builder = builder.field_names(field_names)
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint, projection)
+    run_list_command(client, client.bitable.v1.app_table_record.list, build_request, options)
+
+
+@record_app.command("search")
+def record_search(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    filter_json: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help='Filter JSON or @file.json, e.g. {"conjunction": "and", "conditions": '
+        '[{"field_name": "状态", "operator": "is", "value": ["完成"]}]}',
+    ),
+    sort: Optional[str] = typer.Option(
+        None, help='Sort JSON or @file.json, e.g. [{"field_name": "日期", "desc": true}] or ["日期 DESC"]'
+    ),
+    view_id: Optional[str] = typer.Option(None, help="Only search records visible in this view"),
+    field_names: Optional[str] = typer.Option(
+        None, help='Fields to return: comma-separated names or a JSON array (default: from --select, else all)'
+    ),
+    automatic_fields: bool = typer.Option(
+        False, "--automatic-fields", help="Include created/modified time and user fields"
+    ),
+    page_size: int = typer.Option(20, min=1, max=500, help="Page size"),
+    page_token: str = typer.Option("", help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
+    select: Optional[str] = SELECT_OPTION,
+) -> None:
+    """Search records server-side with filter, sort, view and field pushdown."""
+    projection = parse_select(select)
+    body = SearchAppTableRecordRequestBody.builder()
+    if filter_json is not None:
+        conditions = _parse_json(filter_json)
+        if not isinstance(conditions, dict):
+            _json_param_error("--filter must be a JSON object")
+        body = body.filter(FilterInfo({"conjunction": "and", **conditions}))
+    if sort is not None:
+        body = body.sort(_parse_sort(_parse_json(sort)))
+    if view_id:
+        body = body.view_id(view_id)
+    names = _parse_field_names(field_names) if field_names is not None else None
+    if names is None and projection is not None:
+        names = projection.top_level_names("fields") or None
+    if names:
+        body = body.field_names(names)
+    if automatic_fields:
+        body = body.automatic_fields(True)
+    request_body = body.build()
+    client = create_client()
+
+    def build_request(token: Optional[str]) -> SearchAppTableRecordRequest:
+        builder = (
+            SearchAppTableRecordRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .page_size(page_size)
+            .request_body(request_body)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint, projection)
+    # Search is a read sent as POST, so it is safe to retry.
+    run_list_command(client, client.bitable.v1.app_table_record.search, build_request, options, retry=True)
+
+
+def _parse_sort(value: Any) -> List[Sort]:
+    """Accept sort objects or "field [ASC|DESC]" shorthand strings."""
+    if not isinstance(value, list):
+        value = [value]
+    sorts: List[Sort] = []
+    for item in value:
+        if isinstance(item, str):
+            name, _, direction = item.strip().rpartition(" ")
+            if direction.upper() not in ("ASC", "DESC") or not name:
+                name, direction = item.strip(), "ASC"
+            item = {"field_name": name.strip(), "desc": direction.upper() == "DESC"}
+        if not isinstance(item, dict) or not item.get("field_name"):
+            _json_param_error("Each sort entry needs a field_name")
+        sorts.append(Sort(item))
+    return sorts
+
+
+def _parse_field_names(value: str) -> List[str]:
+    text = value.strip()
+    if text.startswith("["):
+        names = _parse_json(text)
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            _json_param_error("--field-names must be a JSON array of strings")
+        return names
+    return [name.strip() for name in text.split(",") if name.strip()]
+
+
+@record_app.command("changes")
+def record_changes(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    state: Path = typer.Option(..., "--state", help="State file holding the watermark and known record ids"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Override the stored watermark (epoch milliseconds or ISO date/time)"
+    ),
+    modified_field: Optional[str] = typer.Option(
+        None, help="Modified-time field to filter on (default: the table's first modified-time field)"
+    ),
+    deletes_every: float = typer.Option(
+        3600, min=0, help="Seconds between id-set diffs that detect deleted records (0: every run)"
+    ),
+    page_size: int = typer.Option(500, min=1, max=500, help="Page size per request"),
+    select: Optional[str] = SELECT_OPTION,
+) -> None:
+    """Emit records modified since the stored watermark, plus deletions, and advance it."""
+    projection = parse_select(select)
+    try:
+        since_ms = parse_watermark(since) if since is not None else None
+        change_state = ChangeState.load(state, f"{app_token}/{table_id}")
+    except (ValueError, ChangeStateError) as exc:
+        _json_param_error(str(exc))
+    if since_ms is not None:
+        change_state.watermark = since_ms
+    client = create_client()
+    if change_state.watermark > 0 and modified_field is None:
+        modified_field = _modified_time_field(_table_fields(client, app_token, table_id))
+        if modified_field is None:
+            _json_param_error("Table has no modified-time field; add one or pass --modified-field")
+    names = projection.top_level_names("fields") if projection is not None else None
+    walk = ChangeWalk(change_state.watermark, change_state.ids_due(deletes_every))
+    writer = ItemStreamWriter("items")
+    try:
+        for item in _walk_changes(client, app_token, table_id, change_state, walk, modified_field, page_size, names):
+            if projection is not None and not item.get("deleted"):
+                item = projection.apply(item)
+            writer.write_item(item)
+            writer.flush()
+    except PageError as exc:
+        writer.finish_error(
+            trailer={"pages": walk.pages, "changed": walk.changed, "watermark": walk.previous},
+            code=exc.response.code,
+            msg=exc.response.msg,
+            log_id=exc.response.get_log_id(),
+            attempts=getattr(exc.response, "attempts", None),
+        )
+        raise typer.Exit(code=1)
+    change_state.save()
+    writer.finish({**walk.summary(), "watermark": change_state.watermark, "state": change_state.summary()})
+    raise typer.Exit(code=0)
+
+
+def _walk_changes(
+    client: Any,
+    app_token: str,
+    table_id: str,
+    change_state: ChangeState,
+    walk: ChangeWalk,
+    modified_field: Optional[str],
+    page_size: int,
+    field_names: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield records modified after `walk.previous`, then `{"record_id", "deleted": True}` markers.
+
+    A zero watermark (or no `modified_field`) walks the whole table. Once the
+    walk completes, `change_state` holds the advanced watermark and the known
+    ids; the caller decides whether to persist it. Raises PageError.
+    """
+    full_walk = walk.previous <= 0 or not modified_field
+    body = SearchAppTableRecordRequestBody.builder().automatic_fields(True)
+    if field_names:
+        body = body.field_names(field_names)
+    if not full_walk:
+        body = body.filter(FilterInfo(modified_since_filter(modified_field, walk.previous)))
+    request_body = body.build()
+
+    def build_request(token: Optional[str]) -> SearchAppTableRecordRequest:
+        builder = (
+            SearchAppTableRecordRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .page_size(page_size)
+            .request_body(request_body)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    started_ms = int(time.time() * 1000)
+    walk.deletes_checked = walk.deletes_checked or full_walk
+    seen = set()
+    modified_times: List[int] = []
+    for page in iter_pages(client, client.bitable.v1.app_table_record.search, build_request, retry=True):
+        walk.pages += 1
+        for item in page.jsonable_items():
+            seen.add(item.get("record_id"))
+            modified = int(item.get("last_modified_time") or 0)
+            if walk.previous > 0 and modified <= walk.previous:
+                continue
+            modified_times.append(modified)
+            walk.changed += 1
+            yield item
+    if walk.deletes_checked:
+        current = seen if full_walk else _record_ids(client, app_token, table_id, modified_field, page_size)
+        current.discard(None)
+        for record_id in deleted_ids(change_state.ids, current):
+            walk.deleted += 1
+            yield {"record_id": record_id, "deleted": True}
+        change_state.ids = set(current)
+        change_state.ids_checked_at = started_ms / 1000
+    else:
+        change_state.ids.update(seen)
+        change_state.ids.discard(None)
+    change_state.watermark = next_watermark(walk.previous, modified_times, started_ms)
+
+
+def _modified_time_field(fields: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the first modified-time field name, if the table has one."""
+    for item in fields:
+        if item.get("type") == MODIFIED_TIME_FIELD_TYPE:
+            return item.get("field_name")
+    return None
+
+
+def _record_ids(
+    client: Any, app_token: str, table_id: str, field_name: Optional[str], page_size: int
+) -> set:
+    """List every record id, fetching as little field data as possible."""
+
+    def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+        builder = ListAppTableRecordRequest.builder().app_token(app_token).table_id(table_id).page_size(page_size)
+        if field_name:
+            builder = builder.field_names(json.dumps([field_name], ensure_ascii=False))
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    ids = set()
+    for page in iter_pages(client, client.bitable.v1.app_table_record.list, build_request):
+        ids.update(item.get("record_id") for item in page.jsonable_items())
+    ids.discard(None)
+    return ids
 
 
 @record_app.command("get")
@@ -265,10 +707,13 @@ def record_create(
     app_token: str = typer.Option(..., help="App token"),
     table_id: str = typer.Option(..., help="Table ID"),
     fields: str = typer.Option(..., help="Fields JSON or @file.json"),
+    validate: bool = VALIDATE_OPTION,
 ) -> None:
     """Create a record."""
     client = create_client()
     data = _parse_json(fields)
+    if validate:
+        data = _validated_fields(client, app_token, table_id, data)
     record = AppTableRecord.builder().fields(data).build()
     request = (
         CreateAppTableRecordRequest.builder()
@@ -288,10 +733,13 @@ def record_update(
     table_id: str = typer.Option(..., help="Table ID"),
     record_id: str = typer.Option(..., help="Record ID"),
     fields: str = typer.Option(..., help="Fields JSON or @file.json"),
+    validate: bool = VALIDATE_OPTION,
 ) -> None:
     """Update a record."""
     client = create_client()
     data = _parse_json(fields)
+    if validate:
+        data = _validated_fields(client, app_token, table_id, data)
     record = AppTableRecord.builder().fields(data).build()
     request = (
         UpdateAppTableRecordRequest.builder()
@@ -326,6 +774,575 @@ def record_delete(
     raise typer.Exit(code=0 if response.success() else 1)
 
 
+@record_app.command("import")
+def record_import(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    file: Optional[Path] = FILE_OPTION,
+    input_format: Optional[str] = FORMAT_OPTION,
+    batch_size: int = typer.Option(
+        BATCH_CREATE_LIMIT, min=1, max=BATCH_CREATE_LIMIT, help="Records per batch_create call"
+    ),
+    concurrency: int = CONCURRENCY_OPTION,
+    validate: bool = VALIDATE_OPTION,
+    reject_file: Optional[Path] = REJECT_FILE_OPTION,
+) -> None:
+    """Create records from a JSONL/CSV stream via batch_create (one result per row)."""
+    input_format = _bulk_input_format(file, input_format)
+    client = create_client()
+    schema = _bulk_schema(client, app_token, table_id, validate, reject_file)
+    send = partial(_batch_create, client, app_token, table_id)
+    results = BulkResults()
+    with open_input(file) as source, RejectFile(reject_file) as rejects:
+        rows = rejects.filter(_validated_row(_import_row(row), schema) for row in read_rows(source, input_format))
+        run_batches(rows, batch_size, send, _on_created, results, concurrency)
+    results.finish(**rejects.summary())
+
+
+@record_app.command("bulk-update")
+def record_bulk_update(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    file: Optional[Path] = FILE_OPTION,
+    input_format: Optional[str] = FORMAT_OPTION,
+    batch_size: int = typer.Option(
+        BATCH_UPDATE_LIMIT, min=1, max=BATCH_UPDATE_LIMIT, help="Records per batch_update call"
+    ),
+    concurrency: int = CONCURRENCY_OPTION,
+    validate: bool = VALIDATE_OPTION,
+    reject_file: Optional[Path] = REJECT_FILE_OPTION,
+) -> None:
+    """Update records from a stream of {record_id, fields} rows via batch_update."""
+    input_format = _bulk_input_format(file, input_format)
+    client = create_client()
+    schema = _bulk_schema(client, app_token, table_id, validate, reject_file)
+    send = partial(_batch_update, client, app_token, table_id)
+    results = BulkResults()
+    with open_input(file) as source, RejectFile(reject_file) as rejects:
+        rows = rejects.filter(
+            _validated_row(_update_row(row), schema, nested=True) for row in read_rows(source, input_format)
+        )
+        run_batches(rows, batch_size, send, _on_updated, results, concurrency)
+    results.finish(**rejects.summary())
+
+
+@record_app.command("bulk-delete")
+def record_bulk_delete(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    file: Optional[Path] = FILE_OPTION,
+    input_format: Optional[str] = FORMAT_OPTION,
+    filter_formula: Optional[str] = typer.Option(
+        None, "--filter", help="Delete the records matching this filter formula instead of reading ids"
+    ),
+    batch_size: int = typer.Option(
+        BATCH_DELETE_LIMIT, min=1, max=BATCH_DELETE_LIMIT, help="Records per batch_delete call"
+    ),
+    concurrency: int = CONCURRENCY_OPTION,
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Only report how many records would be deleted and the API calls needed"
+    ),
+) -> None:
+    """Delete records by id (JSONL/CSV stream) or by filter via batch_delete."""
+    if filter_formula is not None and file is not None:
+        _json_param_error("--filter and --file are mutually exclusive")
+    input_format = _bulk_input_format(file, input_format)
+    client = create_client()
+    if filter_formula is not None:
+        record_ids, list_pages = _filtered_record_ids(client, app_token, table_id, filter_formula)
+        rows = (Row(index, record_id) for index, record_id in enumerate(record_ids, start=1))
+        _run_bulk_delete(client, app_token, table_id, rows, batch_size, concurrency, dry_run, list_pages)
+    with open_input(file) as source:
+        rows = _delete_rows(read_rows(source, input_format))
+        _run_bulk_delete(client, app_token, table_id, rows, batch_size, concurrency, dry_run, 0)
+
+
+@record_app.command("sync")
+def record_sync(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    key: str = typer.Option(..., "--key", help="Field whose value identifies a row in the dataset and the table"),
+    file: Optional[Path] = FILE_OPTION,
+    input_format: Optional[str] = FORMAT_OPTION,
+    delete: bool = typer.Option(
+        True, "--delete/--no-delete", help="Delete table records whose key is not in the dataset"
+    ),
+    concurrency: int = CONCURRENCY_OPTION,
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only report the planned creates, updates and deletes"),
+    validate: bool = VALIDATE_OPTION,
+    reject_file: Optional[Path] = REJECT_FILE_OPTION,
+) -> None:
+    """Upsert a keyed JSONL/CSV dataset into a table with the fewest writes."""
+    input_format = _bulk_input_format(file, input_format)
+    client = None
+    schema = None
+    if validate or reject_file is not None:
+        client = create_client()
+        schema = _table_schema(client, app_token, table_id)
+    incoming: Dict[str, Row] = {}
+    rejected: List[Row] = []
+    # Rejected rows are not in `incoming`, but their records must not be
+    # treated as stale; a rejected row without a usable key disables deletes.
+    rejected_keys = set()
+    unkeyed_rejects = 0
+    with open_input(file) as source, RejectFile(reject_file) as rejects:
+        for row in rejects.filter(_validated_row(_import_row(row), schema) for row in read_rows(source, input_format)):
+            if row.error is None:
+                key_value = key_text(row.value.get(key))
+                if key_value is None:
+                    row = Row(row.line, row.value, error=f"Row has no value for key field {key}")
+                elif key_value in incoming:
+                    row = Row(row.line, row.value, error=f"Duplicate key: {key_value}")
+                else:
+                    incoming[key_value] = row
+                    continue
+                rejects.write(row)
+            rejected.append(row)
+            rejected_key = key_text(row.value.get(key)) if isinstance(row.value, dict) else None
+            if rejected_key is None:
+                unkeyed_rejects += 1
+            else:
+                rejected_keys.add(rejected_key)
+    if not incoming and delete:
+        _json_param_error("Dataset has no valid rows; refusing to delete every record (use --no-delete)")
+
+    managed = {key}
+    for row in incoming.values():
+        managed.update(row.value)
+    if client is None:
+        client = create_client()
+    stats = {"pages": 0}
+    records = _table_records(client, app_token, table_id, sorted(managed), stats)
+    index, extras = index_records(records, key, managed)
+    deletes_skipped = delete and unkeyed_rejects > 0
+    plan = plan_sync(incoming, index, extras, key, managed, delete and not deletes_skipped, rejected_keys)
+    summary = {
+        "creates": len(plan.creates),
+        "updates": len(plan.updates),
+        "deletes": len(plan.deletes),
+        "unchanged": plan.unchanged,
+        "list_pages": stats["pages"],
+        **rejects.summary(),
+    }
+    if deletes_skipped:
+        summary["deletes_skipped"] = f"{unkeyed_rejects} rejected row(s) have no usable key"
+    if dry_run:
+        api_calls = stats["pages"] + sum(
+            -(-count // limit)
+            for count, limit in (
+                (len(plan.creates), BATCH_CREATE_LIMIT),
+                (len(plan.updates), BATCH_UPDATE_LIMIT),
+                (len(plan.deletes), BATCH_DELETE_LIMIT),
+            )
+        )
+        typer.echo(format_success({"dry_run": True, **summary, "invalid_rows": len(rejected), "api_calls": api_calls}))
+        raise typer.Exit(code=0)
+
+    results = BulkResults()
+    for row in rejected:
+        results.fail(row, 2, row.error or "")
+    for op, rows, limit, send, on_success in (
+        ("create", plan.creates, BATCH_CREATE_LIMIT, _batch_create, _on_created),
+        ("update", plan.updates, BATCH_UPDATE_LIMIT, _batch_update, _on_updated),
+        ("delete", plan.deletes, BATCH_DELETE_LIMIT, _batch_delete, _on_deleted),
+    ):
+        results.op = op
+        run_batches(rows, limit, partial(send, client, app_token, table_id), on_success, results, concurrency)
+    results.op = None
+    results.finish(**summary)
+
+
+def _table_records(
+    client: Any, app_token: str, table_id: str, field_names: List[str], stats: Dict[str, int]
+) -> Iterator[Dict[str, Any]]:
+    """Stream every record (only `field_names`) as JSON, counting pages in `stats`."""
+
+    def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+        builder = (
+            ListAppTableRecordRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .field_names(json.dumps(field_names, ensure_ascii=False))
+            .page_size(500)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    try:
+        for page in iter_pages(client, client.bitable.v1.app_table_record.list, build_request):
+            stats["pages"] += 1
+            yield from page.jsonable_items()
+    except PageError as exc:
+        typer.echo(format_response(exc.response))
+        raise typer.Exit(code=1)
+
+
+def _run_bulk_delete(
+    client: Any,
+    app_token: str,
+    table_id: str,
+    rows: Iterable[Row],
+    batch_size: int,
+    concurrency: int,
+    dry_run: bool,
+    list_pages: int,
+) -> None:
+    if dry_run:
+        valid = invalid = 0
+        for row in rows:
+            if row.error is None:
+                valid += 1
+            else:
+                invalid += 1
+        batches = -(-valid // batch_size)
+        typer.echo(format_success({
+            "dry_run": True,
+            "records": valid,
+            "invalid_rows": invalid,
+            "batches": batches,
+            "api_calls": list_pages + batches,
+        }))
+        raise typer.Exit(code=0)
+
+    send = partial(_batch_delete, client, app_token, table_id)
+    results = BulkResults()
+    run_batches(rows, batch_size, send, _on_deleted, results, concurrency)
+    results.finish(list_pages=list_pages)
+
+
+def _batch_create(client: Any, app_token: str, table_id: str, rows: List[Row]) -> Any:
+    records = [AppTableRecord.builder().fields(row.value).build() for row in rows]
+    request = (
+        BatchCreateAppTableRecordRequest.builder()
+        .app_token(app_token)
+        .table_id(table_id)
+        .client_token(str(uuid.uuid4()))
+        .request_body(BatchCreateAppTableRecordRequestBody.builder().records(records).build())
+        .build()
+    )
+    return call_api(client, client.bitable.v1.app_table_record.batch_create, request)
+
+
+def _on_created(rows: List[Row], response: Any, results: BulkResults) -> None:
+    created = list(getattr(response.data, "records", None) or [])
+    for index, row in enumerate(rows):
+        record = created[index] if index < len(created) else None
+        results.ok(row, record_id=getattr(record, "record_id", None))
+
+
+def _batch_update(client: Any, app_token: str, table_id: str, rows: List[Row]) -> Any:
+    records = [
+        AppTableRecord.builder().record_id(row.value["record_id"]).fields(row.value["fields"]).build()
+        for row in rows
+    ]
+    request = (
+        BatchUpdateAppTableRecordRequest.builder()
+        .app_token(app_token)
+        .table_id(table_id)
+        .client_token(str(uuid.uuid4()))
+        .request_body(BatchUpdateAppTableRecordRequestBody.builder().records(records).build())
+        .build()
+    )
+    return call_api(client, client.bitable.v1.app_table_record.batch_update, request)
+
+
+def _on_updated(rows: List[Row], response: Any, results: BulkResults) -> None:
+    for row in rows:
+        results.ok(row, record_id=row.value["record_id"])
+
+
+def _batch_delete(client: Any, app_token: str, table_id: str, rows: List[Row]) -> Any:
+    request = (
+        BatchDeleteAppTableRecordRequest.builder()
+        .app_token(app_token)
+        .table_id(table_id)
+        .request_body(BatchDeleteAppTableRecordRequestBody.builder().records([row.value for row in rows]).build())
+        .build()
+    )
+    # Deleting the same ids twice is harmless, so the POST may be retried.
+    return call_api(client, client.bitable.v1.app_table_record.batch_delete, request, retry=True)
+
+
+def _on_deleted(rows: List[Row], response: Any, results: BulkResults) -> None:
+    outcome = {record.record_id: record.deleted for record in getattr(response.data, "records", None) or []}
+    for row in rows:
+        if outcome.get(row.value, True) is False:
+            results.fail(row, 1, "Record was not deleted")
+        else:
+            results.ok(row, record_id=row.value)
+
+
+def _delete_rows(rows: Iterable[Row]) -> Iterable[Row]:
+    """Turn input rows into record ids, skipping ndjson summary lines and duplicates."""
+    seen = set()
+    for row in rows:
+        if row.error is not None:
+            yield row
+            continue
+        value = row.value
+        if isinstance(value, dict) and "items_key" in value and "success" in value:
+            continue
+        record_id = value.get("record_id") if isinstance(value, dict) else value
+        if not isinstance(record_id, str) or not record_id:
+            yield Row(row.line, error="Row must be a record_id string or an object with record_id")
+        elif record_id in seen:
+            yield Row(row.line, error=f"Duplicate record_id: {record_id}")
+        else:
+            seen.add(record_id)
+            yield Row(row.line, record_id)
+
+
+def _filtered_record_ids(
+    client: Any, app_token: str, table_id: str, filter_formula: str
+) -> Tuple[List[str], int]:
+    """Collect the ids matching `filter_formula` before deleting (deletes shift pages)."""
+    record_ids: List[str] = []
+    pages = 0
+
+    def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+        builder = (
+            ListAppTableRecordRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .filter(filter_formula)
+            .page_size(500)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    try:
+        for page in iter_pages(client, client.bitable.v1.app_table_record.list, build_request):
+            pages += 1
+            record_ids.extend(item["record_id"] for item in page.jsonable_items() if item.get("record_id"))
+    except PageError as exc:
+        typer.echo(format_response(exc.response))
+        raise typer.Exit(code=1)
+    return record_ids, pages
+
+
+def _bulk_input_format(file: Optional[Path], input_format: Optional[str]) -> str:
+    """Validate bulk input options, exiting with a parameter error."""
+    if file is not None and not file.exists():
+        _json_param_error(f"Input file not found: {file}")
+    try:
+        return resolve_input_format(file, input_format)
+    except ValueError as exc:
+        _json_param_error(str(exc))
+    return ""
+
+
+def _import_row(row: Row) -> Row:
+    """Accept `{"fields": {...}}` or a bare fields object per row."""
+    if row.error is not None:
+        return row
+    value = row.value
+    if isinstance(value, dict) and isinstance(value.get("fields"), dict):
+        value = value["fields"]
+    if not isinstance(value, dict) or not value:
+        return Row(row.line, error="Row must be a non-empty fields object")
+    return Row(row.line, value)
+
+
+def _update_row(row: Row) -> Row:
+    """Accept `{"record_id": ..., "fields": {...}}`, or record_id plus field columns (CSV)."""
+    if row.error is not None:
+        return row
+    value = row.value
+    if not isinstance(value, dict) or not isinstance(value.get("record_id"), str) or not value["record_id"]:
+        return Row(row.line, error="Row must be an object with a record_id")
+    fields = value.get("fields")
+    if not isinstance(fields, dict):
+        fields = {key: item for key, item in value.items() if key != "record_id"}
+    if not fields:
+        return Row(row.line, error="Row has no fields to update")
+    return Row(row.line, {"record_id": value["record_id"], "fields": fields})
+
+
+def _table_schema(client: Any, app_token: str, table_id: str) -> FieldSchema:
+    """Return the table's field schema, from the shared cache while it is fresh."""
+    try:
+        cache = SchemaCache()
+    except ValueError as exc:
+        _json_param_error(str(exc))
+    key = f"{app_token}/{table_id}"
+    fields = cache.get(key)
+    if fields is None:
+        fields = _table_fields(client, app_token, table_id)
+        cache.set(key, fields)
+    return FieldSchema(fields)
+
+
+def _forget_table_schema(app_token: str, table_id: str) -> None:
+    """Drop the cached schema after a field change so the next validation re-fetches it."""
+    SchemaCache(ttl=0).invalidate(f"{app_token}/{table_id}")
+
+
+def _validated_fields(client: Any, app_token: str, table_id: str, fields: Any) -> Dict[str, Any]:
+    """Coerce a single record payload, exiting with a parameter error when it is invalid."""
+    if not isinstance(fields, dict):
+        _json_param_error("Fields must be a JSON object")
+    coerced, errors = _table_schema(client, app_token, table_id).coerce(fields)
+    if errors:
+        _json_param_error("Invalid fields: " + "; ".join(errors))
+    return coerced
+
+
+def _bulk_schema(
+    client: Any, app_token: str, table_id: str, validate: bool, reject_file: Optional[Path]
+) -> Optional[FieldSchema]:
+    if not validate and reject_file is None:
+        return None
+    return _table_schema(client, app_token, table_id)
+
+
+def _validated_row(row: Row, schema: Optional[FieldSchema], nested: bool = False) -> Row:
+    """Coerce a row's fields (under `"fields"` when `nested`); invalid rows keep their input."""
+    if schema is None or row.error is not None:
+        return row
+    fields = row.value["fields"] if nested else row.value
+    coerced, errors = schema.coerce(fields)
+    if errors:
+        return Row(row.line, row.value, "; ".join(errors))
+    return Row(row.line, {**row.value, "fields": coerced} if nested else coerced)
+
+
+@record_app.command("export")
+def record_export(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    shards: int = typer.Option(1, min=1, max=32, help="Number of ranges exported concurrently"),
+    shard_field: Optional[str] = typer.Option(
+        None,
+        help="Number or date field to split on (required with --shards > 1); "
+        "prefer fields that do not change, such as created time",
+    ),
+    page_size: int = typer.Option(500, min=1, max=500, help="Page size per request"),
+    prefetch: int = PREFETCH_OPTION,
+    select: Optional[str] = SELECT_OPTION,
+) -> None:
+    """Export every record, optionally as concurrent shards (each record exactly once)."""
+    projection = parse_select(select)
+    field_names = _selected_field_names(projection)
+    client = create_client()
+    filters: List[Optional[str]] = [None]
+    trailer: Dict[str, Any] = {}
+    if shards > 1:
+        if not shard_field:
+            _json_param_error("--shard-field is required when --shards > 1")
+        filters = _plan_record_shards(client, app_token, table_id, shard_field, shards)
+        if filters == [None]:
+            trailer["shards_skipped"] = f"No record has a value in {shard_field}; exported as one shard"
+
+    def request_factory(filter_formula: Optional[str]):
+        def build_request(token: Optional[str]) -> ListAppTableRecordRequest:
+            builder = (
+                ListAppTableRecordRequest.builder()
+                .app_token(app_token)
+                .table_id(table_id)
+                .page_size(page_size)
+            )
+            if filter_formula:
+                builder = builder.filter(filter_formula)
+            if field_names:
+                builder = builder.field_names(field_names)
+            if token:
+                builder = builder.page_token(token)
+            return builder.build()
+
+        return build_request
+
+    stream_merged_pages(
+        client,
+        client.bitable.v1.app_table_record.list,
+        [request_factory(filter_formula) for filter_formula in filters],
+        dedupe_key=lambda record: record.get("record_id"),
+        prefetch=prefetch,
+        select=projection,
+        trailer=trailer,
+    )
+
+
+def _selected_field_names(projection: Optional[Projection]) -> Optional[str]:
+    """Push `fields.<name>` selections down to the list API's `field_names`."""
+    if projection is None:
+        return None
+    names = projection.top_level_names("fields")
+    return json.dumps(names, ensure_ascii=False) if names else None
+
+
+def _plan_record_shards(
+    client: Any, app_token: str, table_id: str, field_name: str, shards: int
+) -> List[Optional[str]]:
+    """Build disjoint filter formulas over `field_name` from its current min/max."""
+    field_type = None
+    for item in _table_fields(client, app_token, table_id):
+        if item.get("field_name") == field_name:
+            field_type = item.get("type")
+    if field_type is None:
+        _json_param_error(f"Shard field not found: {field_name}")
+    if field_type not in SHARDABLE_FIELD_TYPES:
+        _json_param_error(f"Shard field must be a number or date field: {field_name}")
+    list_records = client.bitable.v1.app_table_record.list
+    # The min and max probes are independent, so they go out together.
+    lower, upper = (
+        _record_field_bound(response, field_name)
+        for response in call_api_many(
+            client,
+            [
+                (list_records, _field_bound_request(app_token, table_id, field_name, "ASC")),
+                (list_records, _field_bound_request(app_token, table_id, field_name, "DESC")),
+            ],
+        )
+    )
+    return plan_shard_filters(field_name, field_type, lower, upper, shards)
+
+
+def _table_fields(client: Any, app_token: str, table_id: str) -> List[Dict[str, Any]]:
+    """Return the table's field definitions as JSON, exiting on API failure."""
+    try:
+        return _list_items(
+            client, client.bitable.v1.app_table_field.list, partial(_field_list_request, app_token, table_id)
+        )
+    except PageError as exc:
+        typer.echo(format_response(exc.response))
+        raise typer.Exit(code=1)
+
+
+def _field_list_request(app_token: str, table_id: str, token: Optional[str]) -> ListAppTableFieldRequest:
+    builder = ListAppTableFieldRequest.builder().app_token(app_token).table_id(table_id).page_size(100)
+    if token:
+        builder = builder.page_token(token)
+    return builder.build()
+
+
+def _field_bound_request(app_token: str, table_id: str, field_name: str, direction: str) -> ListAppTableRecordRequest:
+    """List the smallest (ASC) or largest (DESC) non-blank values of the field."""
+    return (
+        ListAppTableRecordRequest.builder()
+        .app_token(app_token)
+        .table_id(table_id)
+        .filter(f'NOT({field_ref(field_name)}="")')
+        .sort(json.dumps([f"{field_name} {direction}"], ensure_ascii=False))
+        .field_names(json.dumps([field_name], ensure_ascii=False))
+        .page_size(20)
+        .build()
+    )
+
+
+def _record_field_bound(response: Any, field_name: str) -> Optional[float]:
+    """Return the first value in a bound probe's response, None when every record is blank."""
+    if not response.success():
+        typer.echo(format_response(response))
+        raise typer.Exit(code=1)
+    for record in getattr(response.data, "items", None) or []:
+        value = sortable_value((record.fields or {}).get(field_name))
+        if value is not None:
+            return value
+    return None
+
+
 # ── Field commands ──────────────────────────────────────────────────────────
 
 
@@ -335,20 +1352,28 @@ def field_list(
     table_id: str = typer.Option(..., help="Table ID"),
     page_size: int = typer.Option(20, help="Page size"),
     page_token: str = typer.Option("", help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
 ) -> None:
     """List fields in a table."""
     client = create_client()
-    builder = (
-        ListAppTableFieldRequest.builder()
-        .app_token(app_token)
-        .table_id(table_id)
-        .page_size(page_size)
-    )
-    if page_token:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.bitable.v1.app_table_field.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListAppTableFieldRequest:
+        builder = (
+            ListAppTableFieldRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .page_size(page_size)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint)
+    run_list_command(client, client.bitable.v1.app_table_field.list, build_request, options)
 
 
 @field_app.command("create")
@@ -369,6 +1394,8 @@ def field_create(
         .build()
     )
     response = call_api(client, client.bitable.v1.app_table_field.create, request)
+    if response.success():
+        _forget_table_schema(app_token, table_id)
     typer.echo(format_response(response))
     raise typer.Exit(code=0 if response.success() else 1)
 
@@ -393,6 +1420,8 @@ def field_update(
         .build()
     )
     response = call_api(client, client.bitable.v1.app_table_field.update, request)
+    if response.success():
+        _forget_table_schema(app_token, table_id)
     typer.echo(format_response(response))
     raise typer.Exit(code=0 if response.success() else 1)
 
@@ -413,6 +1442,8 @@ def field_delete(
         .build()
     )
     response = call_api(client, client.bitable.v1.app_table_field.delete, request)
+    if response.success():
+        _forget_table_schema(app_token, table_id)
     typer.echo(format_response(response))
     raise typer.Exit(code=0 if response.success() else 1)
 
@@ -426,20 +1457,28 @@ def view_list(
     table_id: str = typer.Option(..., help="Table ID"),
     page_size: int = typer.Option(20, help="Page size"),
     page_token: str = typer.Option("", help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
 ) -> None:
     """List views of a table."""
     client = create_client()
-    builder = (
-        ListAppTableViewRequest.builder()
-        .app_token(app_token)
-        .table_id(table_id)
-        .page_size(page_size)
-    )
-    if page_token:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.bitable.v1.app_table_view.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListAppTableViewRequest:
+        builder = (
+            ListAppTableViewRequest.builder()
+            .app_token(app_token)
+            .table_id(table_id)
+            .page_size(page_size)
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint)
+    run_list_command(client, client.bitable.v1.app_table_view.list, build_request, options)
 
 
 @view_app.command("get")
@@ -502,3 +1541,104 @@ def view_delete(
     response = call_api(client, client.bitable.v1.app_table_view.delete, request)
     typer.echo(format_response(response))
     raise typer.Exit(code=0 if response.success() else 1)
+
+
+# ── Mirror commands ─────────────────────────────────────────────────────────
+
+
+@mirror_app.command("refresh")
+def mirror_refresh(
+    app_token: str = typer.Option(..., help="App token"),
+    table_id: str = typer.Option(..., help="Table ID"),
+    db: Path = typer.Option(..., "--db", help="SQLite file holding the mirror (created if missing)"),
+    table_name: str = typer.Option("records", "--table-name", help="SQLite table to mirror into"),
+    deletes_every: float = typer.Option(
+        3600, min=0, help="Seconds between id-set diffs that detect deleted records (0: every refresh)"
+    ),
+    page_size: int = typer.Option(500, min=1, max=500, help="Page size per request"),
+) -> None:
+    """Create or incrementally refresh a local SQLite mirror of a table."""
+    source = f"{app_token}/{table_id}"
+    client = create_client()
+    fields = _table_fields(client, app_token, table_id)
+    modified_field = _modified_time_field(fields)
+    try:
+        mirror = Mirror(db, table_name)
+    except (OSError, sqlite3.Error) as exc:
+        _json_param_error(f"Cannot open mirror {db}: {exc}")
+    upserted = 0
+    try:
+        mirror.begin()
+        rebuilt = mirror.ensure_schema(fields, source)
+        meta = mirror.meta() or {}
+        change_state = ChangeState(
+            path=db,
+            table=source,
+            watermark=meta.get("watermark", 0),
+            ids_checked_at=meta.get("ids_checked_at", 0.0),
+            ids=mirror.record_ids(),
+        )
+        walk = ChangeWalk(change_state.watermark, change_state.ids_due(deletes_every))
+        records: List[Dict[str, Any]] = []
+        deleted: List[str] = []
+        for item in _walk_changes(client, app_token, table_id, change_state, walk, modified_field, page_size):
+            if item.get("deleted"):
+                deleted.append(item["record_id"])
+                continue
+            records.append(item)
+            if len(records) >= page_size:
+                upserted += mirror.upsert(records)
+                records = []
+        upserted += mirror.upsert(records)
+        mirror.delete(deleted)
+        mirror.save_meta(source, change_state.watermark, change_state.ids_checked_at)
+        mirror.commit()
+        rows = mirror.count()
+    except PageError as exc:
+        mirror.rollback()
+        typer.echo(format_response(exc.response))
+        raise typer.Exit(code=1)
+    except sqlite3.Error as exc:
+        mirror.rollback()
+        typer.echo(format_error(code=1, msg=f"SQLite error: {exc}"))
+        raise typer.Exit(code=1)
+    finally:
+        mirror.close()
+    summary = {
+        "db": str(db),
+        "table": table_name,
+        "full": walk.previous <= 0,
+        "rebuilt": rebuilt,
+        "upserted": upserted,
+        "deleted": walk.deleted,
+        "deletes_checked": walk.deletes_checked,
+        "pages": walk.pages,
+        "rows": rows,
+        "watermark": change_state.watermark,
+    }
+    if mirror.renamed():
+        summary["renamed_columns"] = mirror.renamed()
+    typer.echo(format_success(summary))
+    raise typer.Exit(code=0)
+
+
+@mirror_app.command("query")
+def mirror_query(
+    db: Path = typer.Option(..., "--db", help="SQLite mirror file"),
+    sql: str = typer.Option(..., "--sql", help="SQL to run against the mirror (read-only)"),
+    param: Optional[List[str]] = typer.Option(
+        None, "--param", help="Value bound to the next ? placeholder (repeatable)"
+    ),
+) -> None:
+    """Run SQL against a local mirror without calling the API."""
+    if not db.exists():
+        _json_param_error(f"Mirror not found: {db}")
+    try:
+        columns, rows = run_query(db, sql, param or [])
+    except sqlite3.Error as exc:
+        _json_param_error(f"SQLite error: {exc}")
+    writer = ItemStreamWriter("items")
+    for row in rows:
+        writer.write_item(row)
+    writer.finish({"columns": columns, "count": len(rows)})
+    raise typer.Exit(code=0)
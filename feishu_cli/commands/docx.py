@@ -19,6 +19,16 @@ from lark_oapi.api.docx.v1 import (
 )
 
 from feishu_cli.client import create_client
+from feishu_cli.pagination import (
+    ALL_PAGES_OPTION,
+    CHECKPOINT_OPTION,
+    LIMIT_OPTION,
+    MAX_PAGES_OPTION,
+    PREFETCH_OPTION,
+    PageOptions,
+    run_list_command,
+)
+from feishu_cli.projection import SELECT_OPTION, parse_select
 from feishu_cli.runtime import call_api
 from feishu_cli.utils.output import format_error, format_response
 
@@ -102,18 +112,27 @@ def list_blocks(
     token: str = typer.Option(..., help="Document token"),
     page_size: Optional[int] = typer.Option(None, help="Page size"),
     page_token: Optional[str] = typer.Option(None, help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
+    select: Optional[str] = SELECT_OPTION,
 ) -> None:
     """List document blocks."""
+    projection = parse_select(select)
     client = create_client()
-    builder = ListDocumentBlockRequest.builder().document_id(token)
-    if page_size is not None:
-        builder = builder.page_size(page_size)
-    if page_token is not None:
-        builder = builder.page_token(page_token)
-    request = builder.build()
-    response = call_api(client, client.docx.v1.document_block.list, request)
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(next_token: Optional[str]) -> ListDocumentBlockRequest:
+        builder = ListDocumentBlockRequest.builder().document_id(token)
+        if page_size is not None:
+            builder = builder.page_size(page_size)
+        if next_token is not None:
+            builder = builder.page_token(next_token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint, projection)
+    run_list_command(client, client.docx.v1.document_block.list, build_request, options)
 
 
 @block_app.command("get")
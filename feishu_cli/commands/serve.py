@@ -0,0 +1,57 @@
+"""Daemon command that keeps CLI state warm between invocations."""
+
+import json
+import os
+from pathlib import Path
+import signal
+import threading
+from typing import Optional
+
+import typer
+
+from feishu_cli.client import create_client
+from feishu_cli.config import ConfigError
+from feishu_cli.daemon import DaemonServer, get_socket_path
+from feishu_cli.utils.output import format_error
+
+
+def serve(
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Unix socket path (default: $FEISHU_CLI_SOCKET or ~/.config/feishu-cli/daemon.sock)"
+    ),
+) -> None:
+    """Run a local daemon that executes forwarded CLI calls with warm state."""
+    try:
+        create_client()
+    except ConfigError as exc:
+        typer.echo(format_error(code=2, msg=str(exc)))
+        raise typer.Exit(code=2)
+
+    from feishu_cli.main import preload_commands
+
+    preload_commands()
+
+    path = socket_path or get_socket_path()
+    try:
+        server = DaemonServer(path)
+    except OSError as exc:
+        typer.echo(format_error(code=2, msg=f"Failed to start daemon: {exc}"))
+        raise typer.Exit(code=2)
+
+    def _stop(_signum, _frame) -> None:
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    typer.echo(
+        json.dumps(
+            {"success": True, "data": {"socket": str(path), "pid": os.getpid()}},
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -1,4 +1,5 @@
 """Wiki commands for spaces, nodes, members, settings, and search."""
+from pathlib import Path
 from typing import Optional
 
 import lark_oapi as lark
@@ -22,6 +23,16 @@ from lark_oapi.api.wiki.v2 import (
 )
 
 from feishu_cli.client import create_client
+from feishu_cli.pagination import (
+    ALL_PAGES_OPTION,
+    CHECKPOINT_OPTION,
+    LIMIT_OPTION,
+    MAX_PAGES_OPTION,
+    PREFETCH_OPTION,
+    PageOptions,
+    run_list_command,
+)
+from feishu_cli.projection import SELECT_OPTION, parse_select
 from feishu_cli.runtime import call_api
 from feishu_cli.utils.output import format_error, format_response
 
@@ -58,17 +69,25 @@ def _parse_json_body(data: str, schema: object) -> object:
 def space_list(
     page_size: Optional[int] = typer.Option(None, help="Page size"),
     page_token: Optional[str] = typer.Option(None, help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
 ) -> None:
     """List wiki spaces."""
     client = create_client()
-    builder = ListSpaceRequest.builder()
-    if page_size is not None:
-        builder = builder.page_size(page_size)
-    if page_token is not None:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.wiki.v2.space.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListSpaceRequest:
+        builder = ListSpaceRequest.builder()
+        if page_size is not None:
+            builder = builder.page_size(page_size)
+        if token is not None:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint)
+    run_list_command(client, client.wiki.v2.space.list, build_request, options)
 
 
 @space_cmd.command("create")
@@ -137,19 +156,29 @@ def node_list(
     parent: Optional[str] = typer.Option(None, help="Parent node token"),
     page_size: Optional[int] = typer.Option(None, help="Page size"),
     page_token: Optional[str] = typer.Option(None, help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
+    select: Optional[str] = SELECT_OPTION,
 ) -> None:
     """List wiki nodes in a space."""
+    projection = parse_select(select)
     client = create_client()
-    builder = ListSpaceNodeRequest.builder().space_id(space)
-    if parent is not None:
-        builder = builder.parent_node_token(parent)
-    if page_size is not None:
-        builder = builder.page_size(page_size)
-    if page_token is not None:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.wiki.v2.space_node.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListSpaceNodeRequest:
+        builder = ListSpaceNodeRequest.builder().space_id(space)
+        if parent is not None:
+            builder = builder.parent_node_token(parent)
+        if page_size is not None:
+            builder = builder.page_size(page_size)
+        if token is not None:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint, projection)
+    run_list_command(client, client.wiki.v2.space_node.list, build_request, options)
 
 
 @node_cmd.command("copy")
@@ -216,17 +245,25 @@ def member_list(
     space: str = typer.Option(..., help="Space ID"),
     page_size: Optional[int] = typer.Option(None, help="Page size"),
     page_token: Optional[str] = typer.Option(None, help="Page token"),
+    all_pages: bool = ALL_PAGES_OPTION,
+    limit: Optional[int] = LIMIT_OPTION,
+    max_pages: Optional[int] = MAX_PAGES_OPTION,
+    prefetch: int = PREFETCH_OPTION,
+    checkpoint: Optional[Path] = CHECKPOINT_OPTION,
 ) -> None:
     """List members of a wiki space."""
     client = create_client()
-    builder = ListSpaceMemberRequest.builder().space_id(space)
-    if page_size is not None:
-        builder = builder.page_size(page_size)
-    if page_token is not None:
-        builder = builder.page_token(page_token)
-    response = call_api(client, client.wiki.v2.space_member.list, builder.build())
-    typer.echo(format_response(response))
-    raise typer.Exit(code=0 if response.success() else 1)
+
+    def build_request(token: Optional[str]) -> ListSpaceMemberRequest:
+        builder = ListSpaceMemberRequest.builder().space_id(space)
+        if page_size is not None:
+            builder = builder.page_size(page_size)
+        if token is not None:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    options = PageOptions(page_token, all_pages, limit, max_pages, prefetch, checkpoint)
+    run_list_command(client, client.wiki.v2.space_member.list, build_request, options, items_attr="members")
 
 
 @member_cmd.command("delete")
@@ -3,9 +3,12 @@
 from dataclasses import dataclass
 import os
 from pathlib import Path
+from typing import Tuple
 
 from dotenv import load_dotenv
 
+from feishu_cli.ratelimit import parse_rate_limits
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -17,15 +20,26 @@ class FeishuConfig:
     """Immutable Feishu configuration."""
     app_id: str
     app_secret: str
+    http_pool_size: int = 10
+    http_connect_timeout: float = 5.0
+    http_timeout: float = 30.0
+    rate_limits: Tuple[Tuple[str, float], ...] = ()
+    retry_max_attempts: int = 4
+    retry_base_delay: float = 0.5
 
 
-def load_config() -> FeishuConfig:
-    """Load config from environment variables, falling back to .env file."""
+def load_env_file() -> None:
+    """Load the project .env file without overriding existing variables."""
     project_root = Path(__file__).parent.parent
     env_path = project_root / ".env"
     if env_path.exists():
         load_dotenv(env_path, override=False)
 
+
+def load_config() -> FeishuConfig:
+    """Load config from environment variables, falling back to .env file."""
+    load_env_file()
+
     app_id = os.environ.get("FEISHU_APP_ID")
     app_secret = os.environ.get("FEISHU_APP_SECRET")
 
@@ -40,4 +54,34 @@ def load_config() -> FeishuConfig:
             "Set it as an environment variable or in .env file."
         )
 
-    return FeishuConfig(app_id=app_id, app_secret=app_secret)
+    return FeishuConfig(
+        app_id=app_id,
+        app_secret=app_secret,
+        http_pool_size=_positive_env("FEISHU_HTTP_POOL_SIZE", 10, int),
+        http_connect_timeout=_positive_env("FEISHU_HTTP_CONNECT_TIMEOUT", 5.0, float),
+        http_timeout=_positive_env("FEISHU_HTTP_TIMEOUT", 30.0, float),
+        rate_limits=_rate_limits_env(),
+        retry_max_attempts=_positive_env("FEISHU_RETRY_MAX_ATTEMPTS", 4, int),
+        retry_base_delay=_positive_env("FEISHU_RETRY_BASE_DELAY", 0.5, float),
+    )
+
+
+def _rate_limits_env() -> Tuple[Tuple[str, float], ...]:
+    try:
+        limits = parse_rate_limits(os.environ.get("FEISHU_RATE_LIMITS", ""))
+    except ValueError as exc:
+        raise ConfigError(f"Invalid FEISHU_RATE_LIMITS: {exc}")
+    return tuple(sorted(limits.items()))
+
+
+def _positive_env(name: str, default, cast):
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        raise ConfigError(f"{name} must be a positive number, got {raw!r}.")
+    if value <= 0:
+        raise ConfigError(f"{name} must be a positive number, got {raw!r}.")
+    return value
@@ -0,0 +1,305 @@
+"""Local Unix-socket daemon that keeps CLI state warm between invocations.
+
+`feishu-cli serve` imports the SDK once and keeps clients, tokens and
+connection pools alive.  `python -m feishu_cli` forwards argv plus the
+caller's stdin/stdout/stderr descriptors to it, and falls back to running
+the command in-process when no daemon is listening.
+
+This module is imported on every forwarded call, so it must stay free of SDK
+imports at module level.
+"""
+
+from __future__ import annotations
+
+import array
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from feishu_cli.config import load_env_file
+
+
+PROTOCOL_VERSION = 1
+ENV_PREFIX = "FEISHU_"
+# Only consulted by the forwarding client, never by the command itself.
+CLIENT_ONLY_ENV_KEYS = frozenset({"FEISHU_CLI_SOCKET", "FEISHU_CLI_NO_DAEMON"})
+_MAX_HEADER_BYTES = 1 << 20
+_FD_COUNT = 3
+
+
+def _default_socket_file() -> Path:
+    return Path.home() / ".config" / "feishu-cli" / "daemon.sock"
+
+
+def get_socket_path() -> Path:
+    """Return the configured daemon socket path."""
+    raw = os.environ.get("FEISHU_CLI_SOCKET")
+    return Path(raw).expanduser() if raw else _default_socket_file()
+
+
+def identity_env() -> Dict[str, str]:
+    """Return every `FEISHU_*` setting that can change how a command runs.
+
+    Beyond the app/user identity this covers rate limits, HTTP and retry
+    tuning, cache files and debug flags, so a caller whose settings differ
+    from the daemon's runs in-process instead of silently using the daemon's.
+    """
+    load_env_file()
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(ENV_PREFIX) and key not in CLIENT_ONLY_ENV_KEYS
+    }
+
+
+# ── Client side ─────────────────────────────────────────────────────────────
+
+
+def forward(
+    argv: Sequence[str],
+    socket_path: Optional[Path] = None,
+    fds: Tuple[int, int, int] = (0, 1, 2),
+) -> Optional[int]:
+    """Run argv on a running daemon and return its exit code.
+
+    Returns None when no compatible daemon is available and the caller should
+    execute the command itself.
+    """
+    path = socket_path or get_socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        header = {
+            "version": PROTOCOL_VERSION,
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": identity_env(),
+        }
+        payload = (json.dumps(header, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            sock.sendmsg(
+                [payload],
+                [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))],
+            )
+        except OSError:
+            return None
+        reply = _read_line(sock)
+    finally:
+        sock.close()
+
+    if reply is None:
+        sys.stderr.write("feishu-cli daemon closed the connection unexpectedly.\n")
+        return 1
+    status = reply.get("status")
+    if status == "ok":
+        return int(reply.get("exit_code", 1))
+    if status == "rejected":
+        return None
+    sys.stderr.write(f"feishu-cli daemon error: {reply.get('msg', status)}\n")
+    return 1
+
+
+def forward_or_run(argv: Sequence[str]) -> int:
+    """Prefer the daemon; fall back to in-process execution."""
+    argv = list(argv)
+    if os.environ.get("FEISHU_CLI_NO_DAEMON") != "1" and (not argv or argv[0] != "serve"):
+        code = forward(argv)
+        if code is not None:
+            return code
+
+    from feishu_cli.main import app
+
+    try:
+        app(args=argv, prog_name="feishu-cli")
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    return 0
+
+
+# ── Server side ─────────────────────────────────────────────────────────────
+
+
+class _CwdGate:
+    """Let requests from the daemon's cwd run concurrently; admit others alone.
+
+    The working directory is process-wide, so a request from another
+    directory needs the daemon to itself while it switches there. Nothing
+    ever waits: a request that cannot be admitted right away is handed back
+    to the caller to run in-process, so a long run in one directory never
+    stalls callers elsewhere and a busy home directory cannot starve them.
+    """
+
+    def __init__(self) -> None:
+        self._home = os.path.realpath(os.getcwd())
+        self._lock = threading.Lock()
+        self._shared = 0
+        self._exclusive = False
+
+    @contextmanager
+    def enter(self, cwd: str) -> Iterator[bool]:
+        """Yield True when the request was admitted, False when the caller should run it."""
+        target = os.path.realpath(cwd) if cwd else self._home
+        exclusive = target != self._home
+        with self._lock:
+            admitted = not self._exclusive and not (exclusive and self._shared)
+            if admitted and exclusive:
+                self._exclusive = True
+            elif admitted:
+                self._shared += 1
+        if not admitted:
+            yield False
+            return
+        try:
+            if exclusive:
+                os.chdir(target)
+            yield True
+        finally:
+            if exclusive:
+                os.chdir(self._home)
+            with self._lock:
+                if exclusive:
+                    self._exclusive = False
+                else:
+                    self._shared -= 1
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server: DaemonServer = self.server  # type: ignore[assignment]
+        conn: socket.socket = self.request
+        try:
+            header, fds = _recv_request(conn)
+        except (OSError, ValueError) as exc:
+            _send_reply(conn, {"status": "error", "msg": f"Bad request: {exc}"})
+            return
+
+        streams = []
+        try:
+            if len(fds) != _FD_COUNT or header.get("version") != PROTOCOL_VERSION:
+                _send_reply(conn, {"status": "rejected", "msg": "Protocol mismatch."})
+                return
+            if header.get("env") != server.env:
+                _send_reply(conn, {"status": "rejected", "msg": "Environment mismatch."})
+                return
+            streams = [
+                os.fdopen(fds[0], "r", encoding="utf-8", closefd=True),
+                os.fdopen(fds[1], "w", encoding="utf-8", closefd=True),
+                os.fdopen(fds[2], "w", encoding="utf-8", closefd=True),
+            ]
+            fds = []
+            from feishu_cli.dispatch import run_command
+
+            with server.cwd_gate.enter(str(header.get("cwd", ""))) as admitted:
+                if not admitted:
+                    _send_reply(conn, {"status": "rejected", "msg": "Busy in another directory."})
+                    return
+                code = run_command(header.get("argv", []), *streams)
+            _send_reply(conn, {"status": "ok", "exit_code": code})
+        finally:
+            for stream in streams:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+            for fd in fds:
+                os.close(fd)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix-socket server executing forwarded CLI invocations."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path) -> None:
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists() or socket_path.is_symlink():
+            _remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.env = identity_env()
+        self.cwd_gate = _CwdGate()
+        super().__init__(str(socket_path), _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket left by a dead daemon; never touch anything else."""
+    if not stat.S_ISSOCK(path.lstat().st_mode):
+        raise OSError(f"{path} exists and is not a socket; refusing to replace it")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise OSError(f"A daemon is already listening on {path}")
+
+
+def _recv_request(conn: socket.socket) -> Tuple[dict, List[int]]:
+    fd_size = array.array("i").itemsize
+    data, ancdata, _flags, _addr = conn.recvmsg(
+        65536, socket.CMSG_SPACE(_FD_COUNT * fd_size)
+    )
+    fds: List[int] = []
+    for level, kind, raw in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            received = array.array("i")
+            received.frombytes(raw[: len(raw) - (len(raw) % fd_size)])
+            fds.extend(received)
+
+    try:
+        buffer = bytearray(data)
+        while b"\n" not in buffer:
+            if len(buffer) > _MAX_HEADER_BYTES:
+                raise ValueError("header too large")
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            buffer.extend(chunk)
+        line = bytes(buffer).split(b"\n", 1)[0]
+        header = json.loads(line.decode("utf-8"))
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return header, fds
+
+
+def _send_reply(conn: socket.socket, reply: dict) -> None:
+    try:
+        conn.sendall((json.dumps(reply) + "\n").encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _read_line(sock: socket.socket) -> Optional[dict]:
+    buffer = bytearray()
+    while b"\n" not in buffer:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    try:
+        return json.loads(bytes(buffer).split(b"\n", 1)[0].decode("utf-8"))
+    except ValueError:
+        return None
@@ -0,0 +1,96 @@
+"""In-process command dispatch for long-lived CLI hosts."""
+
+import sys
+import threading
+from typing import IO, Any, Iterator, Optional, Sequence
+
+
+_local = threading.local()
+_install_lock = threading.Lock()
+
+
+class _ThreadLocalStream:
+    """Standard stream proxy that routes I/O to a per-thread target."""
+
+    # Fixed so click/typer never re-wrap the proxy in a cached text writer.
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, name: str, default: IO[Any]) -> None:
+        self._name = name
+        self._default = default
+
+    def _target(self) -> IO[Any]:
+        target = getattr(_local, self._name, None)
+        return target if target is not None else self._default
+
+    def write(self, data: str) -> int:
+        return self._target().write(data)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._target())
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._target(), item)
+
+
+def install_stream_proxies() -> None:
+    """Replace sys.stdin/stdout/stderr with thread-routable proxies once."""
+    with _install_lock:
+        for name in ("stdin", "stdout", "stderr"):
+            current = getattr(sys, name)
+            if not isinstance(current, _ThreadLocalStream):
+                setattr(sys, name, _ThreadLocalStream(name, current))
+
+
+def run_command(
+    argv: Sequence[str],
+    stdin: Optional[IO[Any]] = None,
+    stdout: Optional[IO[Any]] = None,
+    stderr: Optional[IO[Any]] = None,
+) -> int:
+    """Run one CLI invocation in this process and return its exit code.
+
+    Streams that are not given fall through to the enclosing invocation's
+    streams, so nested dispatch (e.g. batch inside serve) keeps working.
+    """
+    install_stream_proxies()
+    from feishu_cli.main import app
+
+    previous = (
+        getattr(_local, "stdin", None),
+        getattr(_local, "stdout", None),
+        getattr(_local, "stderr", None),
+    )
+    if stdin is not None:
+        _local.stdin = stdin
+    if stdout is not None:
+        _local.stdout = stdout
+    if stderr is not None:
+        _local.stderr = stderr
+    try:
+        app(args=list(argv), prog_name="feishu-cli")
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except Exception as exc:  # noqa: BLE001 - one command must not kill its host
+        from feishu_cli.utils.output import format_error
+
+        sys.stdout.write(format_error(code=1, msg=f"{type(exc).__name__}: {exc}") + "\n")
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        _local.stdin, _local.stdout, _local.stderr = previous
+    return 0
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
@@ -1,31 +1,142 @@
+import importlib
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
 import typer
+from typer.core import TyperGroup
+
+
+# name -> (module, attribute, short help). Modules are imported on first use,
+# so `--help` and single-domain calls do not load every SDK domain.
+COMMAND_REGISTRY: Dict[str, Tuple[str, str, str]] = {
+    "docx": ("feishu_cli.commands.docx", "docx_app", "Docx document operations."),
+    "docs": ("feishu_cli.commands.docs", "docs_app", "Legacy document operations."),
+    "sheets": ("feishu_cli.commands.sheets", "sheets_app", "Spreadsheet operations."),
+    "bitable": (
+        "feishu_cli.commands.bitable",
+        "bitable_app",
+        "Bitable (multidimensional table) operations.",
+    ),
+    "wiki": ("feishu_cli.commands.wiki", "wiki_app", "Wiki operations."),
+    "auth": (
+        "feishu_cli.commands.auth",
+        "auth_app",
+        "User access token authentication operations.",
+    ),
+    "serve": (
+        "feishu_cli.commands.serve",
+        "serve",
+        "Run a local daemon that executes forwarded CLI calls with warm state.",
+    ),
+    "batch": (
+        "feishu_cli.commands.batch",
+        "batch",
+        "Run commands from a JSONL stream and emit one result line per command.",
+    ),
+}
+
+_LOADED: Dict[str, Any] = {}
+
+
+def load_command(name: str) -> Any:
+    """Import a registered command module and return its click command."""
+    command = _LOADED.get(name)
+    if command is not None:
+        return command
+    module_name, attr, _help = COMMAND_REGISTRY[name]
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        single = typer.Typer(add_completion=False)
+        single.command(name)(target)
+        command = typer.main.get_command(single)
+    command.name = name
+    _LOADED[name] = command
+    return command
+
+
+def preload_commands() -> None:
+    """Import every registered command module (used by long-lived hosts)."""
+    for name in COMMAND_REGISTRY:
+        load_command(name)
+
+
+class LazyCommandGroup(TyperGroup):
+    """Top-level group that imports a command module only when it is used."""
 
-from feishu_cli.commands.auth import auth_app
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._listing_help = False
+
+    def list_commands(self, ctx) -> List[str]:
+        eager = [name for name in self.commands if name not in COMMAND_REGISTRY]
+        return list(COMMAND_REGISTRY) + eager
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in self.commands or cmd_name not in COMMAND_REGISTRY:
+            return self.commands.get(cmd_name)
+        if self._listing_help and cmd_name not in _LOADED:
+            return _help_placeholder(cmd_name)
+        return load_command(cmd_name)
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+
+def _help_placeholder(name: str) -> TyperGroup:
+    return TyperGroup(name=name, help=COMMAND_REGISTRY[name][2])
 
-from feishu_cli.commands.bitable import bitable_app
-from feishu_cli.commands.docs import docs_app
-from feishu_cli.commands.docx import docx_app
-from feishu_cli.commands.sheets import sheets_app
-from feishu_cli.commands.wiki import wiki_app
 
 app = typer.Typer(
     name="feishu-cli",
+    cls=LazyCommandGroup,
     help="CLI tool for Feishu cloud document operations.",
     no_args_is_help=True,
 )
 
-app.add_typer(docx_app, name="docx")
-app.add_typer(docs_app, name="docs")
-app.add_typer(sheets_app, name="sheets")
-app.add_typer(bitable_app, name="bitable")
-app.add_typer(wiki_app, name="wiki")
-app.add_typer(auth_app, name="auth")
-
 
 @app.callback()
-def main():
+def main(
+    ctx: typer.Context,
+    debug_http: bool = typer.Option(
+        False,
+        "--debug-http",
+        help="Print HTTP connection pool statistics to stderr when the command finishes.",
+    ),
+    output: str = typer.Option(
+        "json",
+        "--output",
+        envvar="FEISHU_CLI_OUTPUT",
+        help=(
+            "Output format: json (pretty document), compact (one-line document) "
+            "or ndjson (one compact line per list item, then a summary line)."
+        ),
+    ),
+):
     """Feishu Cloud Docs CLI - operate docs, sheets, bitable, wiki."""
-    pass
+    from feishu_cli.utils.output import OUTPUT_FORMATS, get_output_format, set_output_format
+
+    if output not in OUTPUT_FORMATS:
+        raise typer.BadParameter(f"must be one of: {', '.join(OUTPUT_FORMATS)}", param_hint="--output")
+    previous = get_output_format()
+    set_output_format(output)
+    ctx.call_on_close(lambda: set_output_format(previous))
+    if debug_http or os.environ.get("FEISHU_CLI_DEBUG_HTTP") == "1":
+        ctx.call_on_close(_echo_http_stats)
+
+
+def _echo_http_stats() -> None:
+    from feishu_cli.transport import transport_stats
+
+    stats = transport_stats()
+    if stats is not None:
+        typer.echo(json.dumps({"http_pool": stats}, ensure_ascii=False), err=True)
 
 
 if __name__ == "__main__":
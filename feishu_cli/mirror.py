@@ -0,0 +1,195 @@
+"""Local SQLite mirror of one bitable table (`bitable mirror refresh` / `query`).
+
+Every field becomes a typed column derived from the `field list` schema:
+numbers are REAL, dates/checkboxes INTEGER, plain-text-like fields TEXT,
+and structured values (people, attachments, links, multi-select...) JSON
+text that SQLite's json functions can query. `record_id`,
+`created_time` and `last_modified_time` are always present. The refresh
+watermark and schema live in a `_mirror_meta` table in the same file, so a
+mirror is self-contained and each refresh runs in one transaction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+REAL_FIELD_TYPES = frozenset({2})  # Number
+INTEGER_FIELD_TYPES = frozenset({5, 7, 1001, 1002})  # Date, Checkbox, Created/Modified time
+TEXT_FIELD_TYPES = frozenset({1, 3, 13, 1005})  # Text, Single select, Phone, Auto number
+SYSTEM_COLUMNS = (
+    ("record_id", "TEXT PRIMARY KEY"),
+    ("created_time", "INTEGER"),
+    ("last_modified_time", "INTEGER"),
+)
+META_TABLE = "_mirror_meta"
+
+
+def column_type(field_type: Any) -> str:
+    if field_type in REAL_FIELD_TYPES:
+        return "REAL"
+    if field_type in INTEGER_FIELD_TYPES:
+        return "INTEGER"
+    return "TEXT"
+
+
+def column_value(field_type: Any, value: Any) -> Any:
+    """Convert a list-API field value to the column's SQLite value."""
+    if value is None:
+        return None
+    if field_type in REAL_FIELD_TYPES or field_type in INTEGER_FIELD_TYPES:
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float)):
+            return value if field_type in REAL_FIELD_TYPES else int(value)
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        return number if field_type in REAL_FIELD_TYPES else int(number)
+    if field_type in TEXT_FIELD_TYPES:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list) and all(isinstance(item, dict) and "text" in item for item in value):
+            return "".join(str(item.get("text") or "") for item in value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class Mirror:
+    """A SQLite file holding one mirrored table plus its refresh metadata."""
+
+    def __init__(self, path: Path, name: str = "records") -> None:
+        self.path = path
+        self.name = name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {META_TABLE} ("
+            "name TEXT PRIMARY KEY, source TEXT, schema TEXT, watermark INTEGER, ids_checked_at REAL)"
+        )
+        # (field name, column name, field type); names differ only on collisions.
+        self.columns: List[Tuple[str, str, Any]] = []
+
+    def begin(self) -> None:
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self) -> None:
+        self.conn.execute("COMMIT")
+
+    def rollback(self) -> None:
+        if self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def meta(self) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            f"SELECT source, schema, watermark, ids_checked_at FROM {META_TABLE} WHERE name = ?", (self.name,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"source": row[0], "schema": row[1], "watermark": row[2] or 0, "ids_checked_at": row[3] or 0.0}
+
+    def save_meta(self, source: str, watermark: int, ids_checked_at: float) -> None:
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {META_TABLE} (name, source, schema, watermark, ids_checked_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self.name, source, schema_signature(self.columns), watermark, ids_checked_at),
+        )
+
+    def ensure_schema(self, fields: Sequence[Dict[str, Any]], source: str) -> bool:
+        """Create or rebuild the table for `fields`; return True when existing rows were dropped.
+
+        A different source table or any schema change rebuilds the mirror,
+        because existing rows lack the new columns until they are fetched again.
+        """
+        self.columns = assign_columns(fields)
+        meta = self.meta()
+        if meta is not None and meta["source"] == source and meta["schema"] == schema_signature(self.columns):
+            return False
+        self.conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(self.name)}")
+        declarations = [f"{name} {decl}" for name, decl in SYSTEM_COLUMNS]
+        declarations += [f"{quote_identifier(column)} {column_type(kind)}" for _name, column, kind in self.columns]
+        self.conn.execute(f"CREATE TABLE {quote_identifier(self.name)} ({', '.join(declarations)})")
+        self.conn.execute(f"DELETE FROM {META_TABLE} WHERE name = ?", (self.name,))
+        return meta is not None
+
+    def record_ids(self) -> set:
+        return {row[0] for row in self.conn.execute(f"SELECT record_id FROM {quote_identifier(self.name)}")}
+
+    def upsert(self, records: Iterable[Dict[str, Any]]) -> int:
+        names = [name for name, _decl in SYSTEM_COLUMNS] + [column for _name, column, _kind in self.columns]
+        placeholders = ", ".join("?" for _ in names)
+        sql = (
+            f"INSERT OR REPLACE INTO {quote_identifier(self.name)} "
+            f"({', '.join(quote_identifier(name) for name in names)}) VALUES ({placeholders})"
+        )
+        rows = [
+            [record.get("record_id"), record.get("created_time"), record.get("last_modified_time")]
+            + [column_value(kind, (record.get("fields") or {}).get(name)) for name, _column, kind in self.columns]
+            for record in records
+        ]
+        self.conn.executemany(sql, rows)
+        return len(rows)
+
+    def delete(self, record_ids: Sequence[str]) -> int:
+        self.conn.executemany(
+            f"DELETE FROM {quote_identifier(self.name)} WHERE record_id = ?", [(rid,) for rid in record_ids]
+        )
+        return len(record_ids)
+
+    def renamed(self) -> Dict[str, str]:
+        """Fields stored under a different column name, as `{field: column}`."""
+        return {name: column for name, column, _kind in self.columns if name != column}
+
+    def count(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(self.name)}").fetchone()[0]
+
+
+def assign_columns(fields: Sequence[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+    """Map fields to unique column names.
+
+    SQLite compares column names case-insensitively, so a field whose name
+    matches a system column or an earlier field ignoring case (`Name` and
+    `name`) gets a `_2`, `_3`... suffix instead of breaking `CREATE TABLE`.
+    """
+    taken = {name.lower() for name, _decl in SYSTEM_COLUMNS}
+    columns: List[Tuple[str, str, Any]] = []
+    for item in fields:
+        name = item.get("field_name")
+        if not name:
+            continue
+        column = name
+        suffix = 2
+        while column.lower() in taken:
+            column = f"{name}_{suffix}"
+            suffix += 1
+        taken.add(column.lower())
+        columns.append((name, column, item.get("type")))
+    return columns
+
+
+def schema_signature(columns: Sequence[Tuple[str, str, Any]]) -> str:
+    encoded = json.dumps([list(column) for column in columns], ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def run_query(path: Path, sql: str, params: Sequence[Any] = ()) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Run read-only SQL against a mirror file; return column names and row objects."""
+    conn = sqlite3.connect(path.resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(sql, params)
+        columns = [item[0] for item in cursor.description or []]
+        return columns, [dict(zip(columns, row)) for row in cursor.fetchall()]
+    finally:
+        conn.close()
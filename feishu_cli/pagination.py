@@ -0,0 +1,458 @@
+"""Generator-based pagination for list commands (`--all`)."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from pathlib import Path
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import lark_oapi as lark
+import typer
+
+from feishu_cli.projection import Projection
+from feishu_cli.runtime import call_api, capture_request_option
+from feishu_cli.utils.files import atomic_write_text
+from feishu_cli.utils.output import (
+    ItemStreamWriter,
+    format_error,
+    format_response,
+    raw_response_data,
+    to_jsonable,
+)
+
+
+RequestFactory = Callable[[Optional[str]], Any]
+
+ALL_PAGES_OPTION = typer.Option(
+    False, "--all", help="Follow page_token until exhausted, streaming items as they arrive."
+)
+LIMIT_OPTION = typer.Option(None, "--limit", min=1, help="Stop after this many items (implies --all).")
+MAX_PAGES_OPTION = typer.Option(None, "--max-pages", min=1, help="Stop after this many pages (implies --all).")
+PREFETCH_OPTION = typer.Option(
+    1, "--prefetch", min=0, help="With --all, pages fetched ahead while earlier ones are written (0 disables)."
+)
+CHECKPOINT_OPTION = typer.Option(
+    None,
+    "--checkpoint",
+    help="Persist progress to this file after each page and resume from it (implies --all).",
+)
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class PageOptions:
+    """Parsed pagination options of a list command (`--page-token`, `--all`, ...).
+
+    Fields follow the order the options are declared on every list command.
+    """
+
+    page_token: Optional[str] = None
+    all_pages: bool = False
+    limit: Optional[int] = None
+    max_pages: Optional[int] = None
+    prefetch: int = 1
+    checkpoint: Optional[Path] = None
+    select: Optional[Projection] = None
+
+    @property
+    def streaming(self) -> bool:
+        """True when any option asks for more than the single requested page."""
+        return bool(self.all_pages or self.limit or self.max_pages or self.checkpoint)
+
+
+@dataclass
+class Page:
+    """One successful list response."""
+
+    items: List[Any]
+    page_token: Optional[str]
+    has_more: bool
+    response: Any
+    request_token: Optional[str] = None
+    items_attr: str = "items"
+
+    def jsonable_items(self) -> List[Any]:
+        """Items as plain JSON values, read from the HTTP body when available."""
+        data = raw_response_data(self.response)
+        if isinstance(data, dict) and isinstance(data.get(self.items_attr), list):
+            return data[self.items_attr]
+        return [to_jsonable(item) for item in self.items]
+
+
+class PageError(Exception):
+    """A page request failed; `page_token` is the token that produced it."""
+
+    def __init__(self, response: Any, page_token: Optional[str]) -> None:
+        super().__init__(getattr(response, "msg", "page request failed"))
+        self.response = response
+        self.page_token = page_token
+
+
+def iter_pages(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request_factory: RequestFactory,
+    page_token: Optional[str] = None,
+    items_attr: str = "items",
+    max_pages: Optional[int] = None,
+    retry: Optional[bool] = None,
+) -> Iterator[Page]:
+    """Yield pages by following `page_token` / `has_more`; raise PageError on failure.
+
+    Pass `retry=True` for read-only listings sent as POST (e.g. search).
+    """
+    token = page_token or None
+    fetched = 0
+    while max_pages is None or fetched < max_pages:
+        response = call_api(client, api_method, request_factory(token), retry=retry)
+        if not response.success():
+            raise PageError(response, token)
+        fetched += 1
+        page = _to_page(response, items_attr, token)
+        yield page
+        if not page.has_more:
+            return
+        token = page.page_token
+
+
+def prefetch_pages(pages: Iterator[Page], depth: int = 1) -> Iterator[Page]:
+    """Iterate `pages` on a background thread, keeping up to `depth` pages ready.
+
+    The next request goes out as soon as the previous page's token is known,
+    overlapping network latency with output. Memory stays bounded by
+    `depth + 2` pages. Errors are re-raised in order on the consumer side.
+    """
+    if depth <= 0:
+        yield from pages
+        return
+    for _index, page in merge_pages([pages], depth):
+        yield page
+
+
+def merge_pages(sources: List[Iterator[Page]], depth: int = 1) -> Iterator[Tuple[int, Page]]:
+    """Drain several page iterators concurrently, yielding `(source_index, page)`.
+
+    Each source runs on its own thread; pages are yielded in arrival order,
+    with at most `depth` pages per source buffered. The first error from any
+    source is re-raised and the remaining sources are stopped.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, depth) * max(1, len(sources)))
+    stop = threading.Event()
+    request_context = capture_request_option()
+
+    def put(entry: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(index: int, pages: Iterator[Page]) -> None:
+        try:
+            with request_context():
+                for page in pages:
+                    if not put((index, page)):
+                        return
+            put(_DONE)
+        except BaseException as exc:  # re-raised by the consumer
+            put(exc)
+        finally:
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+
+    for index, pages in enumerate(sources):
+        threading.Thread(
+            target=produce, args=(index, pages), name=f"feishu-cli-pages-{index}", daemon=True
+        ).start()
+    running = len(sources)
+    try:
+        while running:
+            entry = buffer.get()
+            if entry is _DONE:
+                running -= 1
+                continue
+            if isinstance(entry, BaseException):
+                raise entry
+            yield entry
+    finally:
+        stop.set()
+
+
+def _to_page(response: Any, items_attr: str, request_token: Optional[str]) -> Page:
+    data = getattr(response, "data", None)
+    items = list(getattr(data, items_attr, None) or [])
+    next_token = getattr(data, "page_token", None) or None
+    has_more = bool(getattr(data, "has_more", False)) and next_token is not None
+    return Page(
+        items=items,
+        page_token=next_token if has_more else None,
+        has_more=has_more,
+        response=response,
+        request_token=request_token,
+        items_attr=items_attr,
+    )
+
+
+class CheckpointError(ValueError):
+    """The checkpoint file is unreadable or belongs to a different listing."""
+
+
+@dataclass
+class Checkpoint:
+    """Pagination progress persisted after every page.
+
+    `page_token` is the token of the next page to request and `skip` the
+    number of its items already emitted (non-zero only after `--limit`
+    stopped mid-page). Pages are recorded after they are written, so a crash
+    can re-emit at most the page in flight.
+    """
+
+    path: Path
+    fingerprint: str
+    page_token: Optional[str] = None
+    skip: int = 0
+    emitted: int = 0
+    pages: int = 0
+    done: bool = False
+    resumed: bool = field(default=False, compare=False)
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> "Checkpoint":
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path=path, fingerprint=fingerprint)
+        except (OSError, ValueError) as exc:
+            raise CheckpointError(f"Cannot read checkpoint {path}: {exc}")
+        if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+            raise CheckpointError(
+                f"Checkpoint {path} was written for a different listing; remove it or use another file."
+            )
+        return cls(
+            path=path,
+            fingerprint=fingerprint,
+            page_token=raw.get("page_token") or None,
+            skip=int(raw.get("skip") or 0),
+            emitted=int(raw.get("emitted") or 0),
+            pages=int(raw.get("pages") or 0),
+            done=bool(raw.get("done")),
+            resumed=True,
+        )
+
+    def advance(self, page_token: Optional[str], skip: int, emitted: int, done: bool = False) -> None:
+        self.page_token = page_token
+        self.skip = skip
+        self.emitted += emitted
+        self.pages += 1
+        self.done = done
+        self.save()
+
+    def save(self) -> None:
+        state = asdict(self)
+        state.pop("path")
+        state.pop("resumed")
+        atomic_write_text(self.path, json.dumps(state, ensure_ascii=False, indent=2))
+
+    def summary(self) -> dict:
+        return {"path": str(self.path), "resumed": self.resumed, "emitted": self.emitted, "done": self.done}
+
+
+def request_fingerprint(request: Any) -> str:
+    """Identify a listing by method, path, query parameters (minus page_token) and body."""
+    identity: dict = {
+        "method": getattr(getattr(request, "http_method", None), "name", None),
+        "uri": getattr(request, "uri", None),
+        "paths": getattr(request, "paths", None) or {},
+        "queries": sorted(
+            [str(key), str(value)] for key, value in (getattr(request, "queries", None) or [])
+            if key != "page_token"
+        ),
+    }
+    body = getattr(request, "body", None)
+    if body is not None:
+        identity["body"] = to_jsonable(body)
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def stream_all_pages(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request_factory: RequestFactory,
+    page_token: Optional[str] = None,
+    items_attr: str = "items",
+    limit: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 1,
+    checkpoint_path: Optional[Path] = None,
+    select: Optional[Projection] = None,
+    retry: Optional[bool] = None,
+) -> None:
+    """Stream every item of a paginated list as one JSON document, then exit.
+
+    Items are written as each page arrives while up to `prefetch` following
+    pages are fetched in the background, so memory stays bounded. The trailer
+    carries `page_token`/`has_more` for resuming when the walk stops early,
+    and a failed page ends the document with the error. With
+    `checkpoint_path`, progress is saved after each page and a rerun picks
+    up where the previous one stopped (a finished walk emits nothing).
+    `select` projects each item before it is written.
+    """
+    writer = ItemStreamWriter(items_attr)
+    checkpoint = None
+    skip = 0
+    if checkpoint_path is not None:
+        try:
+            checkpoint = Checkpoint.load(checkpoint_path, request_fingerprint(request_factory(None)))
+        except CheckpointError as exc:
+            typer.echo(format_error(code=2, msg=str(exc)))
+            raise typer.Exit(code=2)
+        if checkpoint.done:
+            writer.finish({"pages": 0, "has_more": False, "checkpoint": checkpoint.summary()})
+            raise typer.Exit(code=0)
+        if checkpoint.resumed:
+            page_token, skip = checkpoint.page_token, checkpoint.skip
+
+    pages = prefetch_pages(
+        iter_pages(client, api_method, request_factory, page_token, items_attr, max_pages, retry), prefetch
+    )
+    resume_token = page_token or None
+    has_more = False
+    page_count = 0
+    try:
+        for page in pages:
+            page_count += 1
+            offset, skip = skip, 0
+            items = page.jsonable_items()[offset:]
+            remaining = None if limit is None else limit - writer.count
+            taken = items[:remaining]
+            for item in taken:
+                writer.write_item(select.apply(item) if select is not None else item)
+            writer.flush()
+            if remaining is not None and remaining < len(items):
+                # Stopped mid-page: the page token would skip the rest of it.
+                resume_token, has_more = None, True
+                if checkpoint is not None:
+                    checkpoint.advance(page.request_token, offset + len(taken), len(taken))
+                break
+            resume_token, has_more = page.page_token, page.has_more
+            if checkpoint is not None:
+                checkpoint.advance(page.page_token, 0, len(taken), done=not page.has_more)
+            if limit is not None and writer.count >= limit:
+                break
+    except PageError as exc:
+        trailer = {"pages": page_count, "has_more": True, "page_token": exc.page_token}
+        if checkpoint is not None:
+            trailer["checkpoint"] = checkpoint.summary()
+        writer.finish_error(
+            trailer=trailer,
+            code=exc.response.code,
+            msg=exc.response.msg,
+            log_id=exc.response.get_log_id(),
+            attempts=getattr(exc.response, "attempts", None),
+        )
+        raise typer.Exit(code=1)
+    finally:
+        pages.close()
+    trailer = {"pages": page_count, "has_more": has_more}
+    if resume_token:
+        trailer["page_token"] = resume_token
+    if checkpoint is not None:
+        trailer["checkpoint"] = checkpoint.summary()
+    writer.finish(trailer)
+    raise typer.Exit(code=0)
+
+
+def run_list_command(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request_factory: RequestFactory,
+    options: PageOptions,
+    items_attr: str = "items",
+    retry: Optional[bool] = None,
+) -> None:
+    """Print one page, or stream every page when `options` ask for it, then exit."""
+    if options.streaming:
+        stream_all_pages(
+            client,
+            api_method,
+            request_factory,
+            options.page_token,
+            items_attr,
+            limit=options.limit,
+            max_pages=options.max_pages,
+            prefetch=options.prefetch,
+            checkpoint_path=options.checkpoint,
+            select=options.select,
+            retry=retry,
+        )
+    response = call_api(client, api_method, request_factory(options.page_token), retry=retry)
+    typer.echo(format_response(response, select=options.select))
+    raise typer.Exit(code=0 if response.success() else 1)
+
+
+def stream_merged_pages(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request_factories: List[RequestFactory],
+    items_attr: str = "items",
+    dedupe_key: Optional[Callable[[Any], Any]] = None,
+    prefetch: int = 1,
+    select: Optional[Projection] = None,
+    trailer: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Walk several listings concurrently and stream their items as one document.
+
+    Used for sharded exports: each factory describes one disjoint slice and is
+    paginated on its own thread. Items whose `dedupe_key` (applied to the JSON
+    form of each item) was already emitted are dropped, so a record that moves
+    between slices mid-walk is still written once. `trailer` adds keys to the
+    closing summary.
+    """
+    writer = ItemStreamWriter(items_attr)
+    sources = [
+        iter_pages(client, api_method, factory, items_attr=items_attr) for factory in request_factories
+    ]
+    merged = merge_pages(sources, prefetch)
+    seen = set()
+    duplicates = 0
+    page_count = 0
+    try:
+        for _index, page in merged:
+            page_count += 1
+            for item in page.jsonable_items():
+                if dedupe_key is not None:
+                    key = dedupe_key(item)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                writer.write_item(select.apply(item) if select is not None else item)
+            writer.flush()
+    except PageError as exc:
+        writer.finish_error(
+            trailer={"pages": page_count, "has_more": True, "shards": len(sources)},
+            code=exc.response.code,
+            msg=exc.response.msg,
+            log_id=exc.response.get_log_id(),
+            attempts=getattr(exc.response, "attempts", None),
+        )
+        raise typer.Exit(code=1)
+    finally:
+        merged.close()
+    writer.finish({
+        "pages": page_count,
+        "has_more": False,
+        "shards": len(sources),
+        "duplicates_skipped": duplicates,
+        **(trailer or {}),
+    })
+    raise typer.Exit(code=0)
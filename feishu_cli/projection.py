@@ -0,0 +1,130 @@
+"""Field projection (`--select`) for list output.
+
+A selection is a comma-separated list of dotted paths relative to each list
+item, e.g. `record_id,fields.Name`. A `*` segment matches every element of a
+list or every key of an object (`children.*.block_id`). Missing paths are
+left out instead of being emitted as null, so the output only carries what
+was asked for.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import typer
+
+
+SELECT_OPTION = typer.Option(
+    None,
+    "--select",
+    help="Comma-separated dotted paths to keep in each item, e.g. record_id,fields.Name; "
+    "'*' matches every list element or key.",
+)
+
+WILDCARD = "*"
+
+_LEAF: Dict[str, Any] = {}
+_MISSING = object()
+
+
+class Projection:
+    """A parsed `--select` value, applied to plain JSON items."""
+
+    def __init__(self, paths: List[List[str]]) -> None:
+        self.paths = paths
+        self._tree = _build_tree(paths)
+
+    @classmethod
+    def parse(cls, raw: Optional[str]) -> Optional["Projection"]:
+        """Parse `--select`; None or blank means no projection."""
+        if raw is None or not raw.strip():
+            return None
+        paths: List[List[str]] = []
+        for item in raw.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            segments = item.split(".")
+            if any(not segment.strip() for segment in segments):
+                raise ValueError(f"empty path segment in --select entry {item!r}")
+            paths.append([segment.strip() for segment in segments])
+        if not paths:
+            raise ValueError("--select needs at least one path")
+        return cls(paths)
+
+    def apply(self, item: Any) -> Any:
+        """Return `item` reduced to the selected paths."""
+        projected = _apply(item, self._tree)
+        return {} if projected is _MISSING else projected
+
+    def apply_data(self, data: Any, items_key: Optional[str]) -> Any:
+        """Project each item of a list-shaped `data` payload, keeping the rest."""
+        if not isinstance(data, dict) or items_key is None or not isinstance(data.get(items_key), list):
+            return data
+        projected = dict(data)
+        projected[items_key] = [self.apply(item) for item in data[items_key]]
+        return projected
+
+    def top_level_names(self, root: str) -> Optional[List[str]]:
+        """Return the keys selected directly under `root`, or None if all of it is needed.
+
+        Used for API pushdown (e.g. bitable `field_names` for `fields.*`).
+        Returns an empty list when nothing under `root` is selected.
+        """
+        subtree = self._tree.get(root)
+        if subtree is None:
+            return [] if WILDCARD not in self._tree else None
+        if subtree is _LEAF or WILDCARD in subtree or WILDCARD in self._tree:
+            return None
+        return list(subtree)
+
+
+def parse_select(raw: Optional[str]) -> Optional[Projection]:
+    """Parse `--select`, exiting with a parameter error on malformed paths."""
+    from feishu_cli.utils.output import format_error
+
+    try:
+        return Projection.parse(raw)
+    except ValueError as exc:
+        typer.echo(format_error(code=2, msg=str(exc)))
+        raise typer.Exit(code=2)
+
+
+def _build_tree(paths: List[List[str]]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for index, segment in enumerate(path):
+            last = index == len(path) - 1
+            child = node.get(segment)
+            if child is _LEAF:
+                break
+            if last:
+                node[segment] = _LEAF
+                break
+            if child is None:
+                child = node[segment] = {}
+            node = child
+    return tree
+
+
+def _apply(value: Any, tree: Dict[str, Any]) -> Any:
+    if tree is _LEAF:
+        return value
+    if isinstance(value, list):
+        subtree = tree.get(WILDCARD, tree)
+        projected = [_apply(element, subtree) for element in value]
+        return [element for element in projected if element is not _MISSING]
+    if not isinstance(value, dict):
+        return _MISSING
+    result: Dict[str, Any] = {}
+    wildcard = tree.get(WILDCARD)
+    keys = value.keys() if wildcard is not None else [key for key in tree if key in value]
+    for key in keys:
+        subtree = tree.get(key, wildcard)
+        if subtree is None:
+            continue
+        projected = _apply(value[key], subtree)
+        if projected is not _MISSING:
+            result[key] = projected
+    return result
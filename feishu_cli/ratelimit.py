@@ -0,0 +1,174 @@
+"""Client-side token-bucket rate limiting keyed by Feishu API family.
+
+An API family is the SDK resource path, e.g. `bitable.v1.app_table_record`
+for `client.bitable.v1.app_table_record.list`. Limits are matched by the
+longest configured prefix, optionally restricted to reads or writes with a
+`:read` / `:write` suffix. Buckets are process-wide, so concurrent batch
+lines and daemon requests share one budget per family.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+# pattern -> requests per second. Overridable via FEISHU_RATE_LIMITS.
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "bitable.v1.app_table_record:write": 10.0,
+    "docx.v1.document_block_children:write": 3.0,
+    "sheets.v3": 20.0,
+}
+# Final URI segments of POST endpoints that only read, e.g. `.../records/search`.
+READ_ONLY_ACTIONS = frozenset({"search", "query", "batch_get", "batch_query", "mget"})
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a slot and sleep the returned delay."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` now and return how long to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Maps API calls to shared token buckets."""
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None) -> None:
+        self._limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def limits(self) -> Dict[str, float]:
+        return dict(self._limits)
+
+    def bucket_for(self, api_method: Callable[..., Any], request: Any) -> Optional[TokenBucket]:
+        """Return the bucket governing this call, or None when it is unlimited."""
+        family = api_family(api_method)
+        if family is None:
+            return None
+        pattern = self._match(family, "write" if is_write_request(request) else "read")
+        if pattern is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(pattern)
+            if bucket is None:
+                bucket = TokenBucket(self._limits[pattern])
+                self._buckets[pattern] = bucket
+            return bucket
+
+    def acquire(self, api_method: Callable[..., Any], request: Any) -> float:
+        """Block until the call may proceed; return the time waited."""
+        bucket = self.bucket_for(api_method, request)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, api_method: Callable[..., Any], request: Any) -> float:
+        """Async variant of acquire that yields to the event loop while waiting."""
+        bucket = self.bucket_for(api_method, request)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _match(self, family: str, kind: str) -> Optional[str]:
+        best: Optional[str] = None
+        best_key: Tuple[int, int] = (-1, -1)
+        for pattern, rate in self._limits.items():
+            if rate <= 0:
+                continue
+            prefix, _, pattern_kind = pattern.partition(":")
+            if pattern_kind and pattern_kind != kind:
+                continue
+            if family != prefix and not family.startswith(prefix + "."):
+                continue
+            # Longer prefixes win; a kind-specific pattern beats a generic one.
+            key = (len(prefix), 1 if pattern_kind else 0)
+            if key > best_key:
+                best, best_key = pattern, key
+        return best
+
+
+def api_family(api_method: Callable[..., Any]) -> Optional[str]:
+    """Return `domain.version.resource` for an SDK resource method."""
+    owner = getattr(api_method, "__self__", None)
+    module = type(owner).__module__ if owner is not None else ""
+    if not module.startswith("lark_oapi.api."):
+        return None
+    parts = [part for part in module[len("lark_oapi.api."):].split(".") if part != "resource"]
+    return ".".join(parts) or None
+
+
+def is_write_request(request: Any) -> bool:
+    """Return True for SDK requests that modify data.
+
+    GETs are reads, and so are POSTs to read-only endpoints such as
+    `app_table_record.search`, which only use POST to carry a filter body.
+    """
+    method = getattr(request, "http_method", None)
+    if getattr(method, "name", "GET") == "GET":
+        return False
+    uri = getattr(request, "uri", None)
+    action = uri.rstrip("/").rsplit("/", 1)[-1] if isinstance(uri, str) else ""
+    return action not in READ_ONLY_ACTIONS
+
+
+def parse_rate_limits(raw: str) -> Dict[str, float]:
+    """Parse `family[:read|write]=QPS,...`; a rate of 0 disables the pattern."""
+    limits: Dict[str, float] = {}
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        pattern, sep, value = item.rpartition("=")
+        pattern = pattern.strip()
+        if not sep or not pattern:
+            raise ValueError(f"expected family=qps, got {item!r}")
+        _prefix, _, kind = pattern.partition(":")
+        if kind not in ("", "read", "write"):
+            raise ValueError(f"unknown request kind {kind!r} in {item!r}")
+        rate = float(value)
+        if rate < 0:
+            raise ValueError(f"rate must not be negative in {item!r}")
+        limits[pattern] = rate
+    return limits
+
+
+_LIMITER: Optional[RateLimiter] = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def configure_rate_limiter(overrides: Iterable[Tuple[str, float]] = ()) -> RateLimiter:
+    """Install (or reuse) the process-wide limiter with `overrides` applied to the defaults."""
+    global _LIMITER
+    limits = dict(DEFAULT_RATE_LIMITS)
+    limits.update(overrides)
+    with _LIMITER_LOCK:
+        if _LIMITER is None or _LIMITER.limits != limits:
+            _LIMITER = RateLimiter(limits)
+        return _LIMITER
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter, creating it with defaults if needed."""
+    limiter = _LIMITER
+    return limiter if limiter is not None else configure_rate_limiter()
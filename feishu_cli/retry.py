@@ -0,0 +1,108 @@
+"""Retry classification and backoff for Feishu API calls."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import random
+import threading
+from typing import Any, Optional
+
+import httpx
+import requests
+
+
+# Feishu error codes that mean "try again later" rather than "this request is wrong".
+RETRYABLE_CODES = frozenset({
+    99991400,  # app/tenant request frequency limit
+    1254290,  # bitable: too many requests
+    1254291,  # bitable: write conflict
+    1254607,  # bitable: data not ready
+    1255040,  # bitable: request timed out
+})
+RETRYABLE_HTTP_STATUS = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+RETRY_HINT_HEADERS = ("x-ogw-ratelimit-reset", "retry-after")
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError,
+    # The SDK decodes every body as JSON; gateways answer 5xx with HTML.
+    json.JSONDecodeError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, capped, honouring server hints."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int, hint: Optional[float] = None) -> float:
+        """Return the delay before attempt `attempt + 1`."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if hint is not None:
+            delay = min(max(hint, 0.0), self.max_delay) + random.uniform(0, self.base_delay)
+        return delay
+
+
+def is_retry_safe(request: Any) -> bool:
+    """Reads and idempotent writes may be repeated; other writes need a client_token."""
+    method = getattr(getattr(request, "http_method", None), "name", "GET")
+    if method in IDEMPOTENT_HTTP_METHODS:
+        return True
+    if getattr(request, "client_token", None):
+        return True
+    queries = getattr(request, "queries", None) or []
+    return any(key == "client_token" and value for key, value in queries)
+
+
+def is_retryable_response(response: Any) -> bool:
+    """Return True for throttling codes and transient HTTP statuses."""
+    success = getattr(response, "success", None)
+    if not callable(success) or success() is True:
+        return False
+    if getattr(response, "code", None) in RETRYABLE_CODES:
+        return True
+    raw = getattr(response, "raw", None)
+    return getattr(raw, "status_code", None) in RETRYABLE_HTTP_STATUS
+
+
+def is_retryable_exception(exc: BaseException) -> bool:
+    return isinstance(exc, RETRYABLE_EXCEPTIONS)
+
+
+def retry_hint(response: Any) -> Optional[float]:
+    """Seconds the server asked us to wait, from rate-limit or Retry-After headers."""
+    headers = getattr(getattr(response, "raw", None), "headers", None)
+    if not isinstance(headers, dict):
+        return None
+    lowered = {str(key).lower(): value for key, value in headers.items()}
+    for name in RETRY_HINT_HEADERS:
+        try:
+            return float(lowered[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+_POLICY = RetryPolicy()
+_POLICY_LOCK = threading.Lock()
+
+
+def configure_retry_policy(max_attempts: int, base_delay: float) -> RetryPolicy:
+    """Install the process-wide retry policy."""
+    global _POLICY
+    with _POLICY_LOCK:
+        if (_POLICY.max_attempts, _POLICY.base_delay) != (max_attempts, base_delay):
+            _POLICY = RetryPolicy(max_attempts=max_attempts, base_delay=base_delay)
+        return _POLICY
+
+
+def get_retry_policy() -> RetryPolicy:
+    return _POLICY
@@ -1,15 +1,206 @@
 """Runtime helpers shared across command modules."""
 
-from typing import Any, Callable
+import asyncio
+from contextlib import contextmanager, nullcontext
+import copy
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Awaitable, Callable, ContextManager, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import lark_oapi as lark
+from lark_oapi.core.model import RequestOption
 
 from feishu_cli.auth.session import resolve_user_request_option
+from feishu_cli.ratelimit import get_rate_limiter
+from feishu_cli.retry import (
+    get_retry_policy,
+    is_retry_safe,
+    is_retryable_exception,
+    is_retryable_response,
+    retry_hint,
+)
+from feishu_cli.transport import get_transport
 
 
-def call_api(client: lark.Client, api_method: Callable[..., Any], request: Any) -> Any:
-    """Call SDK API method with user-priority auth option when available."""
-    option = resolve_user_request_option(client)
-    if option is None:
-        return api_method(request)
-    return api_method(request, option)
+DEFAULT_CONCURRENCY = 8
+
+_state = threading.local()
+_UNPINNED = object()
+
+T = TypeVar("T")
+
+
+def call_api(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request: Any,
+    retry: Optional[bool] = None,
+) -> Any:
+    """Call SDK API method with user-priority auth option when available.
+
+    Calls are paced by the process-wide per-family rate limiter. Transient
+    failures are retried with backoff when the request is safe to repeat
+    (see `retry.is_retry_safe`; pass `retry=True` for read-only POSTs).
+    The attempt count is stored on the response as `attempts`.
+    """
+    option = _current_request_option(client)
+    args = (request,) if option is None else (request, option)
+    policy = get_retry_policy()
+    max_attempts = _max_attempts(request, retry)
+    attempt = 0
+    while True:
+        attempt += 1
+        get_rate_limiter().acquire(api_method, request)
+        try:
+            response = api_method(*args)
+        except Exception as exc:
+            if attempt >= max_attempts or not is_retryable_exception(exc):
+                raise
+            time.sleep(policy.backoff(attempt))
+            continue
+        if attempt < max_attempts and is_retryable_response(response):
+            time.sleep(policy.backoff(attempt, retry_hint(response)))
+            continue
+        return _record_attempts(response, attempt)
+
+
+async def async_call_api(
+    client: lark.Client,
+    api_method: Callable[..., Any],
+    request: Any,
+    retry: Optional[bool] = None,
+) -> Any:
+    """Async counterpart of call_api (same pacing and retry rules).
+
+    `api_method` may be a sync SDK method (e.g. `...app_table_record.list`);
+    its `a`-prefixed async variant is used when the SDK provides one,
+    otherwise the call runs in a worker thread.
+    """
+    option = _current_request_option(client)
+    args = (request,) if option is None else (request, option)
+    async_method = _async_variant(api_method)
+    policy = get_retry_policy()
+    max_attempts = _max_attempts(request, retry)
+    attempt = 0
+    while True:
+        attempt += 1
+        await get_rate_limiter().aacquire(api_method, request)
+        try:
+            if async_method is not None:
+                response = await async_method(*args)
+            else:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(None, functools.partial(api_method, *args))
+        except Exception as exc:
+            if attempt >= max_attempts or not is_retryable_exception(exc):
+                raise
+            await asyncio.sleep(policy.backoff(attempt))
+            continue
+        if attempt < max_attempts and is_retryable_response(response):
+            await asyncio.sleep(policy.backoff(attempt, retry_hint(response)))
+            continue
+        return _record_attempts(response, attempt)
+
+
+async def gather_limited(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Await coroutine factories with at most `concurrency` in flight; keep input order."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(
+        *(_run(factory) for factory in factories), return_exceptions=return_exceptions
+    )
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """Run a coroutine on a fresh event loop, closing its pooled HTTP client after."""
+
+    async def _main() -> T:
+        try:
+            return await awaitable
+        finally:
+            transport = get_transport()
+            if transport is not None:
+                await transport.aclose()
+
+    return asyncio.run(_main())
+
+
+def call_api_many(
+    client: lark.Client,
+    calls: Iterable[Tuple[Callable[..., Any], Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Issue `(api_method, request)` pairs concurrently from one thread.
+
+    Responses are returned in input order.
+    """
+    factories = [
+        (lambda method=method, request=request: async_call_api(client, method, request))
+        for method, request in calls
+    ]
+    return run_async(gather_limited(factories, concurrency, return_exceptions))
+
+
+@contextmanager
+def pinned_request_option(option: Optional[RequestOption]) -> Iterator[None]:
+    """Make call_api reuse one resolved option on this thread."""
+    previous = getattr(_state, "pinned_option", _UNPINNED)
+    _state.pinned_option = option
+    try:
+        yield
+    finally:
+        _state.pinned_option = previous
+
+
+def capture_request_option() -> Callable[[], ContextManager[None]]:
+    """Capture this thread's pinned option so a worker thread can reuse it.
+
+    Returns a factory of context managers to enter on the worker thread.
+    """
+    pinned = getattr(_state, "pinned_option", _UNPINNED)
+    if pinned is _UNPINNED:
+        return nullcontext
+    return lambda: pinned_request_option(pinned)
+
+
+def _current_request_option(client: lark.Client) -> Optional[RequestOption]:
+    pinned = getattr(_state, "pinned_option", _UNPINNED)
+    if pinned is not _UNPINNED:
+        # The SDK writes fetched tenant tokens into the option; keep the pin clean.
+        return copy.copy(pinned) if pinned is not None else None
+    return resolve_user_request_option(client)
+
+
+def _max_attempts(request: Any, retry: Optional[bool]) -> int:
+    safe = is_retry_safe(request) if retry is None else retry
+    return get_retry_policy().max_attempts if safe else 1
+
+
+def _record_attempts(response: Any, attempts: int) -> Any:
+    try:
+        response.attempts = attempts
+    except AttributeError:
+        pass
+    return response
+
+
+def _async_variant(api_method: Callable[..., Any]) -> Optional[Callable[..., Awaitable[Any]]]:
+    if inspect.iscoroutinefunction(api_method):
+        return api_method
+    owner = getattr(api_method, "__self__", None)
+    name = getattr(api_method, "__name__", None)
+    if owner is None or not name:
+        return None
+    candidate = getattr(owner, "a" + name, None)
+    return candidate if inspect.iscoroutinefunction(candidate) else None
@@ -0,0 +1,273 @@
+"""Cached bitable field schemas and local validation of record payloads.
+
+`field list` results are kept in a shared JSON file for `FEISHU_SCHEMA_TTL`
+seconds (default 300, `0` disables caching), so repeated writes to the same
+table do not re-fetch the schema. Payloads are checked and coerced against
+it before sending: CSV strings become numbers, dates, checkboxes, select
+lists or person/link lists, and rows naming unknown fields, read-only
+fields or unknown select options are rejected without a round trip.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import typer
+
+from feishu_cli.utils.files import atomic_write_text, file_lock
+
+
+DEFAULT_SCHEMA_TTL = 300.0
+VALIDATE_OPTION = typer.Option(
+    False, "--validate", help="Check and coerce fields against the table's (cached) schema before sending"
+)
+
+TEXT = 1
+NUMBER = 2
+SINGLE_SELECT = 3
+MULTI_SELECT = 4
+DATE = 5
+CHECKBOX = 7
+USER = 11
+PHONE = 13
+URL = 15
+LINK_TYPES = frozenset({18, 21})
+# Lookup, formula, created/modified time, created/modified by, auto number.
+READ_ONLY_TYPES = frozenset({19, 20, 1001, 1002, 1003, 1004, 1005})
+
+_TRUE = {"true", "1", "yes", "y", "是", "x", "✓"}
+_FALSE = {"false", "0", "no", "n", "否", ""}
+
+
+def _default_schema_cache_file() -> Path:
+    return Path.home() / ".config" / "feishu-cli" / "field_schema.json"
+
+
+def get_schema_cache_path() -> Path:
+    """Return the configured field schema cache path."""
+    raw = os.environ.get("FEISHU_SCHEMA_CACHE_FILE")
+    return Path(raw).expanduser() if raw else _default_schema_cache_file()
+
+
+def schema_ttl() -> float:
+    """Return the schema cache TTL in seconds from `FEISHU_SCHEMA_TTL`."""
+    raw = os.environ.get("FEISHU_SCHEMA_TTL", "").strip()
+    if not raw:
+        return DEFAULT_SCHEMA_TTL
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if value < 0:
+        raise ValueError(f"FEISHU_SCHEMA_TTL must be a non-negative number, got {raw!r}.")
+    return value
+
+
+class SchemaCache:
+    """Field lists keyed by `app_token/table_id`, persisted to a locked JSON file."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None) -> None:
+        self._path = path or get_schema_cache_path()
+        self._ttl = schema_ttl() if ttl is None else ttl
+        self._memory: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+        self._memory_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        if self._ttl <= 0:
+            return None
+        now = time.time()
+        with self._memory_lock:
+            cached = self._memory.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        with file_lock(self._path, shared=True):
+            entry = self._read_entries().get(key)
+        if not isinstance(entry, dict):
+            return None
+        fields = entry.get("fields")
+        expire = entry.get("expire")
+        if not isinstance(fields, list) or not isinstance(expire, (int, float)) or expire <= now:
+            return None
+        with self._memory_lock:
+            self._memory[key] = (fields, float(expire))
+        return fields
+
+    def set(self, key: str, fields: List[Dict[str, Any]]) -> None:
+        if self._ttl <= 0:
+            return
+        now = time.time()
+        expire = now + self._ttl
+        with self._memory_lock:
+            self._memory[key] = (fields, expire)
+        self._update(lambda entries: entries.__setitem__(key, {"fields": fields, "expire": expire}), now)
+
+    def invalidate(self, key: str) -> None:
+        """Drop `key`, e.g. after a field was created, updated or deleted."""
+        with self._memory_lock:
+            self._memory.pop(key, None)
+        if self._path.exists():
+            self._update(lambda entries: entries.pop(key, None), time.time())
+
+    def _update(self, change: Callable[[Dict[str, Any]], Any], now: float) -> None:
+        with file_lock(self._path):
+            entries = {
+                k: v
+                for k, v in self._read_entries().items()
+                if isinstance(v, dict) and isinstance(v.get("expire"), (int, float)) and v["expire"] > now
+            }
+            change(entries)
+            atomic_write_text(self._path, json.dumps(entries, ensure_ascii=False))
+
+    def _read_entries(self) -> dict:
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return raw if isinstance(raw, dict) else {}
+
+
+class FieldSchema:
+    """A table's fields by name, used to validate and coerce record payloads."""
+
+    def __init__(self, fields: List[Dict[str, Any]]) -> None:
+        self.types: Dict[str, Any] = {}
+        self.options: Dict[str, set] = {}
+        for item in fields:
+            name = item.get("field_name")
+            if not name:
+                continue
+            self.types[name] = item.get("type")
+            options = (item.get("property") or {}).get("options")
+            if isinstance(options, list):
+                self.options[name] = {option.get("name") for option in options if isinstance(option, dict)}
+
+    def coerce(self, fields: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Return the coerced payload and one message per invalid field."""
+        coerced: Dict[str, Any] = {}
+        errors: List[str] = []
+        for name, value in fields.items():
+            if name not in self.types:
+                errors.append(f"{name}: unknown field")
+                continue
+            field_type = self.types[name]
+            if field_type in READ_ONLY_TYPES:
+                errors.append(f"{name}: field is read-only")
+                continue
+            if value is None:
+                coerced[name] = None
+                continue
+            try:
+                coerced[name] = self._coerce_value(name, field_type, value)
+            except ValueError as exc:
+                errors.append(f"{name}: {exc}")
+        return coerced, errors
+
+    def _coerce_value(self, name: str, field_type: Any, value: Any) -> Any:
+        if field_type in (TEXT, PHONE):
+            if isinstance(value, bool) or not isinstance(value, (str, int, float, list)):
+                raise ValueError("expected text")
+            return value if isinstance(value, (str, list)) else _number_text(value)
+        if field_type == NUMBER:
+            return _number(value)
+        if field_type == SINGLE_SELECT:
+            if not isinstance(value, str):
+                raise ValueError("expected an option name")
+            self._check_options(name, [value])
+            return value
+        if field_type == MULTI_SELECT:
+            names = _string_list(value, "option names")
+            self._check_options(name, names)
+            return names
+        if field_type == DATE:
+            return _timestamp(value)
+        if field_type == CHECKBOX:
+            return _checkbox(value)
+        if field_type == USER:
+            if isinstance(value, list) and all(isinstance(item, dict) and item.get("id") for item in value):
+                return value
+            return [{"id": item} for item in _string_list(value, "user ids")]
+        if field_type == URL:
+            if isinstance(value, dict) and isinstance(value.get("link"), str):
+                return value
+            if not isinstance(value, str):
+                raise ValueError("expected a link")
+            return {"link": value, "text": value}
+        if field_type in LINK_TYPES:
+            return _string_list(value, "record ids")
+        return value
+
+    def _check_options(self, name: str, names: List[str]) -> None:
+        known = self.options.get(name)
+        if known is None:
+            return
+        unknown = [item for item in names if item not in known]
+        if unknown:
+            raise ValueError(f"unknown option(s): {', '.join(unknown)}")
+
+
+def _number(value: Any) -> Any:
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            number = float(value.strip().replace(",", ""))
+        except ValueError:
+            raise ValueError(f"expected a number, got {value!r}")
+        return int(number) if number.is_integer() else number
+    raise ValueError("expected a number")
+
+
+def _number_text(value: Any) -> str:
+    return str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+
+
+def _timestamp(value: Any) -> int:
+    """Accept epoch milliseconds or an ISO date/time (local time)."""
+    if isinstance(value, bool):
+        raise ValueError("expected a timestamp")
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.isdigit():
+            return int(text)
+        try:
+            return int(datetime.fromisoformat(text).timestamp() * 1000)
+        except ValueError:
+            pass
+    raise ValueError(f"expected epoch milliseconds or an ISO date, got {value!r}")
+
+
+def _checkbox(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    raise ValueError(f"expected a checkbox value, got {value!r}")
+
+
+def _string_list(value: Any, what: str) -> List[str]:
+    """Accept a list of strings or a comma-separated string (as CSV cells are)."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return value
+    raise ValueError(f"expected a list of {what}")
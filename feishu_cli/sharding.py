@@ -0,0 +1,105 @@
+"""Split a bitable table into disjoint record ranges for parallel export.
+
+Shards are list-API `filter` formulas over one ordered field. The first and
+last ranges are open-ended and a final complement shard matches everything
+the ranges do not (blank values included), so the shards partition the
+table: every record matches exactly one of them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+
+
+NUMBER_FIELD_TYPES = frozenset({2})  # Number
+DATE_FIELD_TYPES = frozenset({5, 1001, 1002})  # Date, Created time, Modified time
+SHARDABLE_FIELD_TYPES = NUMBER_FIELD_TYPES | DATE_FIELD_TYPES
+
+
+def field_ref(field_name: str) -> str:
+    return f"CurrentValue.[{field_name}]"
+
+
+def plan_shard_filters(
+    field_name: str,
+    field_type: int,
+    lower: Any,
+    upper: Any,
+    shards: int,
+) -> List[Optional[str]]:
+    """Return filter formulas that partition the table into up to `shards + 1` parts.
+
+    `lower`/`upper` are the smallest and largest values observed for the
+    field (numbers, or epoch milliseconds for date fields). Stale bounds only
+    unbalance the shards; they never drop or duplicate records. Without
+    bounds (an empty table, or no record has the field set) there is
+    nothing to split, so a single unfiltered shard (`None`) is returned.
+    """
+    if field_type not in SHARDABLE_FIELD_TYPES:
+        raise ValueError(f"field type {field_type} cannot be used for sharding")
+    if lower is None or upper is None:
+        return [None]
+    boundaries = _boundaries(field_type, lower, upper, shards)
+    ref = field_ref(field_name)
+    ranges: List[str] = []
+    if not boundaries:
+        ranges.append(f"{ref}>={_literal(field_type, lower)}")
+    else:
+        ranges.append(f"{ref}<{boundaries[0]}")
+        for low, high in zip(boundaries, boundaries[1:]):
+            ranges.append(f"AND({ref}>={low},{ref}<{high})")
+        ranges.append(f"{ref}>={boundaries[-1]}")
+    filters: List[Optional[str]] = [*ranges, f"NOT(OR({','.join(ranges)}))"]
+    return filters
+
+
+def _boundaries(field_type: int, lower: Any, upper: Any, shards: int) -> List[str]:
+    """Return the N-1 interior cut points as formula literals (deduplicated, ascending)."""
+    if shards <= 1 or lower is None or upper is None:
+        return []
+    if field_type in DATE_FIELD_TYPES:
+        first = _to_date(lower)
+        days = (_to_date(upper) - first).days + 1
+        step = days / shards
+        cuts = sorted({first + timedelta(days=round(step * i)) for i in range(1, shards)})
+        return [_date_literal(cut) for cut in cuts if first < cut]
+    low, high = float(lower), float(upper)
+    if high <= low:
+        return []
+    step = (high - low) / shards
+    cuts = sorted({low + step * i for i in range(1, shards)})
+    return [_number_literal(cut) for cut in cuts]
+
+
+def _literal(field_type: int, value: Any) -> str:
+    if field_type in DATE_FIELD_TYPES:
+        return _date_literal(_to_date(value))
+    return _number_literal(float(value))
+
+
+def _to_date(value: Any) -> datetime:
+    day = datetime.fromtimestamp(float(value) / 1000)
+    return day.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _date_literal(value: datetime) -> str:
+    return f'TODATE("{value.strftime("%Y-%m-%d")}")'
+
+
+def _number_literal(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def sortable_value(value: Any) -> Optional[float]:
+    """Extract a comparable number from a list-API field value (None if blank)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
@@ -0,0 +1,134 @@
+"""Diff a keyed dataset against a bitable table for `record sync`.
+
+The table is indexed as `key -> (record_id, content hash)`, where the hash
+covers the managed fields (the columns present in the dataset) after
+normalising list-API values to what a caller would write: rich text
+segments become plain text, people become their ids, numbers become
+canonical text. Only rows whose hash differs are updated, so unchanged
+records cost nothing and keep their record ids. A managed field a row
+leaves out (an empty CSV cell, a missing JSONL key) counts as blank and is
+sent as null, so the stored value is cleared rather than compared forever.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from feishu_cli.bulk import Row
+
+
+@dataclass
+class SyncPlan:
+    """Rows to create (fields), update ({record_id, fields}) and delete (record ids)."""
+
+    creates: List[Row] = field(default_factory=list)
+    updates: List[Row] = field(default_factory=list)
+    deletes: List[Row] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def plain_value(value: Any) -> Any:
+    """Normalise a field value for comparison; blank values become None."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        number = float(value)
+        return str(int(number)) if number.is_integer() else repr(number)
+    if isinstance(value, str):
+        return value if value != "" else None
+    if isinstance(value, list):
+        if value and all(isinstance(item, dict) and "text" in item and "id" not in item for item in value):
+            return plain_value("".join(str(item.get("text") or "") for item in value))
+        items = [plain_value(item) for item in value]
+        items = [item for item in items if item is not None]
+        return items or None
+    if isinstance(value, dict):
+        for name in ("id", "link", "text"):
+            if isinstance(value.get(name), str):
+                return value[name]
+        return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return str(value)
+
+
+def key_text(value: Any) -> Optional[str]:
+    """Return the comparable form of a key field value (None when blank)."""
+    plain = plain_value(value)
+    if plain is None:
+        return None
+    return plain if isinstance(plain, str) else json.dumps(plain, ensure_ascii=False)
+
+
+def content_hash(fields: Dict[str, Any], key_field: str, managed: Optional[Set[str]] = None) -> str:
+    """Hash the non-key fields (limited to `managed` when given; missing ones count as blank)."""
+    normalised = {}
+    for name in sorted(fields) if managed is None else sorted(managed):
+        if name == key_field:
+            continue
+        plain = plain_value(fields.get(name))
+        if plain is not None:
+            normalised[name] = plain
+    encoded = json.dumps(normalised, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def index_records(
+    records: Iterable[Dict[str, Any]], key_field: str, managed: Set[str]
+) -> Tuple[Dict[str, Tuple[str, str]], List[str]]:
+    """Index list-API records by key; return the index and ids of extra same-key records.
+
+    Records with a blank key are reported as extras too: the dataset cannot
+    address them, so a full sync removes them.
+    """
+    index: Dict[str, Tuple[str, str]] = {}
+    extras: List[str] = []
+    for record in records:
+        record_id = record.get("record_id")
+        if not record_id:
+            continue
+        fields = record.get("fields") or {}
+        key = key_text(fields.get(key_field))
+        if key is None or key in index:
+            extras.append(record_id)
+            continue
+        index[key] = (record_id, content_hash(fields, key_field, managed))
+    return index, extras
+
+
+def plan_sync(
+    incoming: Dict[str, Row],
+    index: Dict[str, Tuple[str, str]],
+    extras: Iterable[str],
+    key_field: str,
+    managed: Set[str],
+    delete: bool = True,
+    keep: Iterable[str] = (),
+) -> SyncPlan:
+    """Diff keyed input rows against the table index.
+
+    Records whose key is in `keep` (rows that were rejected before sending)
+    are never deleted, even though they are missing from `incoming`.
+    """
+    plan = SyncPlan()
+    for key, row in incoming.items():
+        existing = index.get(key)
+        if existing is None:
+            plan.creates.append(row)
+            continue
+        record_id, digest = existing
+        if digest == content_hash(row.value, key_field, managed):
+            plan.unchanged += 1
+            continue
+        payload = dict(row.value)
+        for name in sorted(managed):
+            payload.setdefault(name, None)
+        plan.updates.append(Row(row.line, {"record_id": record_id, "fields": payload}))
+    if delete:
+        kept = set(keep)
+        stale = [
+            record_id for key, (record_id, _digest) in index.items() if key not in incoming and key not in kept
+        ]
+        plan.deletes = [Row(None, record_id) for record_id in stale + list(extras)]
+    return plan
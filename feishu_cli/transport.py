@@ -0,0 +1,186 @@
+"""Pooled keep-alive HTTP transport shared by every lark client in the process.
+
+lark_oapi sends each request through the module-level `requests.request`,
+which opens a fresh session (and TCP/TLS connection) per call, and its async
+path opens a new `httpx.AsyncClient` per call. Installing a `PooledTransport`
+swaps both hooks for long-lived pooled clients, so batch, daemon, parallel
+and asyncio workflows reuse connections to the API host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from http.cookiejar import DefaultCookiePolicy
+import threading
+from typing import Any, Dict, Optional
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+def _reject_cookies() -> DefaultCookiePolicy:
+    """Cookie policy that never stores cookies.
+
+    The pooled clients outlive a single command (the daemon serves several
+    identities), and the API authenticates by header, so cookies set by one
+    call must not ride along on the next.
+    """
+    return DefaultCookiePolicy(allowed_domains=[])
+
+
+class PooledTransport:
+    """Drop-in replacement for the `requests` module used by lark_oapi."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session = requests.Session()
+        self._session.cookies.set_policy(_reject_cookies())
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        self._requests = 0
+        self._async_requests = 0
+        self._lock = threading.Lock()
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def settings(self) -> tuple:
+        return (self.pool_size, self.connect_timeout, self.read_timeout)
+
+    def request(self, method: str, url: str, timeout: Any = None, **kwargs: Any) -> requests.Response:
+        """Send a request on the shared session; SDK-level timeouts are replaced."""
+        with self._lock:
+            self._requests += 1
+        return self._session.request(
+            method, url, timeout=(self.connect_timeout, self.read_timeout), **kwargs
+        )
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the pooled AsyncClient bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout, pool=None),
+                    limits=httpx.Limits(max_connections=None, max_keepalive_connections=self.pool_size),
+                )
+                client.cookies.jar.set_policy(_reject_cookies())
+                self._async_clients[loop] = client
+            self._async_requests += 1
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running loop's AsyncClient (call before the loop ends)."""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        """Return requests sent vs connections opened and reused so far."""
+        pools = self._adapter.poolmanager.pools
+        opened = 0
+        idle = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            idle += pool.pool.qsize() if pool.pool is not None else 0
+        with self._lock:
+            sent = self._requests
+            sent_async = self._async_requests
+        return {
+            "requests": sent,
+            "connections_opened": opened,
+            "connections_reused": max(sent - opened, 0),
+            "pool_size": self.pool_size,
+            "idle_slots": idle,
+            "async_requests": sent_async,
+        }
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class _AsyncHttpxShim:
+    """Stand-in for the `httpx` module lark_oapi uses in `Transport.aexecute`.
+
+    `async with httpx.AsyncClient() as client` borrows the loop's pooled
+    client instead of creating (and closing) a new one per request.
+    """
+
+    def __init__(self, transport: PooledTransport) -> None:
+        self._transport = transport
+
+    def AsyncClient(self) -> "_BorrowedAsyncClient":  # noqa: N802 - mirrors httpx
+        return _BorrowedAsyncClient(self._transport)
+
+
+class _BorrowedAsyncClient:
+    def __init__(self, transport: PooledTransport) -> None:
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "_BorrowedAsyncClient":
+        self._client = self._transport.async_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._client = None
+
+    async def request(self, method: str, url: str, timeout: Any = None, **kwargs: Any) -> httpx.Response:
+        assert self._client is not None
+        return await self._client.request(method, url, **kwargs)
+
+
+_TRANSPORT: Optional[PooledTransport] = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def install_transport(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+) -> PooledTransport:
+    """Install (or reuse) the process-wide transport for lark_oapi requests."""
+    global _TRANSPORT
+    from lark_oapi.core.http import transport as lark_transport
+
+    with _TRANSPORT_LOCK:
+        settings = (pool_size, connect_timeout, read_timeout)
+        if _TRANSPORT is None or _TRANSPORT.settings != settings:
+            if _TRANSPORT is not None:
+                _TRANSPORT.close()
+            _TRANSPORT = PooledTransport(pool_size, connect_timeout, read_timeout)
+        lark_transport.requests = _TRANSPORT
+        lark_transport.httpx = _AsyncHttpxShim(_TRANSPORT)
+        return _TRANSPORT
+
+
+def get_transport() -> Optional[PooledTransport]:
+    """Return the installed transport, if any request path has set one up."""
+    return _TRANSPORT
+
+
+def transport_stats() -> Optional[Dict[str, int]]:
+    """Return pool statistics of the installed transport (None if not installed)."""
+    transport = _TRANSPORT
+    return transport.stats() if transport is not None else None
@@ -1,27 +1,216 @@
 """Unified output formatting for Feishu CLI."""
 
 import json
-from typing import Any
+import textwrap
+import threading
+from typing import Any, Dict, List, Optional
 
-import lark_oapi as lark
+import typer
 
 
-def format_response(response: Any) -> str:
-    """Format an API response as JSON string."""
+OUTPUT_FORMATS = ("json", "compact", "ndjson")
+
+_state = threading.local()
+_MISSING = object()
+
+
+def set_output_format(output_format: str) -> None:
+    """Select the output format for commands running on this thread."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"unknown output format: {output_format}")
+    _state.output_format = output_format
+
+
+def get_output_format() -> str:
+    return getattr(_state, "output_format", "json")
+
+
+def format_response(response: Any, select: Any = None) -> str:
+    """Format an API response as JSON string.
+
+    `attempts` is included when call_api needed more than one attempt.
+    `select` (a `feishu_cli.projection.Projection`) trims list items.
+    """
+    attempts = getattr(response, "attempts", None)
+    if not isinstance(attempts, int) or attempts <= 1:
+        attempts = None
     if response.success():
-        raw_data = getattr(response, "data", None)
-        data = json.loads(lark.JSON.marshal(raw_data)) if raw_data is not None else None
-        return json.dumps({"success": True, "data": data}, ensure_ascii=False, indent=2)
+        data = raw_response_data(response)
+        if data is _MISSING:
+            data = to_jsonable(getattr(response, "data", None))
+        if select is not None:
+            data = select.apply_data(data, list_key(data))
+        result: dict[str, Any] = {"success": True, "data": data}
+        if attempts:
+            result["attempts"] = attempts
+        return _render(result)
     return format_error(
         code=response.code,
         msg=response.msg,
         log_id=response.get_log_id(),
+        attempts=attempts,
     )
 
 
-def format_error(code: int = 0, msg: str = "", log_id: str = "") -> str:
+def format_success(data: Any) -> str:
+    """Format a locally produced success payload as JSON string."""
+    return _render({"success": True, "data": data})
+
+
+def format_error(code: int = 0, msg: str = "", log_id: str = "", attempts: Optional[int] = None) -> str:
     """Format an error as JSON string."""
     result: dict[str, Any] = {"success": False, "code": code, "msg": msg}
     if log_id:
         result["log_id"] = log_id
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    if attempts:
+        result["attempts"] = attempts
+    return _render(result)
+
+
+def raw_response_data(response: Any) -> Any:
+    """Return `data` parsed straight from the HTTP body, or `_MISSING`.
+
+    This skips re-serializing the SDK model objects the body was already
+    decoded into; callers fall back to `to_jsonable` when no body is kept.
+    """
+    content = getattr(getattr(response, "raw", None), "content", None)
+    if not isinstance(content, (bytes, bytearray)) or not content:
+        return _MISSING
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return _MISSING
+    if not isinstance(body, dict) or "data" not in body:
+        return _MISSING
+    return body["data"]
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert SDK model objects to plain JSON values (slow path)."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    import lark_oapi as lark
+
+    return json.loads(lark.JSON.marshal(value))
+
+
+def _render(result: Dict[str, Any]) -> str:
+    output_format = get_output_format()
+    if output_format == "json":
+        return json.dumps(result, ensure_ascii=False, indent=2)
+    if output_format == "compact":
+        return _compact(result)
+    data = result.get("data")
+    key = list_key(data) if result.get("success") else None
+    if key is None:
+        return _compact(result)
+    items = data[key]
+    summary = {k: v for k, v in result.items() if k != "data"}
+    summary.update(_summary(key, len(items), {k: v for k, v in data.items() if k != key}))
+    return "\n".join([_compact(item) for item in items] + [_compact(summary)])
+
+
+def list_key(data: Any) -> Optional[str]:
+    """Return the key holding the item list of a list-shaped `data` payload."""
+    if not isinstance(data, dict):
+        return None
+    if isinstance(data.get("items"), list):
+        return "items"
+    keys = [key for key, value in data.items() if isinstance(value, list)]
+    return keys[0] if len(keys) == 1 else None
+
+
+def _summary(items_key: str, count: int, rest: Dict[str, Any]) -> Dict[str, Any]:
+    return {"items_key": items_key, "count": count, "data": rest}
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class ItemStreamWriter:
+    """Write `{"data": {"<key>": [...], ...}, "success": ...}` incrementally.
+
+    Items are buffered until `flush()` (one page at a time). The trailer keys
+    of `data` and the success/error fields come last, so a failure after some
+    items still yields a single valid JSON document. In ndjson mode each item
+    is one compact line and the trailer is a final summary line; in compact
+    mode the document is written without indentation.
+    """
+
+    def __init__(self, items_key: str = "items") -> None:
+        self.items_key = items_key
+        self.count = 0
+        self._buffer: List[str] = []
+        self._format = get_output_format()
+
+    def write_item(self, item: Any) -> None:
+        if self._format == "ndjson":
+            self._buffer.append(_compact(item) + "\n")
+            self.count += 1
+            return
+        if self._format == "compact":
+            prefix = '{"data":{' + json.dumps(self.items_key) + ":[" if self.count == 0 else ","
+            self._buffer.append(prefix + _compact(item))
+            self.count += 1
+            return
+        if self.count == 0:
+            self._buffer.append('{\n  "data": {\n    ' + json.dumps(self.items_key) + ": [\n")
+        else:
+            self._buffer.append(",\n")
+        text = json.dumps(item, ensure_ascii=False, indent=2)
+        self._buffer.append(textwrap.indent(text, "      "))
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._buffer:
+            typer.echo("".join(self._buffer), nl=False)
+            self._buffer = []
+
+    def finish(self, trailer: Dict[str, Any]) -> None:
+        self._close({"success": True}, trailer)
+
+    def finish_error(
+        self,
+        trailer: Dict[str, Any],
+        code: int = 0,
+        msg: str = "",
+        log_id: str = "",
+        attempts: Optional[int] = None,
+    ) -> None:
+        tail: Dict[str, Any] = {"success": False, "code": code, "msg": msg}
+        if log_id:
+            tail["log_id"] = log_id
+        if isinstance(attempts, int) and attempts > 1:
+            tail["attempts"] = attempts
+        self._close(tail, trailer)
+
+    def _close(self, tail: Dict[str, Any], trailer: Dict[str, Any]) -> None:
+        if self._format == "ndjson":
+            tail.update(_summary(self.items_key, self.count, trailer))
+            self._buffer.append(_compact(tail))
+            typer.echo("".join(self._buffer))
+            self._buffer = []
+            return
+        if self._format == "compact":
+            if self.count == 0:
+                self._buffer.append('{"data":{' + json.dumps(self.items_key) + ":[")
+            data_tail = "".join("," + json.dumps(k) + ":" + _compact(v) for k, v in trailer.items())
+            tail_text = "".join("," + json.dumps(k) + ":" + _compact(v) for k, v in tail.items())
+            self._buffer.append("]" + data_tail + "}" + tail_text + "}")
+            typer.echo("".join(self._buffer))
+            self._buffer = []
+            return
+        if self.count == 0:
+            self._buffer.append('{\n  "data": {\n    ' + json.dumps(self.items_key) + ": [")
+        else:
+            self._buffer.append("\n    ")
+        self._buffer.append("]")
+        for key, value in trailer.items():
+            self._buffer.append(",\n    " + json.dumps(key) + ": " + json.dumps(value, ensure_ascii=False))
+        self._buffer.append("\n  }")
+        for key, value in tail.items():
+            self._buffer.append(",\n  " + json.dumps(key) + ": " + json.dumps(value, ensure_ascii=False))
+        self._buffer.append("\n}")
+        typer.echo("".join(self._buffer))
+        self._buffer = []
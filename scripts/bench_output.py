@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Output benchmark: serialization cost per MB of API response body.
+
+Builds synthetic bitable record-list responses the way lark_oapi does
+(HTTP body decoded into SDK models) and times the legacy path (model ->
+JSON.marshal -> loads -> dumps) against the raw-body path used by
+`format_response`, for each `--output` format. No network is involved.
+
+Usage: python scripts/bench_output.py [--sizes 1,8,32] [--runs 5] [--json]
+"""
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+import lark_oapi as lark  # noqa: E402
+from lark_oapi.api.bitable.v1 import ListAppTableRecordResponse  # noqa: E402
+from lark_oapi.api.bitable.v1.model.list_app_table_record_response_body import (  # noqa: E402
+    ListAppTableRecordResponseBody,
+)
+from lark_oapi.core.model import RawResponse  # noqa: E402
+
+from feishu_cli.utils.output import format_response, set_output_format  # noqa: E402
+
+_RECORD = {
+    "record_id": "rec0000000",
+    "fields": {
+        "Name": "Benchmark row with some unicode 文本",
+        "Amount": 1234.5,
+        "Done": True,
+        "Tags": ["alpha", "beta", "gamma"],
+        "Owner": [{"id": "ou_0000000000", "name": "Someone", "email": "someone@example.com"}],
+        "Due": 1700000000000,
+    },
+    "created_time": 1700000000000,
+    "last_modified_time": 1700000000000,
+}
+
+
+def build_response(size_mb):
+    """Return an SDK response whose HTTP body is roughly `size_mb` MB."""
+    record_bytes = len(json.dumps(_RECORD, ensure_ascii=False).encode("utf-8"))
+    count = max(1, int(size_mb * 1024 * 1024 / record_bytes))
+    items = [dict(_RECORD, record_id=f"rec{i:07d}") for i in range(count)]
+    body = {"code": 0, "msg": "success", "data": {"items": items, "has_more": False, "total": count}}
+    content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    raw = RawResponse()
+    raw.status_code = 200
+    raw.headers = {"Content-Type": "application/json"}
+    raw.content = content
+    response = lark.JSON.unmarshal(content.decode("utf-8"), ListAppTableRecordResponse)
+    response.raw = raw
+    response.data = lark.JSON.unmarshal(json.dumps(body["data"]), ListAppTableRecordResponseBody)
+    return response, len(content)
+
+
+def legacy_format(response):
+    data = json.loads(lark.JSON.marshal(response.data))
+    return json.dumps({"success": True, "data": data}, ensure_ascii=False, indent=2)
+
+
+def current_format(output_format):
+    def run(response):
+        set_output_format(output_format)
+        try:
+            return format_response(response)
+        finally:
+            set_output_format("json")
+
+    return run
+
+
+PATHS = {
+    "legacy json": legacy_format,
+    "raw json": current_format("json"),
+    "raw compact": current_format("compact"),
+    "raw ndjson": current_format("ndjson"),
+}
+
+
+def time_path(func, response, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(response)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,8,32", help="Comma-separated body sizes in MB")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    results = []
+    for size in [float(value) for value in args.sizes.split(",") if value.strip()]:
+        response, body_bytes = build_response(size)
+        mb = body_bytes / (1024 * 1024)
+        for name, func in PATHS.items():
+            median_ms = time_path(func, response, args.runs)
+            results.append(
+                {
+                    "size_mb": round(mb, 2),
+                    "path": name,
+                    "median_ms": round(median_ms, 1),
+                    "ms_per_mb": round(median_ms / mb, 1),
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'size MB':>8}  {'path':<14}{'median ms':>12}{'ms/MB':>10}")
+    for row in results:
+        print(f"{row['size_mb']:>8}  {row['path']:<14}{row['median_ms']:>12}{row['ms_per_mb']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Startup benchmark: wall time and imported module count per CLI entry.
+
+Each scenario runs in a fresh interpreter (no daemon) and parses only, via
+`--help`, so numbers reflect import/startup cost rather than network time.
+
+Usage: python scripts/bench_startup.py [--runs 5] [--json]
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "--help": ["--help"],
+    "docx get": ["docx", "get", "--help"],
+    "docs get": ["docs", "get", "--help"],
+    "sheets get": ["sheets", "get", "--help"],
+    "bitable record list": ["bitable", "record", "list", "--help"],
+    "wiki space list": ["wiki", "space", "list", "--help"],
+    "auth whoami": ["auth", "whoami", "--help"],
+}
+
+_PROBE = """
+import atexit, sys
+atexit.register(lambda: sys.stderr.write("\\n__MODULES__=%d\\n" % len(sys.modules)))
+from feishu_cli.main import app
+app(args=sys.argv[1:], prog_name="feishu-cli")
+"""
+
+
+def run_once(argv):
+    env = dict(os.environ, FEISHU_CLI_NO_DAEMON="1", PYTHONPATH=str(PROJECT_DIR))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, *argv],
+        cwd=str(PROJECT_DIR),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    modules = None
+    for line in proc.stderr.splitlines():
+        if line.startswith("__MODULES__="):
+            modules = int(line.split("=", 1)[1])
+    return elapsed_ms, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    results = []
+    for name, argv in SCENARIOS.items():
+        timings = []
+        modules = None
+        for _ in range(args.runs):
+            elapsed_ms, modules = run_once(argv)
+            timings.append(elapsed_ms)
+        results.append(
+            {
+                "scenario": name,
+                "median_ms": round(statistics.median(timings), 1),
+                "min_ms": round(min(timings), 1),
+                "modules": modules,
+            }
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'scenario':<24}{'median ms':>12}{'min ms':>10}{'modules':>10}")
+    for row in results:
+        print(f"{row['scenario']:<24}{row['median_ms']:>12}{row['min_ms']:>10}{row['modules']!s:>10}")
+
+
+if __name__ == "__main__":
+    main()
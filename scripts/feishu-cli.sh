@@ -18,5 +18,5 @@ if [ -f "$PROJECT_DIR/.env" ]; then
     set +a
 fi
 
-# Run CLI
-exec "$PROJECT_DIR/.venv/bin/python" -m feishu_cli.main "$@"
+# Run CLI (forwarded to `feishu-cli serve` when a daemon is running)
+exec "$PROJECT_DIR/.venv/bin/python" -m feishu_cli "$@"
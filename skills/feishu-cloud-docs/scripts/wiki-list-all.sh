@@ -13,7 +13,7 @@ echo ""
 
 # Step 1: 列出所有知识空间
 echo ">>> [1/2] 获取所有知识空间..."
-SPACES_OUTPUT=$("$CLI" wiki space list)
+SPACES_OUTPUT=$("$CLI" wiki space list --all)
 
 if ! echo "$SPACES_OUTPUT" | python3 -c "import json,sys; d=json.load(sys.stdin); exit(0 if d.get('success') else 1)" 2>/dev/null; then
     echo "ERROR: 获取知识空间失败"
@@ -51,31 +51,37 @@ if [ -z "$SPACE_IDS" ]; then
 fi
 
 echo ">>> [2/2] 列出各空间的根节点..."
-for SPACE_ID in $SPACE_IDS; do
-    echo ""
-    echo "--- 空间 $SPACE_ID 的根节点 ---"
-    NODE_OUTPUT=$("$CLI" wiki node list --space "$SPACE_ID" --page-size 20 2>&1) || true
+# 所有空间的节点列表在同一个 CLI 进程中批量执行（batch），避免每个空间重复启动
+BATCH_OUTPUT=$(for SPACE_ID in $SPACE_IDS; do
+    printf '["wiki", "node", "list", "--space", "%s", "--page-size", "50", "--all"]\n' "$SPACE_ID"
+done | "$CLI" batch --parallel 4) || true
 
-    if echo "$NODE_OUTPUT" | python3 -c "import json,sys; d=json.load(sys.stdin); exit(0 if d.get('success') else 1)" 2>/dev/null; then
-        echo "$NODE_OUTPUT" | python3 -c "
+echo "$BATCH_OUTPUT" | python3 -c "
 import json, sys
-d = json.load(sys.stdin)
-nodes = d.get('data', {}).get('items', [])
-print(f'  共 {len(nodes)} 个根节点:')
-for n in nodes:
-    node_token = n.get('node_token', '?')
-    title      = n.get('title', '(无标题)')
-    obj_type   = n.get('obj_type', '?')
-    obj_token  = n.get('obj_token', '')
-    print(f'  node_token={node_token}  type={obj_type}  title={title}')
-    if obj_token:
-        print(f'    obj_token={obj_token}  (可用于 {obj_type} 命令的 --token)')
+for line in sys.stdin:
+    line = line.strip()
+    if not line:
+        continue
+    row = json.loads(line)
+    space_id = row['argv'][4] if row.get('argv') else '?'
+    print()
+    print(f'--- 空间 {space_id} 的根节点 ---')
+    d = row.get('output')
+    if not isinstance(d, dict) or not d.get('success'):
+        print('  获取节点失败（可能权限不足）:')
+        print('  ' + json.dumps(d, ensure_ascii=False)[:300])
+        continue
+    nodes = (d.get('data') or {}).get('items') or []
+    print(f'  共 {len(nodes)} 个根节点:')
+    for n in nodes:
+        node_token = n.get('node_token', '?')
+        title      = n.get('title', '(无标题)')
+        obj_type   = n.get('obj_type', '?')
+        obj_token  = n.get('obj_token', '')
+        print(f'  node_token={node_token}  type={obj_type}  title={title}')
+        if obj_token:
+            print(f'    obj_token={obj_token}  (可用于 {obj_type} 命令的 --token)')
 " 2>/dev/null || echo "  (解析失败)"
-    else
-        echo "  获取节点失败（可能权限不足）:"
-        echo "  $NODE_OUTPUT" | head -3
-    fi
-done
 
 echo ""
 echo "=== 完成 ==="
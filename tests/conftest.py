@@ -8,3 +8,5 @@ def isolate_user_token_sources(monkeypatch: pytest.MonkeyPatch, tmp_path) -> Non
     """Prevent local machine user-token state from affecting test behavior."""
     monkeypatch.delenv("FEISHU_USER_ACCESS_TOKEN", raising=False)
     monkeypatch.setenv("FEISHU_TOKEN_FILE", str(tmp_path / "user_token.json"))
+    monkeypatch.setenv("FEISHU_TENANT_TOKEN_FILE", str(tmp_path / "tenant_token.json"))
+    monkeypatch.setenv("FEISHU_SCHEMA_CACHE_FILE", str(tmp_path / "field_schema.json"))
@@ -79,3 +79,46 @@ def test_resolve_user_request_option_clears_when_refresh_fails(monkeypatch) -> N
     option = resolve_user_request_option(MagicMock())
     assert option is None
     clear_mock.assert_called_once()
+
+
+def test_resolve_user_request_option_memoizes_unchanged_file(monkeypatch) -> None:
+    save_user_token_session(_session(access_token="cached", expires_at=9999999999))
+    load_mock = MagicMock(wraps=load_user_token_session)
+    monkeypatch.setattr(session_mod, "load_user_token_session", load_mock)
+
+    assert resolve_user_request_option(MagicMock()).user_access_token == "cached"
+    assert resolve_user_request_option(MagicMock()).user_access_token == "cached"
+    load_mock.assert_not_called()
+
+    session_mod._forget_session()
+    save_user_token_session(_session(access_token="rotated", expires_at=9999999999))
+    session_mod._forget_session()
+    assert resolve_user_request_option(MagicMock()).user_access_token == "rotated"
+    load_mock.assert_called_once()
+
+
+def test_resolve_user_request_option_refreshes_once_across_threads(monkeypatch) -> None:
+    import threading
+
+    save_user_token_session(_session(access_token="old", expires_at=0))
+    session_mod._forget_session()
+    calls = []
+
+    def fake_refresh(_client, _session_obj):
+        calls.append(_session_obj.access_token)
+        return _session(access_token="new", expires_at=9999999999)
+
+    monkeypatch.setattr(session_mod, "refresh_user_token_session", fake_refresh)
+    tokens = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(resolve_user_request_option(MagicMock()).user_access_token))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["old"]
+    assert tokens == ["new"] * 8
+    assert load_user_token_session().access_token == "new"
@@ -0,0 +1,154 @@
+"""Tests for the batch command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from feishu_cli.commands.batch import BatchLineError, parse_batch_line
+from feishu_cli.main import app
+
+runner = CliRunner()
+
+
+def _mock_success() -> MagicMock:
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = None
+    return resp
+
+
+def _mock_failure() -> MagicMock:
+    resp = MagicMock()
+    resp.success.return_value = False
+    resp.code = 99999
+    resp.msg = "error"
+    resp.get_log_id.return_value = "log123"
+    return resp
+
+
+def test_parse_batch_line_argv_array() -> None:
+    assert parse_batch_line('["docx", "get", "--token", "X"]') == ["docx", "get", "--token", "X"]
+
+
+def test_parse_batch_line_command_object() -> None:
+    argv = parse_batch_line(
+        json.dumps(
+            {
+                "domain": "bitable",
+                "command": "record create",
+                "options": {
+                    "app_token": "app",
+                    "table_id": "tbl",
+                    "fields": {"Name": "n"},
+                    "page_size": 5,
+                    "manual": True,
+                    "delete": False,
+                    "skip": None,
+                },
+            }
+        )
+    )
+    assert argv == [
+        "bitable", "record", "create",
+        "--app-token", "app",
+        "--table-id", "tbl",
+        "--fields", '{"Name": "n"}',
+        "--page-size", "5",
+        "--manual",
+        "--no-delete",
+    ]
+
+
+@pytest.mark.parametrize("line", ["{", "[]", '"docx"', '{"domain": "docx"}'])
+def test_parse_batch_line_rejects_invalid(line: str) -> None:
+    with pytest.raises(BatchLineError):
+        parse_batch_line(line)
+
+
+@patch("feishu_cli.commands.batch.resolve_user_request_option", return_value=None)
+@patch("feishu_cli.commands.batch.create_client")
+@patch("feishu_cli.commands.docs.create_client")
+def test_batch_runs_each_line(mock_docs_cc: MagicMock, mock_cc: MagicMock, _opt: MagicMock) -> None:
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.side_effect = [_mock_success(), _mock_failure(), _mock_success()]
+    mock_docs_cc.return_value = mock_client
+    lines = "\n".join(
+        [
+            '["docs", "get", "--token", "a"]',
+            '{"domain": "docs", "command": "get", "options": {"token": "b"}}',
+            "",
+            '["docs", "get", "--token", "c"]',
+        ]
+    )
+
+    result = runner.invoke(app, ["batch"], input=lines)
+
+    assert result.exit_code == 1
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [row["exit_code"] for row in rows] == [0, 1, 0]
+    assert [row["line"] for row in rows] == [1, 2, 4]
+    assert rows[0]["output"]["success"] is True
+    assert rows[1]["output"]["code"] == 99999
+    mock_cc.assert_called_once()
+
+
+@patch("feishu_cli.commands.batch.resolve_user_request_option", return_value=None)
+@patch("feishu_cli.commands.batch.create_client")
+@patch("feishu_cli.commands.docs.create_client")
+def test_batch_fail_fast_stops_after_first_error(
+    mock_docs_cc: MagicMock, _cc: MagicMock, _opt: MagicMock
+) -> None:
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.return_value = _mock_failure()
+    mock_docs_cc.return_value = mock_client
+    lines = '["docs", "get", "--token", "a"]\n["docs", "get", "--token", "b"]\n'
+
+    result = runner.invoke(app, ["batch", "--fail-fast"], input=lines)
+
+    assert result.exit_code == 1
+    assert len(result.stdout.splitlines()) == 1
+    assert mock_client.docs.v1.content.get.call_count == 1
+
+
+@patch("feishu_cli.commands.batch.resolve_user_request_option", return_value=None)
+@patch("feishu_cli.commands.batch.create_client")
+@patch("feishu_cli.commands.docs.create_client")
+def test_batch_parallel_keeps_input_order(
+    mock_docs_cc: MagicMock, _cc: MagicMock, _opt: MagicMock, tmp_path
+) -> None:
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.return_value = _mock_success()
+    mock_docs_cc.return_value = mock_client
+    batch_file = tmp_path / "cmds.jsonl"
+    batch_file.write_text(
+        "\n".join(f'["docs", "get", "--token", "t{i}"]' for i in range(10)), encoding="utf-8"
+    )
+
+    result = runner.invoke(app, ["batch", "--file", str(batch_file), "--parallel", "4"])
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [row["argv"][-1] for row in rows] == [f"t{i}" for i in range(10)]
+
+
+@patch("feishu_cli.commands.batch.create_client")
+def test_batch_reports_invalid_line(_cc: MagicMock) -> None:
+    with patch("feishu_cli.commands.batch.resolve_user_request_option", return_value=None):
+        result = runner.invoke(app, ["batch"], input="not json\n")
+    assert result.exit_code == 1
+    row = json.loads(result.stdout.splitlines()[0])
+    assert row["exit_code"] == 2
+    assert row["output"]["success"] is False
+
+
+@patch("feishu_cli.commands.batch.create_client")
+def test_batch_false_option_without_negative_form_fails(_cc: MagicMock) -> None:
+    line = {"domain": "docx", "command": "get", "options": {"token": "X", "select": False}}
+    with patch("feishu_cli.commands.batch.resolve_user_request_option", return_value=None):
+        result = runner.invoke(app, ["batch"], input=json.dumps(line) + "\n")
+    assert result.exit_code == 1
+    row = json.loads(result.stdout.splitlines()[0])
+    assert row["argv"][-1] == "--no-select"
+    assert row["exit_code"] == 2
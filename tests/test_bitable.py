@@ -81,6 +81,46 @@ def test_app_copy(mock_cc: MagicMock) -> None:
     assert result.exit_code == 0
 
 
+@patch("feishu_cli.commands.bitable.create_client")
+def test_app_export_writes_table_files_and_manifest(mock_cc: MagicMock, tmp_path) -> None:
+    def records(request, *_args):
+        if request.table_id == "tblBAD":
+            return _mock_failure()
+        if request.table_id == "tblDOWN":
+            raise ConnectionError("connection reset")
+        return _search_page([{"record_id": "rec1", "fields": {"标题": "a"}}, {"record_id": "rec2", "fields": {}}])
+
+    mock_client = MagicMock()
+    bitable = mock_client.bitable.v1
+    bitable.app_table.list.return_value = _search_page(
+        [{"table_id": "tblA", "name": "任务"}, {"table_id": "tblBAD", "name": "坏表"}, {"table_id": "tblDOWN"}]
+    )
+    bitable.app_table_field.list.return_value = _search_page([{"field_name": "标题", "type": 1}])
+    bitable.app_table_view.list.return_value = _search_page([{"view_id": "vew1", "view_name": "表格"}])
+    bitable.app_table_record.list.side_effect = records
+    mock_cc.return_value = mock_client
+    out = tmp_path / "backup"
+
+    with patch("feishu_cli.runtime.time.sleep"):
+        result = runner.invoke(
+            bitable_app, ["export", "--app-token", "appXXX", "--out", str(out), "--concurrency", "2"]
+        )
+
+    assert result.exit_code == 1
+    summary = json.loads(result.stdout)["data"]
+    assert (summary["tables"], summary["failed"], summary["records"]) == (3, 2, 2)
+    lines = (out / "tblA.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["record_id"] for line in lines] == ["rec1", "rec2"]
+    assert sorted(path.name for path in out.iterdir()) == ["manifest.json", "tblA.jsonl"]
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    good, bad, down = manifest["tables"]
+    assert (good["table_id"], good["records"], good["fields"][0]["field_name"], good["views"][0]["view_id"]) == (
+        "tblA", 2, "标题", "vew1"
+    )
+    assert bad["error"]["code"] == 99999 and bad["records"] == 0
+    assert down["error"]["msg"] == "ConnectionError: connection reset"
+
+
 # ── Table commands ──────────────────────────────────────────────────────────
 
 
@@ -132,6 +172,127 @@ def test_record_list(mock_cc: MagicMock) -> None:
     assert result.exit_code == 0
 
 
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_search_pushes_filter_sort_and_fields(mock_cc: MagicMock) -> None:
+    import lark_oapi as lark
+
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.search.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        [
+            "record", "search", "--app-token", "appXXX", "--table-id", "tblXXX",
+            "--filter", '{"conditions": [{"field_name": "状态", "operator": "is", "value": ["完成"]}]}',
+            "--sort", '["日期 DESC", "序号"]',
+            "--view-id", "vewXXX",
+            "--select", "record_id,fields.标题",
+        ],
+    )
+
+    assert result.exit_code == 0
+    request = mock_client.bitable.v1.app_table_record.search.call_args[0][0]
+    assert json.loads(lark.JSON.marshal(request.request_body)) == {
+        "filter": {"conjunction": "and", "conditions": [{"field_name": "状态", "operator": "is", "value": ["完成"]}]},
+        "sort": [{"field_name": "日期", "desc": True}, {"field_name": "序号", "desc": False}],
+        "view_id": "vewXXX",
+        "field_names": ["标题"],
+    }
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_search_all_retries_throttled_post(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    throttled = _mock_failure()
+    throttled.code = 1254290
+    page = _mock_success()
+    page.data = SimpleNamespace(items=[{"record_id": "rec1"}], page_token=None, has_more=False)
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.search.side_effect = [throttled, page]
+    mock_cc.return_value = mock_client
+
+    with patch("feishu_cli.runtime.time.sleep"):
+        result = runner.invoke(
+            bitable_app,
+            ["record", "search", "--app-token", "appXXX", "--table-id", "tblXXX", "--field-names", "标题,状态", "--all"],
+        )
+
+    assert result.exit_code == 0
+    assert [item["record_id"] for item in json.loads(result.stdout)["data"]["items"]] == ["rec1"]
+    request = mock_client.bitable.v1.app_table_record.search.call_args[0][0]
+    assert request.request_body.field_names == ["标题", "状态"]
+
+
+def _search_page(items):
+    from types import SimpleNamespace
+
+    page = _mock_success()
+    page.data = SimpleNamespace(items=items, page_token=None, has_more=False)
+    return page
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_changes_uses_watermark_and_reports_deletes(mock_cc: MagicMock, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    state = tmp_path / "changes.json"
+    state.write_text(
+        json.dumps({"table": "appXXX/tblXXX", "watermark": 1000, "ids_checked_at": 0, "ids": ["rec1", "rec2", "rec3"]}),
+        encoding="utf-8",
+    )
+    fields = _search_page([])
+    fields.data = SimpleNamespace(
+        items=[{"field_name": "标题", "type": 1}, {"field_name": "修改时间", "type": 1002}], page_token=None, has_more=False
+    )
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    mock_client.bitable.v1.app_table_field.list.return_value = fields
+    records.search.return_value = _search_page([
+        {"record_id": "rec1", "last_modified_time": 900},
+        {"record_id": "rec2", "last_modified_time": 2000, "fields": {"标题": "新"}},
+    ])
+    records.list.return_value = _search_page([{"record_id": "rec1"}, {"record_id": "rec2"}, {"record_id": "rec4"}])
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app, ["record", "changes", "--app-token", "appXXX", "--table-id", "tblXXX", "--state", str(state)]
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert parsed["data"]["items"] == [
+        {"record_id": "rec2", "last_modified_time": 2000, "fields": {"标题": "新"}},
+        {"record_id": "rec3", "deleted": True},
+    ]
+    assert (parsed["data"]["changed"], parsed["data"]["deleted"], parsed["data"]["watermark"]) == (1, 1, 2000)
+    condition = records.search.call_args[0][0].request_body.filter.conditions[0]
+    assert (condition.field_name, condition.operator) == ("修改时间", "isGreater")
+    saved = json.loads(state.read_text(encoding="utf-8"))
+    assert saved["watermark"] == 2000
+    assert saved["ids"] == ["rec1", "rec2", "rec4"]
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_changes_first_run_walks_everything(mock_cc: MagicMock, tmp_path) -> None:
+    state = tmp_path / "changes.json"
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    records.search.return_value = _search_page([{"record_id": "rec1", "last_modified_time": 5}])
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app, ["record", "changes", "--app-token", "appXXX", "--table-id", "tblXXX", "--state", str(state)]
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["data"]["changed"] == 1
+    assert records.search.call_args[0][0].request_body.filter is None
+    records.list.assert_not_called()
+    assert json.loads(state.read_text(encoding="utf-8"))["ids"] == ["rec1"]
+
+
 @patch("feishu_cli.commands.bitable.create_client")
 def test_record_get(mock_cc: MagicMock) -> None:
     mock_client = MagicMock()
@@ -263,3 +424,529 @@ def test_app_get_failure(mock_cc: MagicMock) -> None:
     assert result.exit_code == 1
     parsed = json.loads(result.stdout)
     assert parsed["success"] is False
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_list_all_streams_pages(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    first, second = _mock_success(), _mock_success()
+    first.data = SimpleNamespace(items=[{"record_id": "rec1"}], page_token="pt2", has_more=True)
+    second.data = SimpleNamespace(items=[{"record_id": "rec2"}], page_token=None, has_more=False)
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.list.side_effect = [first, second]
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app, ["record", "list", "--app-token", "appXXX", "--table-id", "tblXXX", "--all"]
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert [item["record_id"] for item in parsed["data"]["items"]] == ["rec1", "rec2"]
+    second_request = mock_client.bitable.v1.app_table_record.list.call_args_list[1][0][0]
+    assert ("page_token", "pt2") in second_request.queries
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_list_select_pushes_down_field_names(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    resp = _mock_success()
+    resp.data = SimpleNamespace(
+        items=[{"record_id": "rec1", "fields": {"Name": "a"}, "created_time": 1}],
+        page_token=None,
+        has_more=False,
+    )
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.list.return_value = resp
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "list", "--app-token", "appXXX", "--table-id", "tblXXX", "--select", "record_id,fields.Name"],
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert parsed["data"]["items"] == [{"record_id": "rec1", "fields": {"Name": "a"}}]
+    request = mock_client.bitable.v1.app_table_record.list.call_args[0][0]
+    assert ("field_names", '["Name"]') in request.queries
+
+
+def test_record_list_select_rejects_bad_path() -> None:
+    result = runner.invoke(
+        bitable_app, ["record", "list", "--app-token", "appXXX", "--table-id", "tblXXX", "--select", "a..b"]
+    )
+    assert result.exit_code == 2
+    assert json.loads(result.stdout)["code"] == 2
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_import_batches_rows_and_reports_each(mock_cc: MagicMock, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    def created(request, *_args):
+        # Batches run concurrently, so answer from the request, not call order.
+        resp = _mock_success()
+        resp.data = SimpleNamespace(
+            records=[SimpleNamespace(record_id="rec_" + r.fields["Name"]) for r in request.request_body.records]
+        )
+        return resp
+
+    source = tmp_path / "rows.jsonl"
+    source.write_text('{"Name": "a"}\n{"fields": {"Name": "b"}}\n[1]\n{"Name": "c"}\n', encoding="utf-8")
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.batch_create.side_effect = created
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "import", "--app-token", "appXXX", "--table-id", "tblXXX", "--file", str(source), "--batch-size", "2"],
+    )
+
+    assert result.exit_code == 1
+    parsed = json.loads(result.stdout)
+    by_line = {item["line"]: item for item in parsed["data"]["results"]}
+    assert by_line[1]["record_id"] == "rec_a"
+    assert by_line[2]["record_id"] == "rec_b"
+    assert by_line[4]["record_id"] == "rec_c"
+    assert by_line[3]["success"] is False and by_line[3]["code"] == 2
+    assert parsed["data"]["succeeded"] == 3 and parsed["data"]["failed"] == 1 and parsed["data"]["batches"] == 2
+    requests = [call[0][0] for call in mock_client.bitable.v1.app_table_record.batch_create.call_args_list]
+    assert sorted(len(request.request_body.records) for request in requests) == [1, 2]
+    assert all(request.client_token for request in requests)
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_import_validates_and_writes_rejects(mock_cc: MagicMock, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    source = tmp_path / "rows.csv"
+    source.write_text("Name,Count\na,3\nb,lots\nc,\n", encoding="utf-8")
+    rejects = tmp_path / "rejects.jsonl"
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_field.list.return_value = _search_page(
+        [{"field_name": "Name", "type": 1}, {"field_name": "Count", "type": 2}]
+    )
+    created = _mock_success()
+    created.data = SimpleNamespace(records=[SimpleNamespace(record_id="rec1"), SimpleNamespace(record_id="rec2")])
+    mock_client.bitable.v1.app_table_record.batch_create.return_value = created
+    mock_cc.return_value = mock_client
+    args = ["record", "import", "--app-token", "appXXX", "--table-id", "tblXXX", "--file", str(source)]
+
+    result = runner.invoke(bitable_app, args + ["--reject-file", str(rejects)])
+
+    assert result.exit_code == 1
+    parsed = json.loads(result.stdout)["data"]
+    assert (parsed["succeeded"], parsed["failed"], parsed["rejected"]) == (2, 1, 1)
+    request = mock_client.bitable.v1.app_table_record.batch_create.call_args[0][0]
+    assert [record.fields for record in request.request_body.records] == [{"Name": "a", "Count": 3}, {"Name": "c"}]
+    assert [json.loads(line) for line in rejects.read_text(encoding="utf-8").splitlines()] == [
+        {"line": 3, "error": "Count: expected a number, got 'lots'", "row": {"Name": "b", "Count": "lots"}}
+    ]
+
+    runner.invoke(bitable_app, args + ["--validate"])
+    mock_client.bitable.v1.app_table_field.list.assert_called_once()
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_create_validate_rejects_bad_fields(mock_cc: MagicMock) -> None:
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_field.list.return_value = _search_page([{"field_name": "Count", "type": 2}])
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "create", "--app-token", "appXXX", "--table-id", "tblXXX", "--fields", '{"Count": "x"}', "--validate"],
+    )
+
+    assert result.exit_code == 2
+    assert "Count: expected a number" in json.loads(result.stdout)["msg"]
+    mock_client.bitable.v1.app_table_record.create.assert_not_called()
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_import_csv_failed_batch_fails_rows(mock_cc: MagicMock, tmp_path) -> None:
+    source = tmp_path / "rows.csv"
+    source.write_text("Name\na\nb\n", encoding="utf-8")
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.batch_create.return_value = _mock_failure()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app, ["record", "import", "--app-token", "appXXX", "--table-id", "tblXXX", "--file", str(source)]
+    )
+
+    assert result.exit_code == 1
+    parsed = json.loads(result.stdout)
+    assert [item["code"] for item in parsed["data"]["results"]] == [99999, 99999]
+    request = mock_client.bitable.v1.app_table_record.batch_create.call_args[0][0]
+    assert request.request_body.records[0].fields == {"Name": "a"}
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_bulk_update_reports_per_record(mock_cc: MagicMock) -> None:
+    rows = (
+        '{"record_id": "rec1", "fields": {"状态": "完成"}}\n'
+        '{"record_id": "rec2", "状态": "进行中"}\n'
+        '{"fields": {"状态": "x"}}\n'
+    )
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.batch_update.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "bulk-update", "--app-token", "appXXX", "--table-id", "tblXXX", "--concurrency", "2"],
+        input=rows,
+    )
+
+    assert result.exit_code == 1
+    parsed = json.loads(result.stdout)
+    results = {item["line"]: item for item in parsed["data"]["results"]}
+    assert results[1] == {"line": 1, "success": True, "record_id": "rec1"}
+    assert results[2]["record_id"] == "rec2"
+    assert results[3]["success"] is False
+    request = mock_client.bitable.v1.app_table_record.batch_update.call_args[0][0]
+    assert [(r.record_id, r.fields) for r in request.request_body.records] == [
+        ("rec1", {"状态": "完成"}),
+        ("rec2", {"状态": "进行中"}),
+    ]
+    assert request.client_token
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_bulk_delete_from_stream(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    rows = (
+        '{"record_id": "rec1"}\n"rec2"\n"rec1"\n'
+        '{"success": true, "items_key": "items", "count": 2, "data": {}}\n'
+    )
+    resp = _mock_success()
+    resp.data = SimpleNamespace(
+        records=[SimpleNamespace(record_id="rec1", deleted=True), SimpleNamespace(record_id="rec2", deleted=False)]
+    )
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.batch_delete.return_value = resp
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app, ["record", "bulk-delete", "--app-token", "appXXX", "--table-id", "tblXXX"], input=rows
+    )
+
+    assert result.exit_code == 1
+    parsed = json.loads(result.stdout)
+    results = {item["line"]: item for item in parsed["data"]["results"]}
+    assert results[1]["success"] is True
+    assert results[2]["success"] is False
+    assert results[3]["msg"] == "Duplicate record_id: rec1"
+    assert 4 not in results
+    request = mock_client.bitable.v1.app_table_record.batch_delete.call_args[0][0]
+    assert request.request_body.records == ["rec1", "rec2"]
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_bulk_delete_filter_dry_run(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    first, second = _mock_success(), _mock_success()
+    first.data = SimpleNamespace(items=[{"record_id": f"rec{i}"} for i in range(3)], page_token="pt2", has_more=True)
+    second.data = SimpleNamespace(items=[{"record_id": "rec9"}], page_token=None, has_more=False)
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.list.side_effect = [first, second]
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        [
+            "record", "bulk-delete", "--app-token", "appXXX", "--table-id", "tblXXX",
+            "--filter", 'CurrentValue.[状态]="归档"', "--batch-size", "2", "--dry-run",
+        ],
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert parsed["data"] == {"dry_run": True, "records": 4, "invalid_rows": 0, "batches": 2, "api_calls": 4}
+    assert ("filter", 'CurrentValue.[状态]="归档"') in mock_client.bitable.v1.app_table_record.list.call_args[0][0].queries
+    mock_client.bitable.v1.app_table_record.batch_delete.assert_not_called()
+
+
+def _sync_table_page():
+    from types import SimpleNamespace
+
+    page = _mock_success()
+    page.data = SimpleNamespace(
+        items=[
+            {"record_id": "rec1", "fields": {"工号": "1", "姓名": [{"text": "张三", "type": "text"}]}},
+            {"record_id": "rec2", "fields": {"工号": "2", "姓名": "李四"}},
+            {"record_id": "rec3", "fields": {"工号": "3", "姓名": "王五"}},
+        ],
+        page_token=None,
+        has_more=False,
+    )
+    return page
+
+
+SYNC_ROWS = "工号,姓名\n1,张三\n2,李四四\n4,赵六\n"
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_sync_dry_run_plans_minimal_writes(mock_cc: MagicMock) -> None:
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_record.list.return_value = _sync_table_page()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "sync", "--app-token", "appXXX", "--table-id", "tblXXX", "--key", "工号", "--format", "csv", "--dry-run"],
+        input=SYNC_ROWS,
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)["data"]
+    assert (data["creates"], data["updates"], data["deletes"], data["unchanged"]) == (1, 1, 1, 1)
+    assert data["api_calls"] == 4
+    request = mock_client.bitable.v1.app_table_record.list.call_args[0][0]
+    assert ("field_names", '["姓名", "工号"]') in request.queries
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_sync_issues_only_needed_batches(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    created = _mock_success()
+    created.data = SimpleNamespace(records=[SimpleNamespace(record_id="rec9")])
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    records.list.return_value = _sync_table_page()
+    records.batch_create.return_value = created
+    records.batch_update.return_value = _mock_success()
+    records.batch_delete.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "sync", "--app-token", "appXXX", "--table-id", "tblXXX", "--key", "工号", "--format", "csv"],
+        input=SYNC_ROWS,
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert [(item["op"], item["record_id"]) for item in parsed["data"]["results"]] == [
+        ("create", "rec9"),
+        ("update", "rec2"),
+        ("delete", "rec3"),
+    ]
+    assert records.batch_create.call_args[0][0].request_body.records[0].fields == {"工号": "4", "姓名": "赵六"}
+    assert records.batch_update.call_args[0][0].request_body.records[0].fields == {"工号": "2", "姓名": "李四四"}
+    assert records.batch_delete.call_args[0][0].request_body.records == ["rec3"]
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_sync_skips_deletes_when_a_row_has_no_usable_key(mock_cc: MagicMock) -> None:
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    records.list.return_value = _sync_table_page()
+    records.batch_create.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "sync", "--app-token", "appXXX", "--table-id", "tblXXX", "--key", "工号"],
+        input='{"工号": "1", "姓名": "张三"}\n{"工号": "2", "姓名": \n',
+    )
+
+    assert result.exit_code == 1
+    data = json.loads(result.stdout)["data"]
+    assert data["deletes"] == 0 and "deletes_skipped" in data
+    records.batch_delete.assert_not_called()
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_sync_validate_keeps_records_of_rejected_rows(mock_cc: MagicMock, tmp_path) -> None:
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    mock_client.bitable.v1.app_table_field.list.return_value = _search_page(
+        [{"field_name": "工号", "type": 1}, {"field_name": "姓名", "type": 1}, {"field_name": "数量", "type": 2}]
+    )
+    records.list.return_value = _sync_table_page()
+    records.batch_delete.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+    rejects = tmp_path / "rejects.jsonl"
+    args = ["record", "sync", "--app-token", "appXXX", "--table-id", "tblXXX", "--key", "工号", "--validate"]
+    rows = '{"工号": "1", "姓名": "张三"}\n{"工号": "2", "数量": "not a number"}\n'
+
+    dry_run = runner.invoke(bitable_app, args + ["--dry-run"], input=rows)
+
+    assert dry_run.exit_code == 0
+    assert json.loads(dry_run.stdout)["data"]["deletes"] == 1
+
+    result = runner.invoke(bitable_app, args + ["--reject-file", str(rejects)], input=rows)
+
+    assert result.exit_code == 1
+    data = json.loads(result.stdout)["data"]
+    assert (data["deletes"], data["rejected"]) == (1, 1)
+    assert records.batch_delete.call_args[0][0].request_body.records == ["rec3"]
+    assert json.loads(rejects.read_text(encoding="utf-8"))["row"] == {"工号": "2", "数量": "not a number"}
+
+
+def test_record_sync_refuses_empty_dataset_with_delete() -> None:
+    result = runner.invoke(
+        bitable_app, ["record", "sync", "--app-token", "appXXX", "--table-id", "tblXXX", "--key", "工号"], input=""
+    )
+    assert result.exit_code == 2
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_export_shards_merge_each_record_once(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    def page(items, **kwargs):
+        resp = _mock_success()
+        resp.data = SimpleNamespace(items=items, page_token=None, has_more=False, **kwargs)
+        return resp
+
+    def record(record_id, value):
+        return SimpleNamespace(record_id=record_id, fields={"序号": value})
+
+    def list_records(request):
+        query = dict(request.queries)
+        if "sort" in query:
+            assert query["filter"] == 'NOT(CurrentValue.[序号]="")'
+            ascending = "ASC" in query["sort"]
+            return page([record("r1", 1 if ascending else 9)])
+        shard = query.get("filter", "")
+        if shard.startswith("NOT("):
+            return page([record("r0", None)])
+        if shard.endswith("<5"):
+            return page([record("r1", 1), record("r2", 4)])
+        # A record that moved between shards mid-export shows up twice.
+        return page([record("r2", 5), record("r3", 9)])
+
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_field.list.return_value = page(
+        [SimpleNamespace(field_name="序号", type=2)]
+    )
+    mock_client.bitable.v1.app_table_record.list.side_effect = list_records
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "export", "--app-token", "appXXX", "--table-id", "tblXXX",
+         "--shards", "2", "--shard-field", "序号"],
+    )
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert sorted(item["record_id"] for item in parsed["data"]["items"]) == ["r0", "r1", "r2", "r3"]
+    assert parsed["data"]["shards"] == 3
+    assert parsed["data"]["duplicates_skipped"] == 1
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_export_reports_missing_shard_bounds(mock_cc: MagicMock) -> None:
+    from types import SimpleNamespace
+
+    def page(items):
+        resp = _mock_success()
+        resp.data = SimpleNamespace(items=items, page_token=None, has_more=False)
+        return resp
+
+    mock_client = MagicMock()
+    mock_client.bitable.v1.app_table_field.list.return_value = page([SimpleNamespace(field_name="序号", type=2)])
+    mock_client.bitable.v1.app_table_record.list.side_effect = lambda request: page(
+        [] if "sort" in dict(request.queries) else [SimpleNamespace(record_id="r0", fields={})]
+    )
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(
+        bitable_app,
+        ["record", "export", "--app-token", "appXXX", "--table-id", "tblXXX", "--shards", "4", "--shard-field", "序号"],
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)["data"]
+    assert [item["record_id"] for item in data["items"]] == ["r0"]
+    assert data["shards"] == 1
+    assert "序号" in data["shards_skipped"]
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_record_export_requires_shard_field(mock_cc: MagicMock) -> None:
+    result = runner.invoke(
+        bitable_app, ["record", "export", "--app-token", "appXXX", "--table-id", "tblXXX", "--shards", "4"]
+    )
+    assert result.exit_code == 2
+    assert "--shard-field" in json.loads(result.stdout)["msg"]
+
+
+# ── Mirror commands ─────────────────────────────────────────────────────────
+
+
+@patch("feishu_cli.commands.bitable.create_client")
+def test_mirror_refreshes_incrementally_and_queries_locally(mock_cc: MagicMock, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    db = tmp_path / "mirror.db"
+    fields = _search_page([])
+    fields.data = SimpleNamespace(
+        items=[{"field_name": "标题", "type": 1}, {"field_name": "数量", "type": 2}, {"field_name": "修改时间", "type": 1002}],
+        page_token=None,
+        has_more=False,
+    )
+    mock_client = MagicMock()
+    records = mock_client.bitable.v1.app_table_record
+    mock_client.bitable.v1.app_table_field.list.return_value = fields
+    records.search.return_value = _search_page([
+        {"record_id": "rec1", "last_modified_time": 1000, "fields": {"标题": "a", "数量": 1}},
+        {"record_id": "rec2", "last_modified_time": 1000, "fields": {"标题": "b", "数量": 7}},
+    ])
+    mock_cc.return_value = mock_client
+    args = ["mirror", "refresh", "--app-token", "appXXX", "--table-id", "tblXXX", "--db", str(db)]
+
+    first = runner.invoke(bitable_app, args)
+
+    assert first.exit_code == 0
+    summary = json.loads(first.stdout)["data"]
+    assert (summary["full"], summary["upserted"], summary["rows"], summary["watermark"]) == (True, 2, 2, 1000)
+
+    records.search.return_value = _search_page([
+        {"record_id": "rec2", "last_modified_time": 1000, "fields": {"标题": "b", "数量": 7}},
+        {"record_id": "rec3", "last_modified_time": 3000, "fields": {"标题": "c", "数量": 9}},
+    ])
+    records.list.return_value = _search_page([{"record_id": "rec2"}, {"record_id": "rec3"}])
+
+    second = runner.invoke(bitable_app, args + ["--deletes-every", "0"])
+
+    assert second.exit_code == 0
+    summary = json.loads(second.stdout)["data"]
+    assert (summary["full"], summary["upserted"], summary["deleted"], summary["rows"]) == (False, 1, 1, 2)
+    assert records.search.call_args[0][0].request_body.filter.conditions[0].field_name == "修改时间"
+
+    query = runner.invoke(
+        bitable_app,
+        ["mirror", "query", "--db", str(db), "--sql", 'SELECT record_id FROM records WHERE "数量" > ? ORDER BY 1',
+         "--param", "5"],
+    )
+
+    assert query.exit_code == 0
+    parsed = json.loads(query.stdout)["data"]
+    assert parsed["items"] == [{"record_id": "rec2"}, {"record_id": "rec3"}]
+    assert (parsed["columns"], parsed["count"]) == (["record_id"], 2)
+
+
+def test_mirror_without_subcommand_shows_help() -> None:
+    result = runner.invoke(bitable_app, ["mirror"])
+    assert "refresh" in result.output and "query" in result.output
+
+
+def test_mirror_query_rejects_bad_sql(tmp_path) -> None:
+    db = tmp_path / "mirror.db"
+    db.touch()
+
+    result = runner.invoke(bitable_app, ["mirror", "query", "--db", str(db), "--sql", "SELEC 1"])
+
+    assert result.exit_code == 2
+    assert "SQLite error" in json.loads(result.stdout)["msg"]
@@ -0,0 +1,58 @@
+"""Tests for streaming bulk record helpers."""
+
+import io
+import threading
+import time
+
+import pytest
+
+from feishu_cli.bulk import chunked, read_rows, resolve_input_format, run_in_order
+
+
+def test_read_rows_jsonl_reports_bad_lines_and_skips_blank() -> None:
+    source = io.StringIO('{"a": 1}\n\nnot json\n{"b": 2}\n')
+    rows = list(read_rows(source, "jsonl"))
+    assert [(row.line, row.value) for row in rows] == [(1, {"a": 1}), (3, None), (4, {"b": 2})]
+    assert rows[1].error.startswith("Invalid JSON")
+
+
+def test_read_rows_csv_uses_header_and_drops_empty_cells() -> None:
+    source = io.StringIO("Name,Amount\nfoo,3\nbar,\nbaz,1,extra\n")
+    rows = list(read_rows(source, "csv"))
+    assert rows[0].value == {"Name": "foo", "Amount": "3"}
+    assert rows[1].value == {"Name": "bar"}
+    assert rows[2].error is not None
+
+
+def test_resolve_input_format() -> None:
+    from pathlib import Path
+
+    assert resolve_input_format(Path("rows.CSV"), None) == "csv"
+    assert resolve_input_format(None, None) == "jsonl"
+    with pytest.raises(ValueError):
+        resolve_input_format(None, "xlsx")
+
+
+def test_chunked() -> None:
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_run_in_order_is_concurrent_but_ordered() -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def worker(value: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02 * (5 - value))
+        with lock:
+            active -= 1
+        return value * 10
+
+    results = list(run_in_order(range(5), worker, concurrency=3))
+
+    assert results == [(value, value * 10) for value in range(5)]
+    assert peak > 1
@@ -0,0 +1,46 @@
+"""Tests for incremental change-tracking state."""
+
+import json
+
+import pytest
+
+from feishu_cli.changes import (
+    WATERMARK_LAG_MS,
+    ChangeState,
+    ChangeStateError,
+    next_watermark,
+    parse_watermark,
+)
+
+
+def test_state_round_trip_and_table_binding(tmp_path) -> None:
+    path = tmp_path / "changes.json"
+    state = ChangeState.load(path, "app/tbl")
+    assert state.watermark == 0 and state.ids_due(3600)
+    state.watermark = 123
+    state.ids = {"rec2", "rec1"}
+    state.ids_checked_at = 1000.0
+    state.save()
+
+    loaded = ChangeState.load(path, "app/tbl")
+    assert (loaded.watermark, loaded.ids) == (123, {"rec1", "rec2"})
+    assert not loaded.ids_due(3600, now=2000.0)
+    assert loaded.ids_due(3600, now=5000.0)
+    assert json.loads(path.read_text())["ids"] == ["rec1", "rec2"]
+    assert path.stat().st_mode & 0o777 == 0o600
+    with pytest.raises(ChangeStateError):
+        ChangeState.load(path, "app/other")
+
+
+def test_next_watermark_stays_behind_walk_start() -> None:
+    started = 10_000_000
+    assert next_watermark(100, [500, 300], started) == 500
+    assert next_watermark(100, [started], started) == started - WATERMARK_LAG_MS
+    assert next_watermark(100, [], started) == 100
+
+
+def test_parse_watermark() -> None:
+    assert parse_watermark("1700000000000") == 1700000000000
+    assert parse_watermark("2024-01-02T03:04:05+00:00") == 1704164645000
+    with pytest.raises(ValueError):
+        parse_watermark("yesterday")
@@ -24,3 +24,29 @@ def test_load_config_missing_raises(monkeypatch):
     monkeypatch.delenv("FEISHU_APP_SECRET", raising=False)
     with pytest.raises(ConfigError, match="FEISHU_APP_ID"):
         load_config()
+
+
+def test_load_config_http_settings(monkeypatch):
+    monkeypatch.setenv("FEISHU_APP_ID", "test_id")
+    monkeypatch.setenv("FEISHU_APP_SECRET", "test_secret")
+    monkeypatch.setenv("FEISHU_HTTP_POOL_SIZE", "32")
+    monkeypatch.setenv("FEISHU_HTTP_TIMEOUT", "12.5")
+    config = load_config()
+    assert config.http_pool_size == 32
+    assert config.http_timeout == 12.5
+    assert config.http_connect_timeout == 5.0
+
+    monkeypatch.setenv("FEISHU_HTTP_POOL_SIZE", "0")
+    with pytest.raises(ConfigError, match="FEISHU_HTTP_POOL_SIZE"):
+        load_config()
+
+
+def test_load_config_rate_limits(monkeypatch):
+    monkeypatch.setenv("FEISHU_APP_ID", "test_id")
+    monkeypatch.setenv("FEISHU_APP_SECRET", "test_secret")
+    monkeypatch.setenv("FEISHU_RATE_LIMITS", "sheets.v3=5,wiki.v2:write=1")
+    assert load_config().rate_limits == (("sheets.v3", 5.0), ("wiki.v2:write", 1.0))
+
+    monkeypatch.setenv("FEISHU_RATE_LIMITS", "sheets.v3")
+    with pytest.raises(ConfigError, match="FEISHU_RATE_LIMITS"):
+        load_config()
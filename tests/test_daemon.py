@@ -0,0 +1,164 @@
+"""Tests for the warm daemon and in-process dispatch."""
+
+import io
+import json
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from feishu_cli import daemon as daemon_mod
+from feishu_cli.daemon import DaemonServer, forward
+from feishu_cli.dispatch import run_command
+
+
+def _mock_success() -> MagicMock:
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = None
+    return resp
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("FEISHU_APP_ID", "test_id")
+    monkeypatch.setenv("FEISHU_APP_SECRET", "test_secret")
+    server = DaemonServer(tmp_path / "daemon.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def _forward(server: DaemonServer, argv, tmp_path):
+    out_path = tmp_path / "out.txt"
+    with open(os.devnull, "rb") as stdin, open(out_path, "wb") as stdout, open(
+        tmp_path / "err.txt", "wb"
+    ) as stderr:
+        code = forward(
+            argv,
+            socket_path=server.socket_path,
+            fds=(stdin.fileno(), stdout.fileno(), stderr.fileno()),
+        )
+    return code, out_path.read_text(encoding="utf-8")
+
+
+@patch("feishu_cli.commands.docs.create_client")
+def test_forward_runs_command_in_daemon(mock_cc: MagicMock, daemon, tmp_path) -> None:
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    code, output = _forward(daemon, ["docs", "get", "--token", "doxXXX"], tmp_path)
+
+    assert code == 0
+    assert json.loads(output)["success"] is True
+    mock_client.docs.v1.content.get.assert_called_once()
+
+
+def test_forward_rejects_other_identity(daemon, tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("FEISHU_APP_ID", "other_id")
+    code, output = _forward(daemon, ["docs", "--help"], tmp_path)
+    assert code is None
+    assert output == ""
+
+
+def test_forward_rejects_other_settings(daemon, tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("FEISHU_RATE_LIMITS", "bitable.v1=1")
+    code, output = _forward(daemon, ["docs", "--help"], tmp_path)
+    assert code is None
+    assert output == ""
+
+
+def test_forward_falls_back_when_send_fails(daemon, tmp_path) -> None:
+    with patch.object(daemon_mod.socket.socket, "sendmsg", side_effect=BrokenPipeError):
+        code, _output = _forward(daemon, ["docs", "--help"], tmp_path)
+    assert code is None
+
+
+def test_recv_request_closes_fds_on_oversized_header(monkeypatch) -> None:
+    import array
+    import socket
+
+    monkeypatch.setattr(daemon_mod, "_MAX_HEADER_BYTES", 8)
+    read_end, write_end = os.pipe()
+    os.set_blocking(read_end, False)
+    client, server = socket.socketpair()
+    try:
+        client.sendmsg(
+            [b"x" * 64], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", [write_end] * 3))]
+        )
+        os.close(write_end)
+        with pytest.raises(ValueError, match="header too large"):
+            daemon_mod._recv_request(server)
+        # Every received copy of the write end was closed, so the pipe is at EOF.
+        assert os.read(read_end, 1) == b""
+    finally:
+        client.close()
+        server.close()
+        os.close(read_end)
+
+
+def test_forward_without_daemon_returns_none(tmp_path) -> None:
+    assert forward(["docs", "--help"], socket_path=tmp_path / "missing.sock") is None
+
+
+def test_daemon_refuses_live_socket(daemon) -> None:
+    with pytest.raises(OSError, match="already listening"):
+        DaemonServer(daemon.socket_path)
+
+
+def test_daemon_refuses_to_replace_regular_file(tmp_path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me", encoding="utf-8")
+    with pytest.raises(OSError, match="not a socket"):
+        DaemonServer(path)
+    assert path.read_text(encoding="utf-8") == "keep me"
+
+
+def test_daemon_replaces_stale_socket(tmp_path) -> None:
+    import socket
+
+    path = tmp_path / "daemon.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    server = DaemonServer(path)
+    server.server_close()
+
+
+def test_cwd_gate_hands_back_instead_of_waiting(tmp_path) -> None:
+    gate = daemon_mod._CwdGate()
+    home = os.getcwd()
+    with gate.enter(home) as first:
+        with gate.enter(home) as second, gate.enter(str(tmp_path)) as other:
+            assert first and second and not other
+    with gate.enter(str(tmp_path)) as other:
+        assert other and os.path.realpath(os.getcwd()) == os.path.realpath(tmp_path)
+        with gate.enter(home) as local, gate.enter(str(tmp_path)) as again:
+            assert not local and not again
+    assert os.getcwd() == home
+    with gate.enter(home) as local:
+        assert local
+
+
+@patch("feishu_cli.commands.docs.create_client")
+def test_run_command_captures_output_per_call(mock_cc: MagicMock) -> None:
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.return_value = _mock_success()
+    mock_cc.return_value = mock_client
+
+    out = io.StringIO()
+    code = run_command(["docs", "get", "--token", "doxXXX"], stdout=out)
+
+    assert code == 0
+    assert json.loads(out.getvalue())["success"] is True
+
+
+def test_run_command_reports_usage_errors() -> None:
+    err = io.StringIO()
+    code = run_command(["docs", "get"], stdout=io.StringIO(), stderr=err)
+    assert code == 2
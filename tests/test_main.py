@@ -0,0 +1,61 @@
+"""Tests for the lazy top-level command registry."""
+
+import json
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from feishu_cli.main import COMMAND_REGISTRY, app, load_command
+
+runner = CliRunner()
+
+
+def test_help_lists_registry_without_importing_domains() -> None:
+    probe = (
+        "import sys\n"
+        "from feishu_cli.main import app\n"
+        "try:\n"
+        "    app(args=['--help'], prog_name='feishu-cli')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in sys.modules if m.startswith(('feishu_cli.commands.', 'lark_oapi'))]\n"
+        "sys.stderr.write(repr(loaded))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", probe], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True,
+    )
+    for name in COMMAND_REGISTRY:
+        assert name in proc.stdout
+    assert proc.stderr == "[]"
+
+
+@pytest.mark.parametrize("name", list(COMMAND_REGISTRY))
+def test_registry_help_matches_module(name: str) -> None:
+    command = load_command(name)
+    assert command.name == name
+    module_help = (command.help or "").strip().splitlines()[0]
+    assert module_help == COMMAND_REGISTRY[name][2]
+
+
+@patch("feishu_cli.commands.docs.create_client")
+def test_lazy_command_dispatch(mock_cc: MagicMock) -> None:
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = None
+    mock_client = MagicMock()
+    mock_client.docs.v1.content.get.return_value = resp
+    mock_cc.return_value = mock_client
+
+    result = runner.invoke(app, ["docs", "get", "--token", "doxXXX"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["success"] is True
+
+
+def test_single_command_domain_stays_a_group() -> None:
+    assert isinstance(load_command("docs"), typer.core.TyperGroup)
@@ -0,0 +1,73 @@
+"""Tests for the local SQLite table mirror."""
+
+import sqlite3
+
+import pytest
+
+from feishu_cli.mirror import Mirror, column_type, column_value, run_query
+
+
+FIELDS = [
+    {"field_name": "标题", "type": 1},
+    {"field_name": "数量", "type": 2},
+    {"field_name": "完成", "type": 7},
+    {"field_name": "标签", "type": 4},
+]
+
+
+def test_column_types_and_values() -> None:
+    assert [column_type(item["type"]) for item in FIELDS] == ["TEXT", "REAL", "INTEGER", "TEXT"]
+    assert column_value(1, [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]) == "ab"
+    assert column_value(2, "3.5") == 3.5
+    assert column_value(7, True) == 1
+    assert column_value(5, 1700000000000.0) == 1700000000000
+    assert column_value(4, ["x", "y"]) == '["x", "y"]'
+    assert column_value(2, "n/a") is None
+
+
+def test_mirror_upserts_and_rebuilds_on_schema_change(tmp_path) -> None:
+    path = tmp_path / "m.db"
+    mirror = Mirror(path)
+    assert mirror.ensure_schema(FIELDS, "app/tbl") is False
+    mirror.upsert([{"record_id": "rec1", "last_modified_time": 5, "fields": {"标题": "a", "数量": 2, "标签": ["x"]}}])
+    mirror.save_meta("app/tbl", 5, 0.0)
+    assert mirror.ensure_schema(FIELDS, "app/tbl") is False
+    assert mirror.record_ids() == {"rec1"}
+
+    assert mirror.ensure_schema(FIELDS[:2], "app/tbl") is True
+    assert mirror.count() == 0 and mirror.meta() is None
+    mirror.close()
+
+
+def test_run_query_is_read_only(tmp_path) -> None:
+    path = tmp_path / "m.db"
+    mirror = Mirror(path)
+    mirror.ensure_schema(FIELDS, "app/tbl")
+    mirror.upsert([
+        {"record_id": "rec1", "fields": {"数量": 2, "标签": ["x"]}},
+        {"record_id": "rec2", "fields": {"数量": 5}},
+    ])
+    mirror.close()
+
+    columns, rows = run_query(path, 'SELECT record_id, "数量" FROM records WHERE "数量" > ?', [3])
+    assert columns == ["record_id", "数量"]
+    assert rows == [{"record_id": "rec2", "数量": 5.0}]
+    with pytest.raises(sqlite3.OperationalError):
+        run_query(path, "DELETE FROM records")
+
+
+def test_mirror_gives_case_colliding_fields_distinct_columns(tmp_path) -> None:
+    fields = [
+        {"field_name": "Name", "type": 1},
+        {"field_name": "name", "type": 1},
+        {"field_name": "Record_ID", "type": 1},
+    ]
+    path = tmp_path / "m.db"
+    mirror = Mirror(path)
+    mirror.ensure_schema(fields, "app/tbl")
+    mirror.upsert([{"record_id": "rec1", "fields": {"Name": "upper", "name": "lower", "Record_ID": "mine"}}])
+    assert mirror.renamed() == {"name": "name_2", "Record_ID": "Record_ID_2"}
+    mirror.close()
+
+    _columns, rows = run_query(path, 'SELECT record_id, "Name", "name_2", "Record_ID_2" FROM records')
+    assert rows == [{"record_id": "rec1", "Name": "upper", "name_2": "lower", "Record_ID_2": "mine"}]
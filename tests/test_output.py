@@ -46,3 +46,121 @@ def test_format_error_with_log_id():
     result = format_error(code=1, msg="err", log_id="abc")
     parsed = json.loads(result)
     assert parsed["log_id"] == "abc"
+
+
+def test_ndjson_list_response_emits_item_lines_and_summary():
+    from types import SimpleNamespace
+
+    from feishu_cli.utils.output import set_output_format
+
+    mock_resp = MagicMock()
+    mock_resp.success.return_value = True
+    mock_resp.data = SimpleNamespace(items=[{"a": 1}, {"a": 2}], has_more=False)
+    set_output_format("ndjson")
+    try:
+        lines = format_response(mock_resp).splitlines()
+        error = format_error(code=1, msg="err")
+    finally:
+        set_output_format("json")
+
+    assert [json.loads(line) for line in lines] == [
+        {"a": 1},
+        {"a": 2},
+        {"success": True, "items_key": "items", "count": 2, "data": {"has_more": False}},
+    ]
+    assert error == '{"success":false,"code":1,"msg":"err"}'
+
+
+def test_ndjson_stream_writer_summary_after_error(capsys):
+    from feishu_cli.utils.output import ItemStreamWriter, set_output_format
+
+    set_output_format("ndjson")
+    try:
+        writer = ItemStreamWriter("members")
+        writer.write_item({"id": "u1"})
+        writer.flush()
+        writer.finish_error({"pages": 1, "has_more": True}, code=5, msg="boom")
+    finally:
+        set_output_format("json")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0]) == {"id": "u1"}
+    summary = json.loads(lines[1])
+    assert summary["success"] is False
+    assert summary["count"] == 1
+    assert summary["items_key"] == "members"
+    assert summary["data"] == {"pages": 1, "has_more": True}
+
+
+def test_main_output_option_selects_ndjson_for_one_invocation():
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    from typer.testing import CliRunner
+
+    from feishu_cli.main import app
+    from feishu_cli.utils.output import get_output_format
+
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = SimpleNamespace(items=[{"space_id": "s1"}], page_token=None, has_more=False)
+    with patch("feishu_cli.commands.wiki.create_client") as mock_cc:
+        mock_cc.return_value.wiki.v2.space.list.return_value = resp
+        result = CliRunner().invoke(app, ["--output", "ndjson", "wiki", "space", "list"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()][0] == {"space_id": "s1"}
+    assert get_output_format() == "json"
+    assert CliRunner().invoke(app, ["--output", "yaml", "wiki", "space", "list"]).exit_code == 2
+
+
+def _raw_response(body):
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.raw.content = json.dumps(body).encode("utf-8")
+    resp.data = MagicMock()
+    return resp
+
+
+def test_format_response_reads_data_from_raw_body():
+    body = {"code": 0, "msg": "success", "data": {"items": [{"record_id": "rec1", "extra": None}], "has_more": False}}
+    with_raw = _raw_response(body)
+
+    parsed = json.loads(format_response(with_raw))
+
+    assert parsed == {"success": True, "data": body["data"]}
+
+
+def test_compact_output_is_single_line():
+    from feishu_cli.utils.output import set_output_format
+
+    resp = _raw_response({"code": 0, "data": {"items": [{"a": 1}], "has_more": False}})
+    set_output_format("compact")
+    try:
+        text = format_response(resp)
+    finally:
+        set_output_format("json")
+
+    assert text == '{"success":true,"data":{"items":[{"a":1}],"has_more":false}}'
+
+
+def test_compact_stream_writer_matches_document_layout(capsys):
+    from feishu_cli.utils.output import ItemStreamWriter, set_output_format
+
+    set_output_format("compact")
+    try:
+        writer = ItemStreamWriter("items")
+        writer.write_item({"a": 1})
+        writer.write_item({"a": 2})
+        writer.finish({"pages": 1, "has_more": False})
+        empty = ItemStreamWriter("items")
+        empty.finish({"pages": 1})
+    finally:
+        set_output_format("json")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0]) == {
+        "data": {"items": [{"a": 1}, {"a": 2}], "pages": 1, "has_more": False},
+        "success": True,
+    }
+    assert json.loads(lines[1]) == {"data": {"items": [], "pages": 1}, "success": True}
@@ -0,0 +1,253 @@
+"""Tests for the shared `--all` paginator."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from feishu_cli.pagination import PageError, PageOptions, iter_pages, run_list_command, stream_all_pages
+
+
+def _page(items, page_token=None, has_more=False):
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = SimpleNamespace(items=items, page_token=page_token, has_more=has_more)
+    return resp
+
+
+def _failure():
+    resp = MagicMock()
+    resp.success.return_value = False
+    resp.code = 1254043
+    resp.msg = "record not found"
+    resp.get_log_id.return_value = "log-1"
+    return resp
+
+
+def _requests(token):
+    return SimpleNamespace(page_token=token)
+
+
+@pytest.fixture(autouse=True)
+def no_auth():
+    with patch("feishu_cli.runtime.resolve_user_request_option", return_value=None):
+        yield
+
+
+def _run(api_method, **kwargs):
+    app = typer.Typer()
+
+    @app.command()
+    def run() -> None:
+        stream_all_pages(MagicMock(), api_method, _requests, **kwargs)
+
+    result = CliRunner().invoke(app, [])
+    return result.exit_code, json.loads(result.stdout)
+
+
+def _run_list(api_method, options):
+    app = typer.Typer()
+
+    @app.command()
+    def run() -> None:
+        run_list_command(MagicMock(), api_method, _requests, options)
+
+    result = CliRunner().invoke(app, [])
+    return result.exit_code, json.loads(result.stdout)
+
+
+def test_run_list_command_prints_one_page_unless_streaming() -> None:
+    api_method = MagicMock(side_effect=[_page([1, 2], "p3", True)])
+    code, output = _run_list(api_method, PageOptions(page_token="p2"))
+    assert code == 0
+    assert output["data"]["items"] == [1, 2]
+    assert api_method.call_args.args[0].page_token == "p2"
+
+    api_method = MagicMock(side_effect=[_page([1, 2], "p2", True), _page([3])])
+    code, output = _run_list(api_method, PageOptions(limit=3))
+    assert code == 0
+    assert output["data"]["items"] == [1, 2, 3]
+
+
+def test_iter_pages_follows_page_token_lazily() -> None:
+    api_method = MagicMock(side_effect=[_page([1, 2], "p2", True), _page([3])])
+    pages = iter_pages(MagicMock(), api_method, _requests, page_token="p1")
+
+    first = next(pages)
+    assert first.items == [1, 2]
+    assert api_method.call_count == 1
+    assert [page.items for page in pages] == [[3]]
+    assert [call.args[0].page_token for call in api_method.call_args_list] == ["p1", "p2"]
+
+
+def test_iter_pages_raises_with_failing_token() -> None:
+    api_method = MagicMock(side_effect=[_page([1], "p2", True), _failure()])
+    with pytest.raises(PageError) as excinfo:
+        list(iter_pages(MagicMock(), api_method, _requests))
+    assert excinfo.value.page_token == "p2"
+
+
+def test_stream_all_pages_emits_every_item() -> None:
+    api_method = MagicMock(side_effect=[_page([{"a": 1}], "p2", True), _page([{"a": 2}, {"a": 3}])])
+    code, parsed = _run(api_method)
+    assert code == 0
+    assert parsed == {
+        "success": True,
+        "data": {"items": [{"a": 1}, {"a": 2}, {"a": 3}], "pages": 2, "has_more": False},
+    }
+
+
+def test_stream_all_pages_limit_and_max_pages() -> None:
+    api_method = MagicMock(side_effect=[_page([1, 2], "p2", True), _page([3, 4], "p3", True)])
+    code, parsed = _run(api_method, limit=3)
+    assert code == 0
+    assert parsed["data"]["items"] == [1, 2, 3]
+    assert parsed["data"]["has_more"] is True
+    assert "page_token" not in parsed["data"]
+
+    api_method = MagicMock(side_effect=[_page([1, 2], "p2", True), _page([3, 4], "p3", True)])
+    code, parsed = _run(api_method, max_pages=1)
+    assert api_method.call_count == 1
+    assert parsed["data"] == {"items": [1, 2], "pages": 1, "has_more": True, "page_token": "p2"}
+
+
+def test_stream_all_pages_reports_failure_after_partial_output() -> None:
+    api_method = MagicMock(side_effect=[_page([1], "p2", True), _failure()])
+    code, parsed = _run(api_method)
+    assert code == 1
+    assert parsed["success"] is False
+    assert parsed["code"] == 1254043
+    assert parsed["log_id"] == "log-1"
+    assert parsed["data"] == {"items": [1], "pages": 1, "has_more": True, "page_token": "p2"}
+
+
+def _wait_for(predicate, timeout=2.0):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_prefetch_requests_next_page_while_current_is_consumed() -> None:
+    from feishu_cli.pagination import prefetch_pages
+
+    responses = [_page([i], f"p{i + 1}", True) for i in range(5)] + [_page([5])]
+    api_method = MagicMock(side_effect=responses)
+    pages = prefetch_pages(iter_pages(MagicMock(), api_method, _requests), depth=1)
+
+    assert next(pages).items == [0]
+    # Page 2 is fetched without the consumer asking for it...
+    assert _wait_for(lambda: api_method.call_count >= 2)
+    # ...but the producer never runs more than depth + 1 pages ahead.
+    assert not _wait_for(lambda: api_method.call_count > 3, timeout=0.2)
+    assert [page.items for page in pages] == [[1], [2], [3], [4], [5]]
+
+
+def test_prefetch_reraises_errors_in_order() -> None:
+    from feishu_cli.pagination import prefetch_pages
+
+    api_method = MagicMock(side_effect=[_page([1], "p2", True), _failure()])
+    pages = prefetch_pages(iter_pages(MagicMock(), api_method, _requests), depth=2)
+
+    assert next(pages).items == [1]
+    with pytest.raises(PageError):
+        next(pages)
+
+
+def test_prefetch_keeps_pinned_request_option() -> None:
+    from feishu_cli.pagination import prefetch_pages
+    from feishu_cli.runtime import pinned_request_option
+
+    api_method = MagicMock(side_effect=[_page([1], "p2", True), _page([2])])
+    with pinned_request_option(SimpleNamespace(user_access_token="pinned")):
+        pages = list(prefetch_pages(iter_pages(MagicMock(), api_method, _requests), depth=1))
+
+    assert len(pages) == 2
+    assert all(call.args[1].user_access_token == "pinned" for call in api_method.call_args_list)
+
+
+def _listing(page_size):
+    def factory(token):
+        queries = [("page_size", page_size)] + ([("page_token", token)] if token else [])
+        return SimpleNamespace(page_token=token, uri="/records", queries=queries)
+    return factory
+
+
+def _run_listing(api_method, factory, **kwargs):
+    app = typer.Typer()
+
+    @app.command()
+    def run() -> None:
+        stream_all_pages(MagicMock(), api_method, factory, **kwargs)
+
+    result = CliRunner().invoke(app, [])
+    return result.exit_code, json.loads(result.stdout)
+
+
+def test_checkpoint_resumes_after_failure_and_is_idempotent(tmp_path) -> None:
+    path = tmp_path / "walk.json"
+    api_method = MagicMock(side_effect=[_page([1, 2], "p2", True), _failure()])
+    code, parsed = _run_listing(api_method, _listing(2), checkpoint_path=path, prefetch=0)
+    assert code == 1
+    assert parsed["data"]["items"] == [1, 2]
+    assert json.loads(path.read_text())["page_token"] == "p2"
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    api_method = MagicMock(side_effect=[_page([3, 4], "p3", True), _page([5])])
+    code, parsed = _run_listing(api_method, _listing(2), checkpoint_path=path)
+    assert code == 0
+    assert parsed["data"]["items"] == [3, 4, 5]
+    assert parsed["data"]["checkpoint"]["emitted"] == 5
+    assert parsed["data"]["checkpoint"]["done"] is True
+    assert api_method.call_args_list[0].args[0].page_token == "p2"
+
+    api_method = MagicMock()
+    code, parsed = _run_listing(api_method, _listing(2), checkpoint_path=path)
+    assert code == 0
+    assert parsed["data"]["items"] == []
+    api_method.assert_not_called()
+
+
+def test_checkpoint_resumes_mid_page_after_limit(tmp_path) -> None:
+    path = tmp_path / "walk.json"
+    api_method = MagicMock(side_effect=[_page([1, 2, 3], "p2", True)])
+    _run_listing(api_method, _listing(3), checkpoint_path=path, limit=2)
+
+    api_method = MagicMock(side_effect=[_page([1, 2, 3], "p2", True), _page([4])])
+    code, parsed = _run_listing(api_method, _listing(3), checkpoint_path=path)
+    assert parsed["data"]["items"] == [3, 4]
+    assert api_method.call_args_list[0].args[0].page_token is None
+
+
+def test_checkpoint_rejects_other_listing(tmp_path) -> None:
+    path = tmp_path / "walk.json"
+    _run_listing(MagicMock(side_effect=[_page([1], "p2", True)]), _listing(1), checkpoint_path=path, max_pages=1)
+
+    code, parsed = _run_listing(MagicMock(), _listing(50), checkpoint_path=path)
+    assert code == 2
+    assert "different listing" in parsed["msg"]
+
+
+def test_request_fingerprint_covers_body_but_not_page_token() -> None:
+    from lark_oapi.api.bitable.v1 import SearchAppTableRecordRequest, SearchAppTableRecordRequestBody
+
+    from feishu_cli.pagination import request_fingerprint
+
+    def search(view_id, token=None):
+        builder = (
+            SearchAppTableRecordRequest.builder()
+            .app_token("app")
+            .table_id("tbl")
+            .request_body(SearchAppTableRecordRequestBody.builder().view_id(view_id).build())
+        )
+        if token:
+            builder = builder.page_token(token)
+        return builder.build()
+
+    assert request_fingerprint(search("v1")) == request_fingerprint(search("v1", "pt2"))
+    assert request_fingerprint(search("v1")) != request_fingerprint(search("v2"))
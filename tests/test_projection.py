@@ -0,0 +1,50 @@
+"""Tests for --select field projection."""
+
+import pytest
+
+from feishu_cli.projection import Projection
+
+
+RECORD = {
+    "record_id": "rec1",
+    "fields": {"Name": "a", "Amount": 3, "Owner": [{"id": "ou1", "name": "x"}, {"id": "ou2"}]},
+    "created_time": 1,
+}
+
+
+def test_dotted_paths_keep_only_selected_keys() -> None:
+    projection = Projection.parse("record_id, fields.Name")
+    assert projection.apply(RECORD) == {"record_id": "rec1", "fields": {"Name": "a"}}
+
+
+def test_wildcard_maps_list_items_and_skips_missing_paths() -> None:
+    projection = Projection.parse("fields.Owner.*.name,fields.Missing")
+    assert projection.apply(RECORD) == {"fields": {"Owner": [{"name": "x"}, {}]}}
+
+
+def test_wildcard_over_object_keys_and_parent_path_wins() -> None:
+    assert Projection.parse("fields.*").apply(RECORD) == {"fields": RECORD["fields"]}
+    assert Projection.parse("fields,fields.Name").apply(RECORD)["fields"] == RECORD["fields"]
+
+
+def test_apply_data_projects_list_items_only() -> None:
+    data = {"items": [RECORD], "has_more": False, "page_token": "pt"}
+    projected = Projection.parse("record_id").apply_data(data, "items")
+    assert projected == {"items": [{"record_id": "rec1"}], "has_more": False, "page_token": "pt"}
+
+
+def test_top_level_names_for_pushdown() -> None:
+    assert Projection.parse("record_id,fields.Name,fields.Owner.*.id").top_level_names("fields") == [
+        "Name",
+        "Owner",
+    ]
+    assert Projection.parse("record_id").top_level_names("fields") == []
+    assert Projection.parse("fields").top_level_names("fields") is None
+    assert Projection.parse("fields.*").top_level_names("fields") is None
+
+
+def test_parse_rejects_empty_segments() -> None:
+    assert Projection.parse(None) is None
+    assert Projection.parse(" ") is None
+    with pytest.raises(ValueError):
+        Projection.parse("fields..Name")
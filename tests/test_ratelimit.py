@@ -0,0 +1,102 @@
+"""Tests for the per-family client-side rate limiter."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import lark_oapi as lark
+from lark_oapi.api.bitable.v1 import (
+    BatchCreateAppTableRecordRequest,
+    BatchGetAppTableRecordRequest,
+    ListAppTableRecordRequest,
+    SearchAppTableRecordRequest,
+)
+import pytest
+
+from feishu_cli.ratelimit import RateLimiter, TokenBucket, api_family, is_write_request, parse_rate_limits
+
+
+def _client() -> lark.Client:
+    return lark.Client.builder().app_id("cli_test").app_secret("secret").build()
+
+
+def test_api_family_from_sdk_method() -> None:
+    client = _client()
+    assert api_family(client.bitable.v1.app_table_record.list) == "bitable.v1.app_table_record"
+    assert api_family(client.sheets.v3.spreadsheet_sheet_filter.create) == "sheets.v3.spreadsheet_sheet_filter"
+    assert api_family(MagicMock()) is None
+
+
+def test_limiter_matches_longest_prefix_and_kind() -> None:
+    client = _client()
+    limiter = RateLimiter({
+        "bitable.v1": 50,
+        "bitable.v1.app_table_record:write": 5,
+        "sheets.v3": 0,
+    })
+    records = client.bitable.v1.app_table_record
+    write = limiter.bucket_for(records.batch_create, BatchCreateAppTableRecordRequest.builder().build())
+    read = limiter.bucket_for(records.list, ListAppTableRecordRequest.builder().build())
+
+    assert write.rate == 5
+    assert read.rate == 50
+    assert limiter.bucket_for(records.list, ListAppTableRecordRequest.builder().build()) is read
+    assert limiter.bucket_for(client.sheets.v3.spreadsheet.get, SimpleNamespace()) is None
+
+
+def test_read_only_post_endpoints_count_as_reads() -> None:
+    client = _client()
+    limiter = RateLimiter({"bitable.v1": 50, "bitable.v1.app_table_record:write": 5})
+    records = client.bitable.v1.app_table_record
+    search = SearchAppTableRecordRequest.builder().build()
+
+    assert is_write_request(BatchCreateAppTableRecordRequest.builder().build())
+    assert not is_write_request(search)
+    assert not is_write_request(BatchGetAppTableRecordRequest.builder().build())
+    assert not is_write_request(ListAppTableRecordRequest.builder().build())
+    assert limiter.bucket_for(records.search, search).rate == 50
+
+
+def test_token_bucket_spaces_out_reservations() -> None:
+    bucket = TokenBucket(rate=50, burst=1)
+    delays = [bucket.reserve() for _ in range(3)]
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(0.02, abs=0.005)
+    assert delays[2] == pytest.approx(0.04, abs=0.005)
+
+
+def test_parse_rate_limits() -> None:
+    assert parse_rate_limits("sheets.v3=20, bitable.v1.app_table_record:write=2.5") == {
+        "sheets.v3": 20.0,
+        "bitable.v1.app_table_record:write": 2.5,
+    }
+    for raw in ("sheets.v3", "sheets.v3:delete=1", "sheets.v3=-1", "sheets.v3=fast"):
+        with pytest.raises(ValueError):
+            parse_rate_limits(raw)
+
+
+def test_call_api_shares_bucket_across_threads() -> None:
+    from feishu_cli import ratelimit
+    from feishu_cli.runtime import call_api
+
+    client = _client()
+    limiter = RateLimiter({"bitable.v1.app_table_record:write": 1000})
+    request = BatchCreateAppTableRecordRequest.builder().build()
+    calls = []
+    limiter.acquire = MagicMock(wraps=limiter.acquire)
+
+    with patch.object(ratelimit, "_LIMITER", limiter), \
+            patch("feishu_cli.runtime.resolve_user_request_option", return_value=None), \
+            patch.object(type(client.bitable.v1.app_table_record), "batch_create",
+                         lambda self, req: calls.append(req)):
+        method = client.bitable.v1.app_table_record.batch_create
+        threads = [threading.Thread(target=call_api, args=(client, method, request)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        bucket = limiter.bucket_for(method, request)
+
+    assert len(calls) == 4
+    assert limiter.acquire.call_count == 4
+    assert list(limiter._buckets.values()) == [bucket]
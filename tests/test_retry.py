@@ -0,0 +1,94 @@
+"""Tests for call_api retry policy."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from lark_oapi.api.bitable.v1 import (
+    BatchCreateAppTableRecordRequest,
+    CreateAppTableRecordRequest,
+    ListAppTableRecordRequest,
+)
+from lark_oapi.core.model import BaseResponse, RawResponse
+import pytest
+import requests
+
+from feishu_cli.retry import RetryPolicy, is_retry_safe, retry_hint
+from feishu_cli.runtime import call_api
+from feishu_cli.utils.output import format_response
+
+
+def _response(code: int, status: int = 200, headers: dict = None) -> BaseResponse:
+    response = BaseResponse({"code": code, "msg": "m"})
+    response.raw = RawResponse()
+    response.raw.status_code = status
+    response.raw.headers = headers or {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def no_auth_or_sleep():
+    with patch("feishu_cli.runtime.resolve_user_request_option", return_value=None), \
+            patch("feishu_cli.runtime.time.sleep") as sleep:
+        yield sleep
+
+
+def test_get_retries_throttling_then_succeeds(no_auth_or_sleep) -> None:
+    api_method = MagicMock(side_effect=[_response(1254290), _response(0, headers={})])
+    request = ListAppTableRecordRequest.builder().app_token("a").table_id("t").build()
+
+    response = call_api(MagicMock(), api_method, request)
+
+    assert response.success()
+    assert response.attempts == 2
+    assert api_method.call_count == 2
+    assert no_auth_or_sleep.call_count == 1
+    assert json.loads(format_response(response))["attempts"] == 2
+
+
+def test_retry_gives_up_after_max_attempts() -> None:
+    api_method = MagicMock(return_value=_response(99991400, status=429))
+    request = ListAppTableRecordRequest.builder().build()
+
+    response = call_api(MagicMock(), api_method, request)
+
+    assert api_method.call_count == RetryPolicy().max_attempts
+    parsed = json.loads(format_response(response))
+    assert parsed["success"] is False
+    assert parsed["attempts"] == RetryPolicy().max_attempts
+
+
+def test_write_without_client_token_is_not_retried() -> None:
+    api_method = MagicMock(return_value=_response(1254290))
+    request = CreateAppTableRecordRequest.builder().app_token("a").table_id("t").build()
+
+    response = call_api(MagicMock(), api_method, request)
+
+    assert api_method.call_count == 1
+    assert "attempts" not in json.loads(format_response(response))
+
+
+def test_write_with_client_token_retries_connection_errors() -> None:
+    api_method = MagicMock(side_effect=[requests.exceptions.ConnectionError("reset"), _response(0)])
+    request = BatchCreateAppTableRecordRequest.builder().client_token("uuid-1").build()
+
+    assert is_retry_safe(request)
+    assert call_api(MagicMock(), api_method, request).attempts == 2
+
+
+def test_fatal_errors_are_not_retried() -> None:
+    api_method = MagicMock(side_effect=[_response(1254043), KeyError("boom")])
+    request = ListAppTableRecordRequest.builder().build()
+
+    assert call_api(MagicMock(), api_method, request).code == 1254043
+    api_method = MagicMock(side_effect=KeyError("boom"))
+    with pytest.raises(KeyError):
+        call_api(MagicMock(), api_method, request)
+    assert api_method.call_count == 1
+
+
+def test_retry_hint_and_backoff() -> None:
+    assert retry_hint(_response(99991400, headers={"X-Ogw-Ratelimit-Reset": "3"})) == 3.0
+    assert retry_hint(_response(99991400, headers={"Retry-After": "oops"})) is None
+    policy = RetryPolicy(base_delay=0.5, max_delay=4)
+    assert 3.0 <= policy.backoff(1, hint=3.0) <= 3.5
+    assert all(0 <= policy.backoff(10) <= 4 for _ in range(20))
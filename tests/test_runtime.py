@@ -29,3 +29,75 @@ def test_call_api_with_user_option() -> None:
 
     assert result == "ok"
     api_method.assert_called_once_with(request, option)
+
+
+def test_call_api_uses_pinned_option_without_resolving() -> None:
+    from lark_oapi.core.model import RequestOption
+
+    from feishu_cli.runtime import pinned_request_option
+
+    api_method = MagicMock(return_value="ok")
+    option = RequestOption.builder().user_access_token("pinned").build()
+
+    with patch("feishu_cli.runtime.resolve_user_request_option") as resolve:
+        with pinned_request_option(option):
+            call_api(MagicMock(), api_method, "req")
+        resolve.assert_not_called()
+
+    passed = api_method.call_args[0][1]
+    assert passed.user_access_token == "pinned"
+    assert passed is not option
+
+
+def test_async_call_api_prefers_sdk_async_variant() -> None:
+    import asyncio
+
+    from feishu_cli.runtime import async_call_api
+
+    class Resource:
+        def list(self, request, option=None):
+            raise AssertionError("sync variant should not be used")
+
+        async def alist(self, request, option=None):
+            return ("async", request, option)
+
+    with patch("feishu_cli.runtime.resolve_user_request_option", return_value="opt"):
+        result = asyncio.run(async_call_api(MagicMock(), Resource().list, "req"))
+
+    assert result == ("async", "req", "opt")
+
+
+def test_call_api_many_bounds_concurrency_and_keeps_order() -> None:
+    import asyncio
+
+    from feishu_cli.runtime import call_api_many
+
+    state = {"in_flight": 0, "peak": 0}
+
+    class Resource:
+        def get(self, request):
+            raise AssertionError("sync variant should not be used")
+
+        async def aget(self, request):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01 * (5 - request % 5))
+            state["in_flight"] -= 1
+            return request * 10
+
+    resource = Resource()
+    with patch("feishu_cli.runtime.resolve_user_request_option", return_value=None):
+        results = call_api_many(MagicMock(), [(resource.get, i) for i in range(12)], concurrency=3)
+
+    assert results == [i * 10 for i in range(12)]
+    assert state["peak"] == 3
+
+
+def test_call_api_many_runs_sync_only_methods_in_threads() -> None:
+    from feishu_cli.runtime import call_api_many
+
+    api_method = MagicMock(side_effect=lambda request: request.upper())
+    with patch("feishu_cli.runtime.resolve_user_request_option", return_value=None):
+        results = call_api_many(MagicMock(), [(api_method, "a"), (api_method, "b")])
+
+    assert results == ["A", "B"]
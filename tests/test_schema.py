@@ -0,0 +1,65 @@
+"""Tests for cached field schemas and payload coercion."""
+
+import pytest
+
+from feishu_cli.schema import FieldSchema, SchemaCache, schema_ttl
+
+
+FIELDS = [
+    {"field_name": "标题", "type": 1},
+    {"field_name": "数量", "type": 2},
+    {"field_name": "状态", "type": 3, "property": {"options": [{"name": "进行中"}, {"name": "完成"}]}},
+    {"field_name": "标签", "type": 4, "property": {"options": [{"name": "a"}, {"name": "b"}]}},
+    {"field_name": "截止", "type": 5},
+    {"field_name": "完成", "type": 7},
+    {"field_name": "负责人", "type": 11},
+    {"field_name": "修改时间", "type": 1002},
+]
+
+
+def test_coerce_converts_csv_strings() -> None:
+    coerced, errors = FieldSchema(FIELDS).coerce(
+        {"标题": 12.0, "数量": "1,200", "状态": "完成", "标签": "a, b", "截止": "1700000000000", "完成": "yes", "负责人": "ou_1"}
+    )
+    assert errors == []
+    assert coerced == {
+        "标题": "12",
+        "数量": 1200,
+        "状态": "完成",
+        "标签": ["a", "b"],
+        "截止": 1700000000000,
+        "完成": True,
+        "负责人": [{"id": "ou_1"}],
+    }
+
+
+def test_coerce_reports_each_bad_field() -> None:
+    _coerced, errors = FieldSchema(FIELDS).coerce(
+        {"数量": "many", "状态": "搁置", "修改时间": 1, "备注": "x", "完成": "maybe"}
+    )
+    assert errors == [
+        "数量: expected a number, got 'many'",
+        "状态: unknown option(s): 搁置",
+        "修改时间: field is read-only",
+        "备注: unknown field",
+        "完成: expected a checkbox value, got 'maybe'",
+    ]
+
+
+def test_schema_cache_ttl_and_invalidate(tmp_path) -> None:
+    path = tmp_path / "schema.json"
+    cache = SchemaCache(path, ttl=60)
+    cache.set("app/tbl", FIELDS[:1])
+    assert SchemaCache(path, ttl=60).get("app/tbl") == FIELDS[:1]
+
+    SchemaCache(path, ttl=0).invalidate("app/tbl")
+    assert SchemaCache(path, ttl=60).get("app/tbl") is None
+    assert SchemaCache(path, ttl=0).get("app/tbl") is None
+
+
+def test_schema_ttl_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FEISHU_SCHEMA_TTL", "0")
+    assert schema_ttl() == 0
+    monkeypatch.setenv("FEISHU_SCHEMA_TTL", "-1")
+    with pytest.raises(ValueError):
+        schema_ttl()
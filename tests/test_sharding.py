@@ -0,0 +1,48 @@
+"""Tests for bitable export shard planning."""
+
+from datetime import datetime
+
+import pytest
+
+from feishu_cli.sharding import plan_shard_filters, sortable_value
+
+
+def test_number_shards_are_open_ended_ranges_plus_complement() -> None:
+    filters = plan_shard_filters("序号", 2, 0, 100, 4)
+    ref = "CurrentValue.[序号]"
+    ranges = [
+        f"{ref}<25",
+        f"AND({ref}>=25,{ref}<50)",
+        f"AND({ref}>=50,{ref}<75)",
+        f"{ref}>=75",
+    ]
+    assert filters == ranges + [f"NOT(OR({','.join(ranges)}))"]
+
+
+def test_single_value_range_collapses_to_one_shard() -> None:
+    assert plan_shard_filters("n", 2, 7, 7, 8) == [
+        "CurrentValue.[n]>=7",
+        "NOT(OR(CurrentValue.[n]>=7))",
+    ]
+
+
+def test_missing_bounds_give_one_unfiltered_shard() -> None:
+    assert plan_shard_filters("n", 2, None, None, 4) == [None]
+    assert plan_shard_filters("d", 5, None, None, 4) == [None]
+
+
+def test_date_shards_cut_on_day_boundaries() -> None:
+    lower = datetime(2024, 1, 1, 9, 30).timestamp() * 1000
+    upper = datetime(2024, 1, 10, 18, 0).timestamp() * 1000
+    filters = plan_shard_filters("创建时间", 1001, lower, upper, 2)
+    assert filters[0] == 'CurrentValue.[创建时间]<TODATE("2024-01-06")'
+    assert filters[1] == 'CurrentValue.[创建时间]>=TODATE("2024-01-06")'
+    assert filters[2].startswith("NOT(OR(")
+
+
+def test_unsupported_field_type_and_values() -> None:
+    with pytest.raises(ValueError):
+        plan_shard_filters("文本", 1, 0, 1, 2)
+    assert sortable_value("12.5") == 12.5
+    assert sortable_value(None) is None
+    assert sortable_value(True) is None
@@ -0,0 +1,69 @@
+"""Tests for keyed record sync planning."""
+
+from feishu_cli.bulk import Row
+from feishu_cli.sync import content_hash, index_records, key_text, plain_value, plan_sync
+
+
+def test_plain_value_normalises_list_api_shapes() -> None:
+    assert plain_value([{"text": "Hello ", "type": "text"}, {"text": "world", "type": "text"}]) == "Hello world"
+    assert plain_value([{"id": "ou_1", "name": "A"}]) == ["ou_1"]
+    assert plain_value(3.0) == plain_value("3") == "3"
+    assert plain_value({"link": "https://x", "text": "x"}) == "https://x"
+    assert plain_value("") is None and plain_value([]) is None
+
+
+def test_content_hash_ignores_key_blank_and_unmanaged_fields() -> None:
+    managed = {"Key", "Name"}
+    table = {"Key": "k", "Name": [{"text": "a", "type": "text"}], "Notes": "manual"}
+    assert content_hash(table, "Key", managed) == content_hash({"Key": "k", "Name": "a", "Empty": ""}, "Key", managed)
+    assert content_hash(table, "Key", managed) != content_hash({"Key": "k", "Name": "b"}, "Key", managed)
+
+
+def test_plan_sync_creates_updates_deletes_only_what_changed() -> None:
+    managed = {"Key", "Name"}
+    records = [
+        {"record_id": "rec1", "fields": {"Key": [{"text": "a", "type": "text"}], "Name": "same"}},
+        {"record_id": "rec2", "fields": {"Key": "b", "Name": "old"}},
+        {"record_id": "rec3", "fields": {"Key": "c", "Name": "gone"}},
+        {"record_id": "rec4", "fields": {"Key": "b", "Name": "dupe"}},
+        {"record_id": "rec5", "fields": {"Name": "no key"}},
+    ]
+    index, extras = index_records(records, "Key", managed)
+    incoming = {
+        key_text(fields["Key"]): Row(line, fields)
+        for line, fields in enumerate(
+            [{"Key": "a", "Name": "same"}, {"Key": "b", "Name": "new"}, {"Key": "d", "Name": "added"}], start=1
+        )
+    }
+
+    plan = plan_sync(incoming, index, extras, "Key", managed)
+
+    assert [row.value["Key"] for row in plan.creates] == ["d"]
+    assert [row.value for row in plan.updates] == [{"record_id": "rec2", "fields": {"Key": "b", "Name": "new"}}]
+    assert sorted(row.value for row in plan.deletes) == ["rec3", "rec4", "rec5"]
+    assert plan.unchanged == 1
+    assert plan_sync(incoming, index, extras, "Key", managed, delete=False).deletes == []
+
+
+def test_plan_sync_never_deletes_kept_keys() -> None:
+    managed = {"Key"}
+    index, extras = index_records(
+        [{"record_id": "rec1", "fields": {"Key": "a"}}, {"record_id": "rec2", "fields": {"Key": "b"}}], "Key", managed
+    )
+
+    plan = plan_sync({"a": Row(1, {"Key": "a"})}, index, extras, "Key", managed, keep={"b"})
+
+    assert plan.deletes == []
+
+
+def test_plan_sync_clears_managed_fields_a_row_leaves_out() -> None:
+    managed = {"Key", "Count"}
+    records = [{"record_id": "rec1", "fields": {"Key": "a", "Count": 5}}]
+    incoming = {"a": Row(1, {"Key": "a"})}
+
+    plan = plan_sync(incoming, *index_records(records, "Key", managed), "Key", managed)
+    assert [row.value for row in plan.updates] == [{"record_id": "rec1", "fields": {"Key": "a", "Count": None}}]
+
+    cleared = [{"record_id": "rec1", "fields": {"Key": "a"}}]
+    rerun = plan_sync(incoming, *index_records(cleared, "Key", managed), "Key", managed)
+    assert rerun.updates == [] and rerun.unchanged == 1
@@ -0,0 +1,54 @@
+"""Tests for the shared on-disk tenant token cache."""
+
+import json
+import stat
+import time
+from unittest.mock import MagicMock, patch
+
+from lark_oapi.core.token import TokenManager
+
+from feishu_cli.auth.tenant_cache import FileTokenCache, get_tenant_token_file_path
+from feishu_cli.client import _build_client
+from feishu_cli.config import FeishuConfig
+
+
+def test_tokens_are_shared_between_cache_instances() -> None:
+    expire = int(time.time()) + 3600
+    FileTokenCache().set("self_tenant_token:app_a", "t-a", expire)
+
+    other = FileTokenCache()
+    assert other.get("self_tenant_token:app_a") == "t-a"
+    assert other.get("self_tenant_token:app_b") is None
+
+
+def test_cache_file_is_private() -> None:
+    FileTokenCache().set("self_tenant_token:app", "t", int(time.time()) + 60)
+    mode = stat.S_IMODE(get_tenant_token_file_path().stat().st_mode)
+    assert mode == 0o600
+
+
+def test_expired_entries_are_ignored_and_pruned() -> None:
+    cache = FileTokenCache()
+    cache.set("self_tenant_token:old", "stale", int(time.time()) - 1)
+    assert FileTokenCache().get("self_tenant_token:old") is None
+
+    cache.set("self_tenant_token:new", "fresh", int(time.time()) + 60)
+    stored = json.loads(get_tenant_token_file_path().read_text(encoding="utf-8"))
+    assert set(stored) == {"self_tenant_token:new"}
+
+
+def test_corrupt_cache_file_is_a_miss() -> None:
+    path = get_tenant_token_file_path()
+    path.write_text("{not json", encoding="utf-8")
+    assert FileTokenCache().get("self_tenant_token:app") is None
+
+
+def test_client_reuses_cached_tenant_token() -> None:
+    _build_client(FeishuConfig(app_id="cli_test", app_secret="secret"))
+    assert isinstance(TokenManager.cache, FileTokenCache)
+
+    FileTokenCache().set("self_tenant_token:cli_test", "t-cached", int(time.time()) + 3600)
+    config = MagicMock(app_id="cli_test", client_assertion_provider=None)
+    with patch("lark_oapi.core.token.manager.Transport.execute") as execute:
+        assert TokenManager.get_self_tenant_token(config) == "t-cached"
+    execute.assert_not_called()
@@ -0,0 +1,138 @@
+"""Tests for the pooled lark_oapi HTTP transport."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from feishu_cli import transport as transport_mod
+from feishu_cli.main import app
+from feishu_cli.transport import PooledTransport, install_transport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"code": 0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_pooled_transport_reuses_connections() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    transport = PooledTransport(pool_size=2, connect_timeout=1, read_timeout=2)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+        for _ in range(5):
+            assert transport.request("GET", url, timeout=999).status_code == 200
+        stats = transport.stats()
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+
+
+class _CookieHandler(_KeepAliveHandler):
+    def end_headers(self) -> None:
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        super().end_headers()
+
+
+def test_pooled_transport_does_not_keep_cookies() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    transport = PooledTransport(pool_size=1, connect_timeout=1, read_timeout=2)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+        response = transport.request("GET", url)
+        assert response.headers["Set-Cookie"].startswith("session=")
+        assert len(transport._session.cookies) == 0
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_install_transport_replaces_sdk_requests_hook() -> None:
+    from lark_oapi.core.http import transport as lark_transport
+
+    first = install_transport(pool_size=3, connect_timeout=1, read_timeout=2)
+    assert lark_transport.requests is first
+    assert install_transport(pool_size=3, connect_timeout=1, read_timeout=2) is first
+    second = install_transport(pool_size=4, connect_timeout=1, read_timeout=2)
+    assert second is not first
+    assert lark_transport.requests is second
+
+
+@patch("feishu_cli.commands.docs.create_client")
+def test_debug_http_flag_reports_pool_stats(mock_cc: MagicMock, monkeypatch) -> None:
+    resp = MagicMock()
+    resp.success.return_value = True
+    resp.data = None
+    mock_cc.return_value.docs.v1.content.get.return_value = resp
+    monkeypatch.setattr(transport_mod, "_TRANSPORT", PooledTransport(pool_size=2))
+
+    result = CliRunner().invoke(app, ["--debug-http", "docs", "get", "--token", "doxXXX"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["success"] is True
+    stats = json.loads(result.stderr)["http_pool"]
+    assert stats["requests"] == 0
+    assert stats["pool_size"] == 2
+
+
+def test_sdk_async_path_shares_one_client_per_loop() -> None:
+    from lark_oapi.core.enum import HttpMethod
+    from lark_oapi.core.http import Transport
+    from lark_oapi.core.model import BaseRequest, Config
+
+    from feishu_cli.runtime import gather_limited, run_async
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    peers = set()
+    original = _KeepAliveHandler.do_GET
+
+    def record_peer(handler) -> None:
+        peers.add(handler.client_address)
+        original(handler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    transport = install_transport(pool_size=1, connect_timeout=1, read_timeout=2)
+    conf = Config()
+    conf.domain = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def make_request() -> BaseRequest:
+        req = BaseRequest()
+        req.http_method = HttpMethod.GET
+        req.uri = "/ping"
+        return req
+
+    try:
+        with patch.object(_KeepAliveHandler, "do_GET", record_peer):
+            statuses = run_async(gather_limited(
+                [lambda: Transport.aexecute(conf, make_request()) for _ in range(4)], concurrency=1
+            ))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [raw.status_code for raw in statuses] == [200] * 4
+    assert len(peers) == 1
+    assert transport.stats()["async_requests"] == 4
@@ -150,6 +150,27 @@ def test_wiki_node_list(mock_create_client: MagicMock) -> None:
     assert parsed["success"] is True
 
 
+@patch("feishu_cli.commands.wiki.create_client")
+def test_wiki_node_list_all_applies_select(mock_create_client: MagicMock) -> None:
+    """Test --select projection while streaming wiki nodes."""
+    from types import SimpleNamespace
+
+    mock_client = MagicMock()
+    mock_resp = MagicMock()
+    mock_resp.success.return_value = True
+    mock_resp.data = SimpleNamespace(
+        items=[{"node_token": "wik1", "title": "A", "obj_type": "docx"}], page_token=None, has_more=False
+    )
+    mock_client.wiki.v2.space_node.list.return_value = mock_resp
+    mock_create_client.return_value = mock_client
+
+    result = runner.invoke(wiki_app, ["node", "list", "--space", "spaceXXX", "--all", "--select", "node_token,title"])
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert parsed["data"]["items"] == [{"node_token": "wik1", "title": "A"}]
+
+
 @patch("feishu_cli.commands.wiki.create_client")
 def test_wiki_node_copy(mock_create_client: MagicMock) -> None:
     """Test copying a wiki node."""
@@ -278,3 +299,23 @@ def test_wiki_search(mock_create_client: MagicMock) -> None:
     assert result.exit_code == 0
     parsed = json.loads(result.stdout)
     assert parsed["success"] is True
+
+
+@patch("feishu_cli.commands.wiki.create_client")
+def test_wiki_member_list_limit_streams_members(mock_create_client: MagicMock) -> None:
+    """Test --limit pagination keeps the members key."""
+    from types import SimpleNamespace
+
+    mock_resp = MagicMock()
+    mock_resp.success.return_value = True
+    mock_resp.data = SimpleNamespace(members=[{"member_id": "u1"}, {"member_id": "u2"}], page_token="p", has_more=True)
+    mock_client = MagicMock()
+    mock_client.wiki.v2.space_member.list.return_value = mock_resp
+    mock_create_client.return_value = mock_client
+
+    result = runner.invoke(wiki_app, ["member", "list", "--space", "spaceXXX", "--limit", "1"])
+
+    assert result.exit_code == 0
+    parsed = json.loads(result.stdout)
+    assert parsed["data"]["members"] == [{"member_id": "u1"}]
+    assert parsed["data"]["has_more"] is True